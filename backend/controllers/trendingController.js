@@ -287,8 +287,10 @@ async function runTrendingRefresh() {
   for (const article of fresh) {
     try {
       // analyze article text to extract claims
+      // reference_date anchors "last year" / "this fiscal" to when the article was published
       const { data: analysis } = await nlp.post("/analyze", {
         text: article.content,
+        reference_date: article.published_at || undefined,
       });
 
       // pick claim with highest confidence
@@ -301,6 +303,7 @@ async function runTrendingRefresh() {
       // verify the extracted claim
       const { data: result } = await nlp.post("/verify", {
         text: top.sentence,
+        reference_date: article.published_at || undefined,
       });
 
       if (!["false", "misleading"].includes(result.verdict)) continue;
@@ -0,0 +1,10 @@
+"""
+benchmarks — throughput checks for the pure-CPU extraction hot path.
+
+Run from the nlp-service/ directory, e.g.:
+    python -m benchmarks                      # hot-path suite (hotpath.py)
+    python -m benchmarks --compare base.json  # ... failing on regressions
+    python -m benchmarks.bench_find_metric
+    python -m benchmarks.bench_score          # 1M sentences, reference vs single-pass scorer
+    python -m benchmarks.replay_fingerprint   # cache hit rates, text keys vs fingerprint
+"""
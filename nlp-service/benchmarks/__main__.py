@@ -0,0 +1,7 @@
+"""python -m benchmarks — runs the hot-path suite (see benchmarks/hotpath.py)."""
+
+import sys
+
+from benchmarks.hotpath import main
+
+sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+bench_find_metric.py — claims/sec for metrics.find_metric, before vs after
+
+Compares the original two-pass loop (metrics._find_metric_linear, one
+re.search per pattern) against the indexed matcher (metrics.find_metric)
+on a synthetic corpus of 100k sentences, and checks both agree on every one.
+
+--metrics N also grows the registry to N metrics with synthetic
+indicators (the real registry first, then made-up ones like "net rural
+freight index") and reports µs per claim at that size for:
+    linear       one re.search per pattern
+    alternation  every pattern in one regex (the matcher before metric_index.py)
+    index        metric_index.MetricIndex
+
+Run:
+    python -m benchmarks.bench_find_metric            # 100k sentences
+    python -m benchmarks.bench_find_metric --n 20000
+    python -m benchmarks.bench_find_metric --n 5000 --metrics 500
+"""
+
+import argparse
+import random
+import re
+import time
+
+from metric_index import MetricIndex
+from metrics import METRIC_PATTERNS, find_metric, _find_metric_linear
+
+# Sentence templates — a mix of strong matches, weak-only matches, sentences
+# with two metrics, and plain prose that matches nothing (worst case: every
+# pattern has to be ruled out).
+_TEMPLATES = [
+    "India's GDP growth rate was {v}% in {y}",
+    "Retail inflation fell to {v}% in {y}, the RBI said",
+    "The unemployment rate rose to {v} percent in {y}",
+    "Fiscal deficit was {v}% of GDP in FY{y}-25",
+    "India's literacy rate rose to {v}% in {y}",
+    "India's population crossed {v} billion in {y}",
+    "Per capita income reached {v} dollars in {y}",
+    "Poverty rate fell to {v}% in {y}",
+    "Forex reserves crossed ${v} billion in {y}",
+    "Current account deficit narrowed to {v}% of GDP in {y}",
+    "GDP numbers for {y} came in at {v} as inflation eased",
+    "The jobless figures worried economists in {y}",
+    "Officials said the deficit could reach {v} by {y}",
+    "The minister spoke at length about rural schemes in {y}",
+    "Markets closed higher today after a volatile session",
+    "The weather department forecast heavy rain over the weekend",
+    "Analysts expect the trade balance to improve by {y}",
+    "Cabinet approved a new policy on electric vehicles on Tuesday",
+]
+
+
+def build_corpus(n: int, seed: int = 42) -> list[str]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(n):
+        template = rng.choice(_TEMPLATES)
+        corpus.append(template.format(
+            v=round(rng.uniform(0.5, 12.0), 1),
+            y=rng.randint(1995, 2025),
+        ))
+    return corpus
+
+
+def _claims_per_sec(fn, corpus: list[str]) -> float:
+    start = time.perf_counter()
+    for sentence in corpus:
+        fn(sentence)
+    return len(corpus) / (time.perf_counter() - start)
+
+
+_SYNTH_WORDS = (
+    ["net", "gross", "rural", "urban", "public", "private", "household", "industrial", "coastal", "digital"],
+    ["freight", "steel", "cement", "rail", "fertiliser", "textile", "software", "pharma", "coal", "dairy"],
+    ["index", "output", "capacity", "exports", "imports", "subsidy", "demand", "tariff", "yield", "stock"],
+)
+
+
+def synthetic_metrics(n: int, seed: int = 7) -> list[dict]:
+    """The real registry, padded to *n* metrics with made-up three-word indicators."""
+    rng = random.Random(seed)
+    a, b, c = _SYNTH_WORDS
+    combos = [(x, y, z) for x in a for y in b for z in c]
+    rng.shuffle(combos)
+    metrics = [dict(m) for m in METRIC_PATTERNS]
+    for x, y, z in combos[:max(0, n - len(metrics))]:
+        metrics.append({
+            "name": f"{x} {y} {z}",
+            "strong": [rf"{x}\s+{y}\s+{z}", rf"{y}\s+{z}\s+\(?{x}\)?"],
+            "weak": [rf"\b{y}\s+{z}\b"],
+        })
+    return metrics
+
+
+def _ranked(metrics):
+    return [(p, (m["name"], tier)) for tier in ("strong", "weak") for m in metrics for p in m[tier]]
+
+
+def scaling(metrics: list[dict], corpus: list[str], repeat: int) -> None:
+    entries = _ranked(metrics)
+    compiled = [re.compile(p) for p, _ in entries]
+    alternation = re.compile("|".join(f"(?:{p})(?P<m{i}>)" for i, (p, _) in enumerate(entries)))
+    index = MetricIndex(entries)
+
+    def linear(text):
+        for i, regex in enumerate(compiled):
+            if regex.search(text):
+                return i
+        return None
+
+    def alternate(text):
+        best, pos = None, 0
+        while (match := alternation.search(text, pos)) is not None:
+            rank = int(match.lastgroup[1:])
+            best = rank if best is None else min(best, rank)
+            if best == 0:
+                break
+            pos = match.start() + 1
+        return best
+
+    lowered = [t.lower() for t in corpus]
+    mismatches = sum(1 for t in lowered if index.best(t) != linear(t))
+    if mismatches:
+        raise SystemExit(f"index disagrees with the linear scan on {mismatches} sentences")
+
+    print(f"\n{len(metrics)} metrics, {len(entries)} patterns, {len(corpus):,} sentences (results identical)")
+    for name, fn in (("linear", linear), ("alternation", alternate), ("index", index.best)):
+        per_claim = min(_seconds(fn, lowered) for _ in range(repeat)) / len(lowered)
+        print(f"  {name:<12} {per_claim * 1e6:>10.1f} µs/claim")
+
+
+def _seconds(fn, corpus) -> float:
+    start = time.perf_counter()
+    for sentence in corpus:
+        fn(sentence)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=100_000, help="corpus size (sentences)")
+    parser.add_argument("--repeat", type=int, default=3, help="best-of-N timing runs")
+    parser.add_argument("--metrics", type=int, help="also time every matcher at this many metrics")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.n)
+
+    mismatches = [s for s in corpus if find_metric(s) != _find_metric_linear(s)]
+    if mismatches:
+        raise SystemExit(f"find_metric disagrees with the reference on {len(mismatches)} sentences, e.g. {mismatches[0]!r}")
+
+    before = max(_claims_per_sec(_find_metric_linear, corpus) for _ in range(args.repeat))
+    after  = max(_claims_per_sec(find_metric, corpus) for _ in range(args.repeat))
+
+    print(f"corpus: {len(corpus):,} sentences (results identical)")
+    print(f"  before (two-pass loop):   {before:>12,.0f} claims/sec")
+    print(f"  after  (indexed):         {after:>12,.0f} claims/sec")
+    print(f"  speedup:                  {after / before:>12.2f}x")
+
+    if args.metrics:
+        metrics = synthetic_metrics(args.metrics)
+        a, b, c = _SYNTH_WORDS
+        rng = random.Random(1)
+        corpus = corpus + [
+            f"The {rng.choice(a)} {rng.choice(b)} {rng.choice(c)} rose {rng.randint(1, 9)}% in {rng.randint(2000, 2024)}"
+            for _ in range(len(corpus) // 2)
+        ]
+        scaling(metrics, corpus, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+bench_lexer.py — Regex passes and latency per paragraph, one shared lexer vs a scan per stage
+
+Runs what /analyze does to every sentence of a paragraph it hasn't seen —
+score it, and for likely claims extract_all() and extract_claims() — over
+long paragraphs built from the hot-path corpus (claims and article
+sentences, joined --sentences at a time), two ways:
+
+    per stage     every stage scans the text itself, as before lexer.py:
+                  the lex memo is off, so the scorer, extract_all() and
+                  extract_claims() each lex the sentence again, and
+                  extract_all() is extractor._extract_normalized_reference()
+    shared        lexer.lex() once per sentence, every stage reads it
+
+Checks both give identical results, then reports regex calls per sentence
+(every re.Pattern method call, counted with sys.setprofile) and best-of-N
+wall time per paragraph. Memos are cleared before each paragraph, so every
+sentence is new.
+
+Run:
+    python -m benchmarks.bench_lexer
+    python -m benchmarks.bench_lexer --sentences 200 --repeat 20
+"""
+
+import argparse
+import re
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+import lexer
+from benchmarks.hotpath import load_corpus
+from claim_detector import split_into_sentences, _score_sentence
+from extractor import _extract_normalized, _extract_normalized_reference, extract_claims, preprocess_claim
+from memo import clear_all
+
+_REGEX_METHODS = {"search", "match", "fullmatch", "finditer", "findall", "sub", "subn", "split"}
+
+
+def load_paragraphs(size: int) -> list[list[str]]:
+    corpus = load_corpus()
+    sentences = list(corpus["claims"])
+    for article in corpus["articles"]:
+        sentences.extend(split_into_sentences(article))
+    sentences = list(dict.fromkeys(sentences))
+    return [sentences[i:i + size] for i in range(0, len(sentences), size)]
+
+
+def analyze(sentences: list[str], extract) -> list:
+    """Score every sentence; extract the likely claims — /analyze minus the HTTP models."""
+    out = []
+    for sentence in sentences:
+        if _score_sentence(sentence) > 0.5:
+            out.append((extract(preprocess_claim(sentence)), extract_claims(sentence)))
+    return out
+
+
+@contextmanager
+def lex_memo_off():
+    maxsize = lexer._lex_memo.maxsize
+    lexer._lex_memo.maxsize = 0
+    try:
+        yield
+    finally:
+        lexer._lex_memo.maxsize = maxsize
+
+
+def regex_calls(paragraphs: list[list[str]], extract) -> int:
+    calls = 0
+
+    def count(frame, event, arg):
+        nonlocal calls
+        if (event == "c_call" and getattr(arg, "__name__", None) in _REGEX_METHODS
+                and isinstance(getattr(arg, "__self__", None), re.Pattern)):
+            calls += 1
+
+    for paragraph in paragraphs:
+        clear_all()
+        sys.setprofile(count)
+        try:
+            analyze(paragraph, extract)
+        finally:
+            sys.setprofile(None)
+    return calls
+
+
+def seconds_per_paragraph(paragraphs: list[list[str]], extract, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        total = 0.0
+        for paragraph in paragraphs:
+            clear_all()
+            start = time.perf_counter()
+            analyze(paragraph, extract)
+            total += time.perf_counter() - start
+        best = min(best, total)
+    return best / len(paragraphs)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sentences", type=int, default=100, help="sentences per paragraph")
+    parser.add_argument("--repeat", type=int, default=10, help="best-of-N timing runs")
+    args = parser.parse_args(argv)
+
+    paragraphs = load_paragraphs(args.sentences)
+    n = sum(map(len, paragraphs))
+    for paragraph in paragraphs:
+        clear_all()
+        with lex_memo_off():
+            before = analyze(paragraph, _extract_normalized_reference)
+        clear_all()
+        if analyze(paragraph, _extract_normalized) != before:
+            raise SystemExit("the shared lexer disagrees with the per-stage scans")
+    # (that also compiled every metric pattern the corpus needs, outside the timings)
+
+    print(f"{len(paragraphs)} paragraphs, {n} sentences (results identical)")
+    print(f"  {'':<14}{'regex calls/sentence':>22}{'us/paragraph':>15}{'us/sentence':>14}")
+    results = {}
+    for label, extract, memo_off in (("per stage", _extract_normalized_reference, True),
+                                     ("shared", _extract_normalized, False)):
+        with lex_memo_off() if memo_off else nullcontext():
+            calls = regex_calls(paragraphs, extract)
+            seconds = seconds_per_paragraph(paragraphs, extract, args.repeat)
+        results[label] = (calls, seconds)
+        print(f"  {label:<14}{calls / n:>22.1f}{seconds * 1e6:>15,.0f}{seconds * 1e6 * len(paragraphs) / n:>14.1f}")
+    (calls_before, before), (calls_after, after) = results["per stage"], results["shared"]
+    print(f"  {calls_before / calls_after:.2f}x fewer regex calls, {before / after:.2f}x faster")
+
+
+if __name__ == "__main__":
+    main()
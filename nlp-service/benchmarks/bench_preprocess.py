@@ -0,0 +1,91 @@
+"""
+bench_preprocess.py — ns/call for extractor.preprocess_claim, before vs after
+
+Replays a set of realistic scraped headlines — mostly clean ASCII, some with
+HTML entities, inline tags, non-breaking spaces, zero-width joiners and
+newline-wrapped text from RSS feeds — through the original six-pass
+preprocess_claim (extractor._preprocess_claim_reference) and the fast-path
+version, and checks both produce the same text.
+
+Also times the /verify double call (endpoint, then extract_all) where the
+second call hits the NormalizedText marker.
+
+Run:
+    python -m benchmarks.bench_preprocess
+"""
+
+import argparse
+import time
+
+from extractor import preprocess_claim, _preprocess_claim_reference
+
+HEADLINES = [
+    # clean ASCII — the common case
+    "India's GDP growth rate stood at 7.5 percent in 2024",
+    "Retail inflation eases to 4.8% in January, lowest in three months",
+    "RBI keeps repo rate unchanged at 6.5% for the sixth straight time",
+    "Forex reserves hit record $704 billion, up $12.6 billion in a week",
+    "Unemployment rate in urban areas falls to 6.7% in Q3: PLFS",
+    "Fiscal deficit at 55% of full-year target at end of December",
+    "Centre's capex push lifts core sector growth to 7.8% in November",
+    "Current account deficit narrows to 1.1% of GDP in Q2 FY25",
+    "Per capita income to cross Rs 2 lakh in FY25, says NSO estimate",
+    "Exports rise 3% to $38 billion in October; trade deficit at $27 bn",
+    # scraped with entities / tags / feed noise
+    "India&#8217;s GDP growth rate stood at 7.5 percent in 2024",
+    "Retail inflation eases to 4.8% in January &amp; food prices cool",
+    "<b>Breaking:</b> RBI keeps repo rate unchanged at 6.5%",
+    "Forex reserves hit record $704&nbsp;billion, up $12.6 billion",
+    "Unemployment rate in urban areas falls to 6.7%\nin Q3: PLFS",
+    "  Fiscal deficit at 55% of full-year target  ",
+    "Per capita income to cross ₹2 lakh in FY25​, says NSO",
+    "Exports rise 3% to $38 billion in October; trade deficit at $27 bn",
+    "<p>Current account deficit <em>narrows</em> to 1.1% of GDP</p>",
+    "Café chains report 12% jump in\tsales as inflation cools",
+]
+
+
+def _ns_per_call(fn, corpus: list[str]) -> float:
+    start = time.perf_counter_ns()
+    for text in corpus:
+        fn(text)
+    return (time.perf_counter_ns() - start) / len(corpus)
+
+
+def _verify_path_old(text: str) -> str:
+    return _preprocess_claim_reference(_preprocess_claim_reference(text))
+
+
+def _verify_path_new(text: str) -> str:
+    return preprocess_claim(preprocess_claim(text))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=200_000, help="calls per measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="best-of-N timing runs")
+    args = parser.parse_args()
+
+    for text in HEADLINES:
+        if preprocess_claim(text) != _preprocess_claim_reference(text):
+            raise SystemExit(f"preprocess_claim disagrees with the reference on {text!r}")
+
+    corpus = (HEADLINES * (args.n // len(HEADLINES) + 1))[:args.n]
+    clean = [h for h in HEADLINES if h.isascii() and preprocess_claim(h) == h]
+    clean_corpus = (clean * (args.n // len(clean) + 1))[:args.n]
+
+    rows = [
+        ("all headlines", corpus, _preprocess_claim_reference, preprocess_claim),
+        ("clean ASCII only", clean_corpus, _preprocess_claim_reference, preprocess_claim),
+        ("/verify double call", corpus, _verify_path_old, _verify_path_new),
+    ]
+    print(f"{len(HEADLINES)} headlines ({len(clean)} already clean), {args.n:,} calls per row (results identical)")
+    print(f"  {'case':<22}{'before ns/call':>16}{'after ns/call':>16}{'speedup':>10}")
+    for label, data, old, new in rows:
+        before = min(_ns_per_call(old, data) for _ in range(args.repeat))
+        after  = min(_ns_per_call(new, data) for _ in range(args.repeat))
+        print(f"  {label:<22}{before:>16,.0f}{after:>16,.0f}{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+bench_score.py — Sentences/second for score_claim_probability, before vs after
+
+Scores 1,000,000 sentences (by default) — the hot-path corpus claims plus
+every sentence split out of its articles, repeated — with the original
+signal-by-signal scorer (claim_detector._score_sentence_reference) and the
+single-pass signal scanner (claim_detector._score_lexed), and checks
+every score is identical. Both are timed without the memos, as /analyze
+sees them on sentences it hasn't scored before.
+
+Then the same corpus through score_claims_batch in --batch sized chunks,
+twice: as replayed (the corpus sentences repeat, and a batch scans each
+distinct sentence once) and with every sentence made unique by a suffix —
+the worst case for bulk ingestion.
+
+Run:
+    python -m benchmarks.bench_score
+    python -m benchmarks.bench_score --n 100000 --repeat 3 --batch 2000
+"""
+
+import argparse
+import time
+
+from benchmarks.hotpath import load_corpus
+from claim_detector import split_into_sentences, score_claims_batch, _score_lexed, _score_sentence_reference
+from lexer import Lexed
+
+
+def load_sentences() -> list[str]:
+    corpus = load_corpus()
+    sentences = list(corpus["claims"])
+    for article in corpus["articles"]:
+        sentences.extend(split_into_sentences(article))
+    return sentences
+
+
+def _score_sentence(sentence: str) -> float:
+    """The scanner's score, without the lex memo."""
+    return _score_lexed(Lexed(sentence))
+
+
+def _seconds(fn, corpus: list[str]) -> float:
+    start = time.perf_counter()
+    for sentence in corpus:
+        fn(sentence)
+    return time.perf_counter() - start
+
+
+def _batch_seconds(corpus: list[str], size: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(corpus), size):
+        score_claims_batch(corpus[i:i + size])
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=1_000_000, help="sentences per measurement")
+    parser.add_argument("--repeat", type=int, default=1, help="best-of-N timing runs")
+    parser.add_argument("--batch", type=int, default=5000, help="sentences per score_claims_batch call")
+    args = parser.parse_args(argv)
+
+    sentences = load_sentences()
+    for sentence in sentences:
+        if _score_sentence(sentence) != _score_sentence_reference(sentence):
+            raise SystemExit(f"scanner disagrees with the reference on {sentence!r}")
+
+    corpus = (sentences * (args.n // len(sentences) + 1))[:args.n]
+    print(f"{len(sentences)} distinct sentences, {args.n:,} scored per run (scores identical)")
+    print(f"  {'scorer':<24}{'total s':>10}{'ns/sentence':>14}{'sentences/s':>14}")
+    results = {}
+    for label, fn in (("reference", _score_sentence_reference), ("single-pass scanner", _score_sentence)):
+        seconds = min(_seconds(fn, corpus) for _ in range(args.repeat))
+        results[label] = seconds
+        print(f"  {label:<24}{seconds:>10.2f}{seconds / args.n * 1e9:>14,.0f}{args.n / seconds:>14,.0f}")
+    print(f"  speedup {results['reference'] / results['single-pass scanner']:.2f}x")
+
+    distinct = [f"{sentence} [{i}]" for i, sentence in enumerate(corpus)]
+    sample = distinct[:args.batch]
+    if score_claims_batch(sample).tolist() != [_score_sentence(s) for s in sample]:
+        raise SystemExit("score_claims_batch disagrees with the scalar scorer")
+    print(f"\n  score_claims_batch, {args.batch:,} sentences per call (scores identical)")
+    for label, data in (("as replayed", corpus), ("all distinct", distinct)):
+        scalar = min(_seconds(_score_sentence, data) for _ in range(args.repeat))
+        batch = min(_batch_seconds(data, args.batch) for _ in range(args.repeat))
+        print(f"  {label:<24}{'scalar':>8}{scalar / args.n * 1e9:>9,.0f} ns"
+              f"{'batch':>8}{batch / args.n * 1e9:>9,.0f} ns{scalar / batch:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+hotpath.py — ns/op and allocations for the pure-CPU extraction hot path, with a regression gate
+
+Times every function /analyze and /extract run per sentence —
+
+    preprocess_claim, find_metric, extract_value, extract_year,
+    split_into_sentences, score_claim_probability
+
+— over the checked-in corpus (benchmarks/data/hotpath_corpus.json):
+
+    claims       short headline claims (clean, scraped, multi-value, non-claims)
+    articles     long news articles, as /analyze receives them
+    adversarial  pathological inputs (digit runs, unclosed tags, abbreviation
+                 and sentence storms, ...) — where a backtracking regex hurts
+
+For each function × corpus section it reports:
+    ns/op   best-of-N wall time per call (loops auto-calibrated to --min-time)
+    B/op    peak bytes allocated while one call runs (tracemalloc), averaged
+
+score_claim_probability is timed WITHOUT its memos (claim_detector._score_lexed
+on a fresh lexer.Lexed): otherwise every loop after the first would only
+measure a dict lookup.
+
+REGRESSION GATE:
+    --save FILE       write the results as JSON (keep one from main as the baseline)
+    --compare FILE    compare against a saved baseline; exit 1 if any row's ns/op
+                      got worse by more than --threshold percent (default 10)
+    --input FILE      compare a saved result instead of running the suite
+
+Run:
+    python -m benchmarks.hotpath
+    python -m benchmarks.hotpath --save baseline.json
+    python -m benchmarks.hotpath --compare baseline.json --threshold 15
+    python -m benchmarks.hotpath --only find_metric extract_value --sections claims
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from claim_detector import split_into_sentences, _score_lexed
+from extractor import preprocess_claim, extract_value, extract_year
+from lexer import Lexed
+from metrics import find_metric
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "data", "hotpath_corpus.json")
+SECTIONS = ("claims", "articles", "adversarial")
+
+FUNCTIONS = {
+    "preprocess_claim":        preprocess_claim,
+    "find_metric":             find_metric,
+    "extract_value":           extract_value,
+    "extract_year":            extract_year,
+    "split_into_sentences":    split_into_sentences,
+    "score_claim_probability": lambda sentence: _score_lexed(Lexed(sentence)),   # uncached — see module docstring
+}
+
+
+def load_corpus(path: str = DEFAULT_CORPUS) -> dict[str, list[str]]:
+    """Corpus sections as lists of strings; adversarial specs are expanded here."""
+    with open(path, encoding="utf-8") as f:
+        doc = json.load(f)
+    corpus = {"claims": list(doc["claims"]), "articles": list(doc["articles"])}
+    corpus["adversarial"] = [
+        spec.get("prefix", "") + spec["repeat"] * spec["times"] + spec.get("suffix", "")
+        for spec in doc["adversarial"]
+    ]
+    return corpus
+
+
+def _run(fn, inputs: list[str], loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        for text in inputs:
+            fn(text)
+    return time.perf_counter() - start
+
+
+def ns_per_op(fn, inputs: list[str], *, min_time: float, repeat: int) -> float:
+    """Best-of-*repeat* ns per call, each run looping until it lasts >= *min_time* seconds."""
+    loops = 1
+    elapsed = _run(fn, inputs, loops)            # also the warm-up run
+    while elapsed < min_time:
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+        elapsed = _run(fn, inputs, loops)
+    best = min([elapsed] + [_run(fn, inputs, loops) for _ in range(repeat - 1)])
+    return best / (loops * len(inputs)) * 1e9
+
+
+def bytes_per_op(fn, inputs: list[str]) -> float:
+    """Average peak bytes allocated during one call."""
+    total = 0
+    tracemalloc.start()
+    try:
+        for text in inputs:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            fn(text)
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - before
+    finally:
+        tracemalloc.stop()
+    return total / len(inputs)
+
+
+def run_suite(corpus, functions, sections, *, min_time: float, repeat: int) -> dict:
+    results = {}
+    for name in functions:
+        fn = FUNCTIONS[name]
+        for section in sections:
+            inputs = corpus[section]
+            if not inputs:
+                continue
+            results[f"{name}/{section}"] = {
+                "ns_per_op": round(ns_per_op(fn, inputs, min_time=min_time, repeat=repeat), 1),
+                "bytes_per_op": round(bytes_per_op(fn, inputs)),
+                "inputs": len(inputs),
+            }
+    return {
+        "python": platform.python_version(),
+        "implementation": sys.implementation.name,
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """Print old vs new for every shared row; return the rows that regressed past *threshold* %."""
+    regressions = []
+    old_rows, new_rows = baseline["results"], current["results"]
+    print(f"  {'benchmark':<38}{'base ns/op':>13}{'new ns/op':>13}{'Δ time':>9}{'Δ B/op':>9}")
+    for key, new in new_rows.items():
+        old = old_rows.get(key)
+        if old is None:
+            print(f"  {key:<38}{'—':>13}{new['ns_per_op']:>13,.0f}{'new':>9}")
+            continue
+        change = (new["ns_per_op"] / old["ns_per_op"] - 1) * 100 if old["ns_per_op"] else 0.0
+        alloc = (new["bytes_per_op"] / old["bytes_per_op"] - 1) * 100 if old["bytes_per_op"] else 0.0
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"  {key:<38}{old['ns_per_op']:>13,.0f}{new['ns_per_op']:>13,.0f}"
+              f"{change:>+8.1f}%{alloc:>+8.1f}%{flag}")
+        if flag:
+            regressions.append(key)
+    if baseline.get("python") != current.get("python"):
+        print(f"  note: baseline ran on Python {baseline.get('python')}, this on {current.get('python')}")
+    return regressions
+
+
+def print_table(current: dict) -> None:
+    print(f"Python {current['python']} ({current['implementation']}, {current['machine']})")
+    print(f"  {'benchmark':<38}{'ns/op':>13}{'B/op':>11}{'inputs':>8}")
+    for key, row in current["results"].items():
+        print(f"  {key:<38}{row['ns_per_op']:>13,.0f}{row['bytes_per_op']:>11,}{row['inputs']:>8}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="corpus JSON (default: checked-in corpus)")
+    parser.add_argument("--only", nargs="+", choices=list(FUNCTIONS), default=list(FUNCTIONS),
+                        help="functions to run")
+    parser.add_argument("--sections", nargs="+", choices=SECTIONS, default=list(SECTIONS),
+                        help="corpus sections to run")
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="best-of-N timing runs")
+    parser.add_argument("--save", metavar="FILE", help="write results JSON")
+    parser.add_argument("--compare", metavar="FILE", help="baseline results JSON to gate against")
+    parser.add_argument("--input", metavar="FILE", help="use saved results instead of running")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="max allowed ns/op slowdown in percent (default 10)")
+    args = parser.parse_args(argv)
+
+    if args.input:
+        with open(args.input, encoding="utf-8") as f:
+            current = json.load(f)
+    else:
+        corpus = load_corpus(args.corpus)
+        current = run_suite(corpus, args.only, args.sections, min_time=args.min_time, repeat=args.repeat)
+        print_table(current)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+            f.write("\n")
+        print(f"saved → {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\nvs {args.compare} (threshold +{args.threshold:g}%)")
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}")
+            return 1
+        print("\nno regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
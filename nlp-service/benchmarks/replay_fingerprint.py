@@ -0,0 +1,122 @@
+"""
+replay_fingerprint.py — Cache hit rates with text keys vs the claim fingerprint
+
+Replays a traffic log (default: benchmarks/data/replay_traffic.jsonl —
+the same claims re-worded the way different outlets and users write them)
+through Layer 1 the way route_verification() does, and counts hits for
+the three verification caches under both keying schemes:
+
+    router     old: MD5(text) + reference date      new: fingerprint + confidence
+    evidence   old: "metric year str(value) India"  new: fingerprint.search_key
+    nli        old: no cache                        new: (fingerprint, snippet)
+
+Offline: nothing is fetched. Every router miss is assumed to reach Tier 2
+(the worst case — a decisive Tier 1 never looks up evidence) and every
+evidence search to return --snippets snippets, the same ones for the same
+search. Evidence and NLI lookups only happen on router misses, so the
+column that matters for quota is "calls" (misses = external requests /
+model runs), not the per-cache hit rate.
+
+Run:
+    python -m benchmarks.replay_fingerprint
+    python -m benchmarks.replay_fingerprint --traffic benchmarks/data/replay_claims.jsonl
+    python -m benchmarks.replay_fingerprint --show
+"""
+
+import argparse
+import hashlib
+import os
+
+from benchmarks.replay_tier1 import load_claims
+from extractor import extract_all, extract_trend
+from fingerprint import claim_fingerprint
+from memo import clear_all
+from periods import as_reference_date
+
+DEFAULT_TRAFFIC = os.path.join(os.path.dirname(__file__), "data", "replay_traffic.jsonl")
+
+
+class _Counter:
+    def __init__(self):
+        self.seen: set = set()
+        self.hits = self.lookups = 0
+
+    def lookup(self, key) -> bool:
+        self.lookups += 1
+        if key in self.seen:
+            self.hits += 1
+            return True
+        self.seen.add(key)
+        return False
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+def _layer1(text: str, ref):
+    """(metric, value, year, confidence, fingerprint) as route_verification() sees them."""
+    extraction, trend = extract_all(text, ref), extract_trend(text, ref)
+    metric, value, year, conf = extraction["metric"], extraction["value"], extraction["year"], extraction["confidence"]
+    if trend is not None:
+        metric = trend["metric"]
+        value = trend["end_value"] if trend["kind"] == "range" else trend["change"]
+        year, conf = trend["end_year"], trend["confidence"]
+    return metric, value, year, conf, claim_fingerprint(extraction, text, trend)
+
+
+def _evidence_query(metric, year, value) -> str:
+    """The query fetch_evidence() builds — and used to key its cache on."""
+    parts = [p for p in (metric, str(year) if year else None) if p]
+    if value is not None:
+        parts.append(str(value))
+    return " ".join(parts + ["India"])
+
+
+def replay(traffic, snippets: int = 3, show: bool = False) -> dict:
+    clear_all()
+    old = {"router": _Counter(), "evidence": _Counter(), "nli": _Counter()}
+    new = {"router": _Counter(), "evidence": _Counter(), "nli": _Counter()}
+
+    for text, published in traffic:
+        ref = as_reference_date(published)
+        metric, value, year, conf, fp = _layer1(text, ref)
+        if show:
+            print(f"  {fp.key if fp else '(no fingerprint)':<60} {text[:70]}")
+
+        # Old scheme: text-keyed router cache, query-keyed evidence, no NLI cache
+        if not old["router"].lookup((hashlib.md5(text.encode()).hexdigest(), ref)):
+            query = _evidence_query(metric, year, value)
+            old["evidence"].lookup(query)
+            old["nli"].lookups += snippets
+
+        # New scheme: everything keyed on the fingerprint (text when there is none)
+        router_key = (fp.key, conf) if fp else (hashlib.md5(text.encode()).hexdigest(), ref)
+        if not new["router"].lookup(router_key):
+            search_key = fp.search_key if fp else _evidence_query(metric, year, value)
+            new["evidence"].lookup(search_key)
+            for i in range(snippets):
+                new["nli"].lookup((fp.key if fp else text, search_key, i))
+
+    return {"requests": len(traffic), "old": old, "new": new}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--traffic", default=DEFAULT_TRAFFIC, help="JSONL of {text, published_at}")
+    parser.add_argument("--snippets", type=int, default=3, help="evidence snippets per search (default 3)")
+    parser.add_argument("--show", action="store_true", help="print each request's fingerprint")
+    args = parser.parse_args(argv)
+
+    report = replay(load_claims(args.traffic), snippets=args.snippets, show=args.show)
+    print(f"{report['requests']} requests from {args.traffic}")
+    print(f"  {'cache':<10}{'text-key hits':>20}{'fingerprint hits':>22}{'calls':>16}")
+    for cache in ("router", "evidence", "nli"):
+        o, n = report["old"][cache], report["new"][cache]
+        print(f"  {cache:<10}{o.hits:>5}/{o.lookups:<5}{o.hit_rate:>9.1%}"
+              f"{n.hits:>7}/{n.lookups:<5}{n.hit_rate:>9.1%}"
+              f"{o.lookups - o.hits:>8} → {n.lookups - n.hits:<5}")
+
+
+if __name__ == "__main__":
+    main()
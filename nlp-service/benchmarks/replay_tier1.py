@@ -0,0 +1,155 @@
+"""
+replay_tier1.py — How many claims can Tier 1 decide, with and without period resolution
+
+Replays benchmarks/data/replay_claims.jsonl (headline claims with their
+article published_at) through Layer 1 the way route_verification() does,
+twice: once with relative/abbreviated periods disabled (the old
+extract_year), once with them resolved against published_at (periods.py).
+
+Offline (default) it reports the Tier 1-ELIGIBLE ratio: metric + value +
+year extracted with confidence >= TIER1_STRONG_THRESHOLD. That is the
+upper bound on the fast path — a claim that isn't eligible always pays for
+Tier 2. With --live it also fetches World Bank data and reports the
+Tier 1-DECISIVE ratio (eligible AND error < 5% or >= 20%).
+
+Run:
+    python -m benchmarks.replay_tier1
+    python -m benchmarks.replay_tier1 --live
+    python -m benchmarks.replay_tier1 --claims my_claims.jsonl --show
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from unittest.mock import patch
+
+import extractor
+from memo import clear_all
+from verifier.tier1_numeric import tier1_numeric_check, tier1_trend_check
+from verifier.verdict_router import (
+    TIER1_STRONG_THRESHOLD,
+    TIER1_ERROR_CLEAR_LOW,
+    TIER1_ERROR_CLEAR_HIGH,
+)
+
+DEFAULT_CLAIMS = os.path.join(os.path.dirname(__file__), "data", "replay_claims.jsonl")
+
+
+def load_claims(path: str) -> list[tuple[str, datetime | None]]:
+    claims = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            published = row.get("published_at")
+            if published:
+                published = datetime.fromisoformat(published.replace("Z", "+00:00"))
+            claims.append((row["text"], published))
+    return claims
+
+
+@contextmanager
+def periods_disabled():
+    """Layer 1 as it was before periods.py: explicit years only."""
+    with patch("extractor.resolve_period", return_value=None), \
+         patch("extractor.find_periods", return_value=[]):
+        clear_all()
+        yield
+    clear_all()
+
+
+def layer1(text: str, published: datetime | None) -> dict:
+    """metric / value / year / confidence exactly as route_verification() sees them."""
+    extraction = extractor.extract_all(text, published)
+    trend = extractor.extract_trend(text, published)
+    if trend is not None:
+        return {
+            "metric": trend["metric"],
+            "value": trend["end_value"] if trend["kind"] == "range" else trend["change"],
+            "year": trend["end_year"],
+            "country": trend["country"],
+            "confidence": trend["confidence"],
+            "trend": trend,
+        }
+    return {**extraction, "trend": None}
+
+
+def eligible(fields: dict) -> bool:
+    return (
+        fields["metric"] is not None
+        and fields["value"] is not None
+        and fields["year"] is not None
+        and fields["confidence"] >= TIER1_STRONG_THRESHOLD
+    )
+
+
+async def decisive(fields: dict) -> bool:
+    """Same rule as route_verification()'s tier1_decisive, against live World Bank data."""
+    if not eligible(fields):
+        return False
+    trend = fields["trend"]
+    if trend is not None:
+        check = await tier1_trend_check(
+            metric=trend["metric"], start_year=trend["start_year"], end_year=trend["end_year"],
+            start_value=trend["start_value"], end_value=trend["end_value"],
+            change=trend["change"], change_unit=trend["change_unit"], country=trend["country"],
+        )
+        error = check.percentage_error
+    else:
+        check = await tier1_numeric_check(
+            metric=fields["metric"], claimed_value=fields["value"],
+            year=fields["year"], country=fields["country"],
+        )
+        error = check.percentage_error if check.official_value is not None else None
+    return error is not None and (error < TIER1_ERROR_CLEAR_LOW or error >= TIER1_ERROR_CLEAR_HIGH)
+
+
+def replay(claims, live: bool) -> dict:
+    fields = [layer1(text, published) for text, published in claims]
+    result = {
+        "fields": fields,
+        "eligible": sum(eligible(f) for f in fields),
+        "with_year": sum(f["year"] is not None for f in fields),
+    }
+    if live:
+        async def run():
+            return await asyncio.gather(*(decisive(f) for f in fields))
+        result["decisive"] = sum(asyncio.run(run()))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--claims", default=DEFAULT_CLAIMS, help="JSONL of {text, published_at}")
+    parser.add_argument("--live", action="store_true", help="also fetch World Bank data (network)")
+    parser.add_argument("--show", action="store_true", help="list claims whose year changed")
+    args = parser.parse_args()
+
+    claims = load_claims(args.claims)
+    with periods_disabled():
+        before = replay(claims, args.live)
+    after = replay(claims, args.live)
+
+    n = len(claims)
+    pct = lambda k: f"{k:>4} / {n}  ({k / n:6.1%})"
+    print(f"claims replayed: {n}")
+    print(f"{'':24}{'before':>22}{'after':>22}")
+    print(f"{'year resolved':24}{pct(before['with_year']):>22}{pct(after['with_year']):>22}")
+    print(f"{'Tier 1-eligible':24}{pct(before['eligible']):>22}{pct(after['eligible']):>22}")
+    if args.live:
+        print(f"{'Tier 1-decisive':24}{pct(before['decisive']):>22}{pct(after['decisive']):>22}")
+
+    if args.show:
+        print()
+        for (text, published), old, new in zip(claims, before["fields"], after["fields"]):
+            if old["year"] != new["year"]:
+                day = published.date() if published else "today"
+                print(f"  [{day}] {text!r}: year {old['year']} → {new['year']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+claim_classifier.py — Optional learned second opinion on "is this a claim?"
+
+Answers: "The heuristic says this sentence is a claim — is it worth verifying?"
+Example:
+    Sentence:   "Analysts expect Beijing to set a growth target of about 5% again for 2024"
+    Heuristic:  0.80  (number + year + metric + verb)  → would be verified
+    Classifier: 0.04  (a forecast, not a checkable figure) → dropped
+
+WHY?
+  score_claim_probability() adds up hand-tuned weights for five signals, so
+  forecasts, policy announcements and market chatter that happen to name a
+  metric and a year score as claims. Every one of them then costs a World
+  Bank call, a NewsAPI call and an NLI pass downstream. A linear model over
+  the sentence's words learns what those near-misses look like.
+
+HOW?
+  1. FEATURES — per sentence:
+       - the five heuristic signal flags (number, year, metric, verb,
+         subject) and a word-count bin, as dense 0/1 columns
+       - every word and word pair, numbers folded to <num> / <year> / <pct>,
+         HASHED (crc32) into a fixed number of buckets with a ±1 sign — no
+         vocabulary to ship, unseen words just land in some bucket
+  2. MODEL — logistic regression: one weight per column plus a bias, trained
+     offline with full-batch gradient descent (`python -m claim_classifier
+     train ...`). The weights are one float32 vector saved as a .npy file
+     (16 KB at 4,096 buckets).
+  3. INFERENCE — pure numpy: dense @ w, plus np.bincount over the hashed
+     (row, bucket, sign) triples, then a sigmoid. Batched over every
+     candidate sentence of a request.
+
+It is a FILTER, not a replacement: /analyze still decides candidates with the
+heuristic, and when CLAIM_CLASSIFIER=1 drops those the classifier scores
+below CLAIM_CLASSIFIER_THRESHOLD. Off by default.
+
+Training data (JSON lines, one sentence per line):
+    {"text": "...", "label": 1}               1 = checkable claim, 0 = not
+    {"text": "...", "verdict": "false"}       rows exported from the claims
+                                              table: 'unverifiable' → 0,
+                                              any other verdict → 1
+
+Run:
+    python -m claim_classifier train data/claim_labels.jsonl --out data/claim_classifier.npy
+    python -m claim_classifier evaluate data/claim_labels.jsonl
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import zlib
+from functools import lru_cache
+
+from claim_detector import _sentence_features, score_claim_probability
+
+logger = logging.getLogger("bware.nlp")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+WEIGHTS_PATH = os.getenv("CLAIM_CLASSIFIER_WEIGHTS", os.path.join(DATA_DIR, "claim_classifier.npy"))
+CLASSIFIER_ENABLED = os.getenv("CLAIM_CLASSIFIER", "0") == "1"
+CLASSIFIER_THRESHOLD = float(os.getenv("CLAIM_CLASSIFIER_THRESHOLD", "0.5"))
+
+DEFAULT_BUCKETS = 4096
+
+# Dense columns: five signal flags (bit order of claim_detector) + word-count bins
+_SIGNAL_BITS = 5
+_LENGTH_BINS = (3, 8, 51)        # <3, 3-7, 8-50, 51+ words
+_DENSE = _SIGNAL_BITS + len(_LENGTH_BINS) + 1
+_OFFSET = 1 + _DENSE             # weights: [bias, dense..., hashed buckets...]
+
+_RE_TOKEN = re.compile(r"\d+(?:,\d+)*(?:\.\d+)?\s?%?|[a-z]+(?:'[a-z]+)?")
+_RE_YEAR_TOKEN = re.compile(r"(?:19|20)\d{2}")
+
+# Verdicts of the claims table (database/schema.sql) → label
+_VERDICT_LABELS = {"accurate": 1, "misleading": 1, "false": 1, "unverifiable": 0}
+
+
+# =============================================================================
+# FEATURES
+# =============================================================================
+
+def _tokens(sentence):
+    """Lowercase words, with every number folded to <year>, <pct> or <num>."""
+    tokens = []
+    for token in _RE_TOKEN.findall(sentence.lower()):
+        if not token[0].isdigit():
+            tokens.append(token)
+        elif token.endswith("%"):
+            tokens.append("<pct>")
+        elif _RE_YEAR_TOKEN.fullmatch(token):
+            tokens.append("<year>")
+        else:
+            tokens.append("<num>")
+    return tokens
+
+
+@lru_cache(maxsize=65536)
+def _hash(feature):
+    """(bucket hash, sign) — the low bits pick the bucket, the top bit the sign."""
+    h = zlib.crc32(feature.encode("utf-8"))
+    return h & 0x7FFFFFFF, 1.0 if h >> 31 else -1.0
+
+
+def _hashed_features(sentence):
+    tokens = _tokens(sentence)
+    features = [_hash(token) for token in tokens]
+    features.extend(_hash(a + " " + b) for a, b in zip(tokens, tokens[1:]))
+    return features
+
+
+def _dense_features(sentence):
+    found, word_count = _sentence_features(sentence)
+    row = [(found >> bit) & 1 for bit in range(_SIGNAL_BITS)]
+    length_bin = sum(word_count >= edge for edge in _LENGTH_BINS)
+    row.extend(int(length_bin == i) for i in range(len(_LENGTH_BINS) + 1))
+    return row
+
+
+def featurize(sentences, n_buckets):
+    """
+    Feature matrices for *sentences*: (dense (n, _DENSE) float array, and
+    the hashed part as parallel row / bucket / sign arrays).
+    """
+    import numpy as np
+
+    dense = np.array([_dense_features(s) for s in sentences], dtype=np.float32).reshape(-1, _DENSE)
+    rows, buckets, signs = [], [], []
+    mask = n_buckets - 1
+    for row, sentence in enumerate(sentences):
+        for h, sign in _hashed_features(sentence):
+            rows.append(row)
+            buckets.append(h & mask)
+            signs.append(sign)
+    return (
+        dense,
+        np.array(rows, dtype=np.intp),
+        np.array(buckets, dtype=np.intp),
+        np.array(signs, dtype=np.float32),
+    )
+
+
+# =============================================================================
+# MODEL
+# =============================================================================
+
+class ClaimClassifier:
+    """Logistic regression over the signal flags and hashed word n-grams."""
+
+    def __init__(self, weights):
+        import numpy as np
+
+        weights = np.asarray(weights, dtype=np.float32)
+        n_buckets = weights.size - _OFFSET
+        if weights.ndim != 1 or n_buckets < 1 or n_buckets & (n_buckets - 1):
+            raise ValueError(
+                f"expected a 1-D weight vector of {_OFFSET} + 2^k values, got shape {weights.shape}"
+            )
+        self.weights = weights
+        self.n_buckets = n_buckets
+
+    @classmethod
+    def load(cls, path):
+        import numpy as np
+        return cls(np.load(path, allow_pickle=False))
+
+    def save(self, path):
+        import numpy as np
+        np.save(path, self.weights)
+
+    def _logits(self, features):
+        import numpy as np
+
+        dense, rows, buckets, signs = features
+        w = self.weights
+        logits = dense @ w[1:_OFFSET] + w[0]
+        logits += np.bincount(rows, weights=w[_OFFSET:][buckets] * signs, minlength=len(dense))
+        return logits
+
+    def predict_proba(self, sentences):
+        """P(claim) for each sentence, as a float numpy array in input order."""
+        import numpy as np
+
+        if not sentences:
+            return np.zeros(0)
+        logits = self._logits(featurize(sentences, self.n_buckets))
+        return 1.0 / (1.0 + np.exp(-logits.astype(np.float64)))
+
+    @classmethod
+    def train(cls, sentences, labels, n_buckets=DEFAULT_BUCKETS, epochs=400, learning_rate=0.5, l2=1e-3):
+        """
+        Fit by full-batch gradient descent on the mean log loss + L2. Small
+        enough (thousands of labeled sentences) that one pass is a few numpy
+        ops; deterministic, so the same data gives the same weight file.
+        """
+        import numpy as np
+
+        if n_buckets < 1 or n_buckets & (n_buckets - 1):
+            raise ValueError("n_buckets must be a power of two")
+        y = np.asarray(labels, dtype=np.float64)
+        features = featurize(sentences, n_buckets)
+        dense, rows, buckets, signs = features
+        model = cls(np.zeros(_OFFSET + n_buckets, dtype=np.float32))
+        w = np.zeros(_OFFSET + n_buckets)
+        n = len(y)
+
+        for _ in range(epochs):
+            model.weights = w.astype(np.float32)
+            error = 1.0 / (1.0 + np.exp(-model._logits(features).astype(np.float64))) - y
+            grad = l2 * w
+            grad[0] += error.mean()
+            grad[1:_OFFSET] += dense.T @ error / n
+            np.add.at(grad, _OFFSET + buckets, error[rows] * signs / n)
+            w -= learning_rate * grad
+
+        model.weights = w.astype(np.float32)
+        return model
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+
+_stats = {"scored": 0, "rejected": 0}
+
+
+@lru_cache(maxsize=1)
+def get_classifier(path=WEIGHTS_PATH):
+    """
+    The shipped classifier, loaded once — or None when CLAIM_CLASSIFIER is
+    off, numpy isn't installed or the weight file is missing/invalid (logged;
+    /analyze then runs on the heuristic alone).
+    """
+    if not CLASSIFIER_ENABLED:
+        return None
+    try:
+        classifier = ClaimClassifier.load(path)
+    except (ImportError, OSError, ValueError) as exc:
+        logger.warning("Claim classifier disabled — could not load %s: %s", path, exc)
+        return None
+    logger.info("Loaded claim classifier from %s (%d buckets)", path, classifier.n_buckets)
+    return classifier
+
+
+def filter_claims(sentences):
+    """
+    Which of the heuristic's candidate *sentences* to keep: a list of bools,
+    all True when the classifier is off.
+    """
+    classifier = get_classifier()
+    if classifier is None or not sentences:
+        return [True] * len(sentences)
+    keep = (classifier.predict_proba(sentences) >= CLASSIFIER_THRESHOLD).tolist()
+    _stats["scored"] += len(keep)
+    _stats["rejected"] += keep.count(False)
+    return keep
+
+
+def classifier_stats() -> dict:
+    """Whether the classifier is active, and how many candidates it scored / rejected."""
+    return {"enabled": get_classifier() is not None, **_stats}
+
+
+# =============================================================================
+# TRAINING / EVALUATION CLI
+# =============================================================================
+
+def load_labels(path):
+    """(sentences, labels) from a JSON-lines file of {"text", "label"|"verdict"} rows."""
+    sentences, labels = [], []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            label = row["label"] if "label" in row else _VERDICT_LABELS[row["verdict"]]
+            sentences.append(row["text"])
+            labels.append(int(label))
+    return sentences, labels
+
+
+def _report(name, predicted, labels):
+    tp = sum(p and y for p, y in zip(predicted, labels))
+    fp = sum(p and not y for p, y in zip(predicted, labels))
+    fn = sum(not p and y for p, y in zip(predicted, labels))
+    accuracy = sum(p == bool(y) for p, y in zip(predicted, labels)) / len(labels)
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    print(f"  {name:<24}{accuracy:>10.3f}{precision:>11.3f}{recall:>9.3f}{sum(predicted):>12}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train or evaluate the claim classifier")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    train = commands.add_parser("train", help="fit weights on a labeled JSON-lines file")
+    train.add_argument("labels")
+    train.add_argument("--out", default=WEIGHTS_PATH)
+    train.add_argument("--buckets", type=int, default=DEFAULT_BUCKETS)
+    train.add_argument("--epochs", type=int, default=400)
+    train.add_argument("--l2", type=float, default=1e-3)
+
+    evaluate = commands.add_parser("evaluate", help="compare heuristic vs heuristic + classifier")
+    evaluate.add_argument("labels")
+    evaluate.add_argument("--weights", default=WEIGHTS_PATH)
+    evaluate.add_argument("--threshold", type=float, default=CLASSIFIER_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    sentences, labels = load_labels(args.labels)
+    if args.command == "train":
+        model = ClaimClassifier.train(sentences, labels, n_buckets=args.buckets, epochs=args.epochs, l2=args.l2)
+        model.save(args.out)
+        print(f"trained on {len(labels)} sentences ({sum(labels)} claims) → {args.out}")
+        return
+
+    model = ClaimClassifier.load(args.weights)
+    heuristic = [score_claim_probability(s) > 0.5 for s in sentences]
+    learned = (model.predict_proba(sentences) >= args.threshold).tolist()
+    print(f"{len(labels)} sentences, {sum(labels)} labeled claims")
+    print(f"  {'filter':<24}{'accuracy':>10}{'precision':>11}{'recall':>9}{'verified':>12}")
+    _report("heuristic", heuristic, labels)
+    _report("heuristic + classifier", [h and c for h, c in zip(heuristic, learned)], labels)
+
+
+if __name__ == "__main__":
+    main()
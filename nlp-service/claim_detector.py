@@ -4,14 +4,23 @@ This file has two responsibilities: sentence splitting and claim probability sco
 Sentence splitter — split_into_sentences(text) → list[str]
 
 Split on ., !, ? followed by whitespace/end, but skip abbreviations like Rs., Dr., Mr., No., vs., etc.. Returns a cleaned list of non-empty sentences.
+iter_sentences(text_or_chunks) yields the same sentences lazily, from a string or an iterable of text chunks.
 
 Claim probability scoring — score_claim_probability(sentence) → float
 Returns a number between 0 and 1 indicating how likely this sentence is to be a claim about an economic metric. Higher means more likely.
 """
 
+import hashlib
 import re
+import threading
+import unicodedata
+from functools import lru_cache
 
-from metrics import get_all_metric_names   # to get the list of all the metrics we support, so we can check if any of them are mentioned in the sentence.
+from lexer import (   # the scorer's signal bits and single-pass signal scanner — see lexer.py
+    _NUMBER, _YEAR, _METRIC, _VERB, _SUBJECT, _trie_pattern, lex,
+)
+from memo import LruMemo
+from metrics import METRIC_KEYWORDS   # metric names + short forms, so we can check if any of them are mentioned in the sentence.
 
 # Abbreviations that contain a dot but should NOT end a sentence
 ABBREVIATIONS = [
@@ -26,6 +35,172 @@ ABBREVIATIONS = [
 
 
 def split_into_sentences(text):
+    return list(iter_sentences(text))
+
+
+# iter_sentences(text) — the splitter as a single-pass generator
+# Yields exactly what _split_into_sentences_reference() returns (the original
+# three-step splitter below), one sentence at a time:
+#   STEP A   protect abbreviations: ONE compiled alternation, tried only on
+#            the word before each ".", instead of one case-insensitive
+#            re.sub per abbreviation over the whole text. The reference
+#            writes each protected abbreviation back lowercased
+#            ("Rs." → "rs."), so this does too
+#   STEP B   sentence boundaries found by _SentenceBuffer as text arrives
+#   STEP C   each sentence cleaned once as it is yielded
+# *text* is a string or an iterable of string chunks (a file read in blocks,
+# a streamed request body): only the sentence in progress is held, never
+# the whole document or a protected copy of it.
+
+# \b(?:(rs)|(dr)|...)\. — one group per abbreviation, so m.lastindex says which
+_RE_ABBREVIATION = re.compile(
+    r"\b(?:%s)\." % "|".join(f"({abbr})" for abbr in ABBREVIATIONS),
+    re.IGNORECASE,
+)
+_RE_BOUNDARY_SPACE = re.compile(r"(?<=[.!?])\s+")
+_ABBREVIATION_MAX = max(map(len, ABBREVIATIONS))
+
+
+def _abbreviation_before(text, start, dot):
+    """
+    The abbreviation (as listed) whose "." is text[dot], or None. Only the
+    word ending at the dot can match, so this walks back over it and runs
+    the pattern there — scanning whole sentences with a case-insensitive
+    29-way alternation costs ~0.5 µs per character.
+    """
+    word_start = dot
+    while word_start > start and _is_word_char(text[word_start - 1]):
+        word_start -= 1
+        if dot - word_start > _ABBREVIATION_MAX:
+            return None
+    m = _RE_ABBREVIATION.fullmatch(text, word_start, dot + 1)
+    return ABBREVIATIONS[m.lastindex - 1] if m else None
+
+
+def _clean_sentence(raw):
+    # STEP A on one sentence: "Rs." → "rs.", as the reference writes it back
+    pieces, last = [], 0
+    dot = raw.find(".")
+    while dot != -1:
+        abbr = _abbreviation_before(raw, 0, dot)
+        if abbr is not None:
+            pieces += [raw[last:dot - len(abbr)], abbr]
+            last = dot
+        dot = raw.find(".", dot + 1)
+    protected = "".join(pieces) + raw[last:] if pieces else raw
+    return protected.replace("<DOT>", ".").strip().rstrip(".!?")
+
+
+def iter_sentences(text):
+    chunks = (text,) if isinstance(text, str) else text
+    splitter = SentenceSplitter()
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    yield from splitter.close()
+
+
+class SentenceSplitter:
+    """
+    iter_sentences() for push-style input, where the caller receives the
+    text piece by piece (an HTTP body read with `async for`): feed() each
+    piece and get back the cleaned sentences it completed, then close()
+    for the rest.
+
+    max_sentence_chars bounds the text held between boundaries: a run that
+    long with no sentence boundary (an unpunctuated transcript) is cut at
+    its last whitespace and emitted as it is, so memory stays bounded
+    whatever arrives. None — what iter_sentences() uses — never cuts.
+    """
+
+    def __init__(self, max_sentence_chars=None):
+        self._buffer = _SentenceBuffer(max_sentence_chars)
+
+    def feed(self, chunk):
+        return _clean_all(self._buffer.feed(chunk))
+
+    def close(self):
+        return _clean_all(self._buffer.close())
+
+
+def _clean_all(pieces):
+    return [sentence for sentence in map(_clean_sentence, pieces) if sentence]
+
+
+class _SentenceBuffer:
+    """
+    Cuts text into raw sentences as it arrives, where the reference's
+    STEP B would split the STEP A-protected text: punctuation, whitespace,
+    then a capital letter — unless the punctuation is an abbreviation's
+    dot, or the capital starts an abbreviation (STEP A lowercases it, so
+    no capital follows).
+
+    feed() returns the sentences it can already decide on; a boundary is
+    left pending while the whitespace run, or the word after it, might
+    still continue in the next chunk. close() flushes the rest — the last
+    piece is always returned, even if empty. With max_pending set, feed()
+    also force-cuts the text in progress once it grows past that many
+    characters.
+    """
+
+    def __init__(self, max_pending=None):
+        self._text = ""     # the sentence in progress (+ undecided tail)
+        self._scan = 0      # where the next boundary search starts
+        self._max_pending = max_pending
+
+    def feed(self, chunk):
+        self._text += chunk
+        pieces = self._cut(final=False)
+        limit = self._max_pending
+        while limit is not None and len(self._text) > limit:
+            cut = max(self._text.rfind(" ", 0, limit), self._text.rfind("\n", 0, limit))
+            if cut <= 0:
+                cut = limit
+            pieces.append(self._text[:cut])
+            self._text, self._scan = self._text[cut:], max(self._scan - cut, 0)
+        return pieces
+
+    def close(self):
+        pieces = self._cut(final=True)
+        pieces.append(self._text)
+        self._text, self._scan = "", 0
+        return pieces
+
+    def _cut(self, final):
+        text, start, pieces = self._text, 0, []
+        scan = self._scan
+        for m in _RE_BOUNDARY_SPACE.finditer(text, self._scan):
+            nxt = m.end()
+            if nxt == len(text):
+                if not final:
+                    scan = m.start()        # more whitespace / the next word may follow
+                break
+            if not "A" <= text[nxt] <= "Z":
+                continue
+            dot = m.start() - 1
+            if text[dot] == "." and _abbreviation_before(text, start, dot) is not None:
+                continue                    # STEP A hid this dot
+            word_end = nxt
+            while word_end < len(text) and _is_word_char(text[word_end]):
+                word_end += 1
+            if word_end == len(text) and not final:
+                scan = m.start()            # is the next word an abbreviation? not known yet
+                break
+            if _RE_ABBREVIATION.match(text, nxt):
+                continue                    # STEP A lowercases "Rs." → "rs.", so no capital follows
+            pieces.append(text[start:m.start()])
+            start = nxt
+        else:
+            scan = len(text)
+        self._text, self._scan = text[start:], max(scan - start, 0)
+        return pieces
+
+
+def _split_into_sentences_reference(text):
+    """
+    Reference implementation: the original protect / split / restore
+    splitter, one re.sub per abbreviation. Kept so tests and
+    benchmarks/hotpath.py can check iter_sentences() against it.
+    """
 
     # STEP A — protect abbreviations
     # Replace "Rs." → "Rs<DOT>" so the dot is invisible to the splitter
@@ -57,11 +232,133 @@ def split_into_sentences(text):
 
     return sentences
 
+
+# sentence_chunks(text) — raw text cut where split_into_sentences() would cut
+# Lets callers cache per sentence and re-split only what changed
+# (incremental.py). The same _SentenceBuffer cuts, before cleaning, so for
+# any text:
+#   split_into_sentences(text) ==
+#       [s for chunk in sentence_chunks(text) for s in split_into_sentences(chunk)]
+
+def sentence_chunks(text):
+    buffer = _SentenceBuffer()
+    return buffer.feed(text) + buffer.close()
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "_"       # what \w matches
+
 # score_claim_probability(sentence) — The Claim Scorer
 # This is a very simple heuristic model that checks if any known metric names are mentioned in the
 
 
+# Keyed on the exact sentence (not the preprocessed text) — word counts and
+# substring signals depend on the raw characters, so scores stay identical.
+_score_memo = LruMemo("score_claim_probability")
+
+
 def score_claim_probability(sentence):
+    return _score_memo.get_or_compute(sentence, _score_sentence)
+
+
+def _sentence_features(sentence):
+    """(signal bitmask, word count) — everything the score is computed from."""
+    lexed = lex(sentence)      # shared with the extractor when the sentence is a claim
+    return lexed.signals, lexed.word_count
+
+
+def _score_sentence(sentence):
+    return _score_lexed(lex(sentence))
+
+
+def _score_lexed(lexed):
+    """Score of a lexed sentence — benchmarks pass a fresh Lexed to time it without the lex memo."""
+    return _score_from_features(lexed.signals, lexed.word_count)
+
+
+def _score_from_features(found, word_count):
+    # Same additions in the same order as the reference, so the floats round identically
+    score = 0.0
+    if found & _NUMBER:
+        score += 0.30
+    if found & _YEAR:
+        score += 0.20
+    if found & _METRIC:
+        score += 0.25
+    if found & _VERB:
+        score += 0.15
+    if found & _SUBJECT:
+        score += 0.05
+    if 8 <= word_count <= 50:
+        score += 0.05
+    if word_count < 3:
+        score -= 0.20
+    if word_count > 70:
+        score -= 0.10
+    return round(max(0.0, min(1.0, score)), 2)
+
+
+# =============================================================================
+# BATCH SCORING — score_claims_batch(sentences) → numpy array
+# =============================================================================
+#
+# Answers: "What are the claim probabilities of these 5,000 sentences?"
+# Example:
+#     score_claims_batch(["India's GDP grew 7.5% in 2024", "Hello"])
+#         → array([0.95, 0.  ])
+#
+# HOW?
+#   1. One row of features per DISTINCT sentence — the five signal flags
+#      from the scanner plus the word count (bulk ingestion repeats
+#      boilerplate sentences, so each is scanned once).
+#   2. Weights, length bonus, penalties, clamp and rounding applied to the
+#      whole column at once. Weights are added column by column in the
+#      scalar order (not a matrix product, which may sum in another order)
+#      so every float matches score_claim_probability() exactly.
+
+# Signal weights in bit order: number, year, metric, verb, subject
+_SIGNAL_WEIGHTS = (0.30, 0.20, 0.25, 0.15, 0.05)
+
+
+def _batch_scores(flags, word_counts):
+    """Scores for an (n, 5) 0/1 flag matrix and an (n,) word-count array."""
+    import numpy as np
+
+    score = np.zeros(len(word_counts))
+    for column, weight in enumerate(_SIGNAL_WEIGHTS):
+        score += flags[:, column] * weight        # adds weight or an exact 0.0
+    score += np.where((word_counts >= 8) & (word_counts <= 50), 0.05, 0.0)
+    score -= np.where(word_counts < 3, 0.20, 0.0)
+    score -= np.where(word_counts > 70, 0.10, 0.0)
+    return np.round(np.clip(score, 0.0, 1.0), 2)
+
+
+def score_claims_batch(sentences):
+    """
+    Claim probabilities for a list of sentences, as a float64 numpy array in
+    input order — element for element equal to score_claim_probability().
+    Skips the per-sentence memo: meant for bulk input, where most sentences
+    are new.
+    """
+    import numpy as np
+
+    rows = {}
+    for sentence in sentences:
+        if sentence not in rows:
+            rows[sentence] = len(rows)
+    features = np.array([_sentence_features(sentence) for sentence in rows], dtype=np.int64).reshape(-1, 2)
+
+    flags = (features[:, :1] >> np.arange(len(_SIGNAL_WEIGHTS))) & 1
+    scores = _batch_scores(flags, features[:, 1])
+    return scores[np.fromiter((rows[s] for s in sentences), dtype=np.intp, count=len(sentences))]
+
+
+def _score_sentence_reference(sentence):
+    """
+    Reference implementation: the original signal-by-signal scorer.
+    Kept so tests and benchmarks/bench_score.py can check the single-pass
+    scanner against it.
+    """
 
     score = 0.0
     text_lower = sentence.lower()
@@ -83,14 +380,9 @@ def score_claim_probability(sentence):
         score += 0.20
 
     # ---- SIGNAL 3: Mentions a known metric (+0.25) ----
-    # Uses the same metric names from metrics.py — stays in sync automatically
-    metric_keywords = [name.lower() for name in get_all_metric_names()]
-    # Also add common short-form keywords that appear in claims
-    metric_keywords += ["gdp", "inflation", "unemployment", "deficit",
-                        "literacy", "population", "forex", "poverty",
-                        "per capita", "current account", "fiscal"]
-
-    has_metric = any(keyword in text_lower for keyword in metric_keywords)
+    # Metric names plus their short forms ("gdp", "forex"), from the same
+    # registry metrics.py matches against — stays in sync automatically
+    has_metric = any(keyword in text_lower for keyword in METRIC_KEYWORDS)
     if has_metric:
         score += 0.25
 
@@ -141,21 +433,117 @@ def score_claim_probability(sentence):
 # N-24 — LANGUAGE DETECTION
 # =============================================================================
 
+# Answers: "Is this text English?" — cheaply, for every /extract and /analyze
+# request.
+#
+# WHY?
+#   langdetect's full probabilistic detection (n-gram features, 7 random
+#   trials) costs milliseconds, and the service used to re-import it and
+#   reset the global seed on every request — for claims like "GDP grew 7.5%
+#   in 2024" whose answer is obvious.
+#
+# HOW? (in order; counted per path in language_gate_stats())
+#   cache      results are memoized by a 128-bit hash of the text, so long
+#              documents aren't kept as keys
+#   script     letters mostly in one non-Latin script → that script's main
+#              language (Devanagari → "hi", Bengali → "bn", Cyrillic → "ru",
+#              ...). The caller only needs "not English", and no amount of
+#              n-gram statistics makes Devanagari text English
+#   keyword    every letter ASCII (symbols like ₹ or ’ allowed) and a known
+#              metric keyword as a word → "en"
+#   detector   anything else: langdetect, with a private factory whose
+#              profiles are loaded once and whose seed is fixed, so results
+#              are the same as before
+#   fallback   langdetect missing or failing (e.g. no letters) → "en"
+
+# unicodedata name prefix → langdetect code of the script's main language
+_SCRIPT_LANGUAGES = {
+    "DEVANAGARI": "hi", "BENGALI": "bn", "GURMUKHI": "pa", "GUJARATI": "gu",
+    "TAMIL": "ta", "TELUGU": "te", "KANNADA": "kn", "MALAYALAM": "ml",
+    "ARABIC": "ar", "CYRILLIC": "ru", "GREEK": "el", "HEBREW": "he",
+    "THAI": "th", "HANGUL": "ko", "HIRAGANA": "ja", "KATAKANA": "ja", "CJK": "zh-cn",
+}
+_SCRIPT_SAMPLE = 2000          # characters looked at by the script scan
+_RE_ASCII_LETTER = re.compile(r"[a-zA-Z]")
+_RE_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+_RE_METRIC_WORD = re.compile(r"\b%s\b" % _trie_pattern(METRIC_KEYWORDS), re.IGNORECASE)
+
+_language_memo = LruMemo("detect_claim_language")
+_language_paths = {"cache": 0, "script": 0, "keyword": 0, "detector": 0, "fallback": 0}
+_language_lock = threading.Lock()
+
+
+def _script_language(sample):
+    """
+    (language, any non-ASCII letters?) — language is set when most letters
+    (and vowel signs) of *sample* are in one non-Latin script with a known
+    language.
+    """
+    scripts = {}
+    for m in _RE_NON_ASCII.finditer(sample):
+        ch = m.group()
+        if unicodedata.category(ch)[0] in "LM":        # letters and vowel signs, not ₹ or ’
+            script = unicodedata.name(ch, "").split(" ", 1)[0]
+            scripts[script] = scripts.get(script, 0) + 1
+    if not scripts:
+        return None, False
+    latin = len(_RE_ASCII_LETTER.findall(sample)) + scripts.pop("LATIN", 0)
+    if scripts:
+        script, count = max(scripts.items(), key=lambda item: item[1])
+        if count > latin and script in _SCRIPT_LANGUAGES:
+            return _SCRIPT_LANGUAGES[script], True
+    return None, True
+
+
+@lru_cache(maxsize=None)
+def _language_detector_factory():
+    """langdetect's profiles, loaded once; seed fixed so detection is reproducible."""
+    from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
+    factory = DetectorFactory()
+    factory.load_profile(PROFILES_DIRECTORY)
+    factory.set_seed(0)
+    return factory
+
+
+def _detect_language(text):
+    """(path, language) for text the memo hasn't seen."""
+    language, non_ascii = _script_language(text[:_SCRIPT_SAMPLE])
+    if language is not None:
+        return "script", language
+    if not non_ascii and _RE_METRIC_WORD.search(text):
+        return "keyword", "en"
+    try:
+        detector = _language_detector_factory().create()
+        detector.append(text)
+        return "detector", detector.detect()
+    except Exception:
+        return "fallback", "en"  # safe fallback — never crash on detection failure
+
+
 def detect_claim_language(text: str) -> str:
     """
     Detect the language of *text* and return an ISO 639-1 code (e.g. 'en', 'hi').
-    Uses the langdetect library under the hood.
+    Decides obvious cases by script or metric keywords and runs langdetect
+    only on the rest (see the notes above).
 
     Falls back to 'en' gracefully if:
       - langdetect is not installed
       - the text is too short to classify reliably
       - any other detection error occurs
-
-    The seed is fixed so detection is deterministic across calls.
     """
-    try:
-        from langdetect import detect, DetectorFactory
-        DetectorFactory.seed = 0   # reproducible across calls
-        return detect(text)
-    except Exception:
-        return "en"  # safe fallback — never crash on detection failure
\ No newline at end of file
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    language = _language_memo.get(key)
+    if language is not None:
+        path = "cache"
+    else:
+        path, language = _detect_language(text)
+        _language_memo.put(key, language)
+    with _language_lock:
+        _language_paths[path] += 1
+    return language
+
+
+def language_gate_stats() -> dict:
+    """How many detect_claim_language() calls each path decided."""
+    with _language_lock:
+        return dict(_language_paths)
@@ -0,0 +1,183 @@
+"""
+countries.py — ISO 3166 country gazetteer and one-pass country resolver
+
+Answers: "Which country is this claim about?"
+Example:
+    Input:  "Brazil's inflation rate fell to 4.6% in 2023"
+    Output: "BRA"
+
+The gazetteer lives in data/countries.json: all 249 ISO 3166-1 entries
+(alpha-2, alpha-3, common name) plus aliases ("UK", "Holland", "Bharat")
+and demonyms ("Brazilian", "Emirati"). Everything else that needs country
+codes — extractor.extract_country, verifier.tier1_numeric._ISO3_TO_ISO2 —
+is generated from that one table.
+
+HOW MATCHING WORKS:
+  Every alias is split into lowercase word tokens and inserted into a token
+  trie ("united" → "arab" → "emirates" → ARE). The text is tokenized once
+  and the trie is walked from each token, keeping the longest match. Cost
+  depends on text length and alias length in words, not on how many
+  countries the gazetteer holds, so it stays flat as the table grows.
+
+CASE RULES (from the JSON):
+  exact_case  — acronyms that only count in capitals: "US", "UK", "UAE"
+                (so "let us know" is not the United States)
+  title_case  — names that are also common words: "Turkey", "Chad", "Jordan"
+                only count when Capitalized
+  not_countries — phrases that would otherwise hit a country alias but are
+                  regions: "Latin America", "Indian Ocean"
+"""
+
+import json
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "countries.json")
+
+_RE_WORD = re.compile(r"\w+")
+
+# Trie node key that holds the match payload; can't collide with a \w+ token
+_END = "\0"
+# Payload used for not_countries phrases
+_BLOCKED = None
+
+
+@dataclass(frozen=True)
+class Country:
+    iso2: str
+    iso3: str
+    name: str
+
+
+def _strip_accents(text: str) -> str:
+    """'Türkiye' → 'Turkiye', 'Côte' → 'Cote'."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def _load_gazetteer(path: str = GAZETTEER_PATH):
+    with open(path, encoding="utf-8") as f:
+        doc = json.load(f)
+
+    countries = {
+        c["iso3"]: Country(iso2=c["iso2"], iso3=c["iso3"], name=c["name"])
+        for c in doc["countries"]
+    }
+    exact_case = set(doc.get("exact_case", []))
+    title_case = set(doc.get("title_case", []))
+
+    trie: dict = {}
+
+    def insert(phrase: str, iso3):
+        if phrase in exact_case:
+            mode = "exact"
+        elif phrase in title_case:
+            mode = "title"
+        else:
+            mode = "any"
+        surface = tuple(_RE_WORD.findall(phrase))
+        for variant in {phrase, _strip_accents(phrase)}:
+            node = trie
+            for token in _RE_WORD.findall(variant.lower()):
+                node = node.setdefault(token, {})
+            # A phrase can sit at one node under several case modes ("US" exact,
+            # "us virgin islands" any) — keep them all.
+            node.setdefault(_END, []).append((iso3, mode, surface))
+
+    for c in doc["countries"]:
+        for phrase in [c["name"], *c.get("aliases", []), *c.get("demonyms", [])]:
+            insert(phrase, c["iso3"])
+        for demonym in c.get("demonyms", []):
+            # "Indians", "Pakistanis", "Emiratis" — skip words that don't pluralize with -s
+            if demonym[-1:] in ("n", "i"):
+                insert(demonym + "s", c["iso3"])
+    for phrase in doc.get("not_countries", []):
+        insert(phrase, _BLOCKED)
+
+    return doc.get("version"), countries, trie
+
+
+GAZETTEER_VERSION, COUNTRIES, _TRIE = _load_gazetteer()
+
+# ISO3 → ISO2, used for World Bank data.worldbank.org links
+ISO3_TO_ISO2: dict[str, str] = {c.iso3: c.iso2 for c in COUNTRIES.values()}
+
+
+def _accepts(mode: str, surface: tuple, tokens: list[str], i: int, j: int) -> bool:
+    """Check the case rule for a candidate match against the original-case tokens[i:j+1]."""
+    if mode == "any":
+        return True
+    if mode == "exact":
+        return tuple(tokens[i:j + 1]) == surface
+    return tokens[i][:1].isupper()    # title
+
+
+def find_country_mentions(text: str) -> list[tuple[int, int, str]]:
+    """
+    Every country mention in *text* as (start, end, iso3), left to right.
+    Longest alias wins at each position ("South Korea" over "Korea",
+    "Latin America" blocks "America"), and mentions never overlap.
+    """
+    tokens = _RE_WORD.findall(text)
+    lowered = [t.lower() for t in tokens]
+    offsets = []   # character offset of each token, filled lazily up to the last match
+    mentions = []
+    i = 0
+    n = len(tokens)
+    while i < n:
+        node = _TRIE.get(lowered[i])
+        if node is None:
+            i += 1
+            continue
+
+        best = None   # (last_token_index, iso3)
+        j = i
+        while node is not None:
+            for iso3, mode, surface in node.get(_END, ()):
+                if _accepts(mode, surface, tokens, i, j):
+                    best = (j, iso3)
+                    break
+            j += 1
+            node = node.get(lowered[j]) if j < n else None
+
+        if best is None:
+            i += 1
+            continue
+        last, iso3 = best
+        if iso3 is not _BLOCKED:
+            # Only non-word characters sit between tokens, so the next
+            # occurrence of a token after the previous one is its position.
+            while len(offsets) <= last:
+                k = len(offsets)
+                offsets.append(text.find(tokens[k], offsets[-1] + len(tokens[k - 1]) if k else 0))
+            mentions.append((offsets[i], offsets[last] + len(tokens[last]), iso3))
+        i = last + 1
+
+    return mentions
+
+
+def resolve_country(text: str) -> str | None:
+    """ISO3 code of the first country mentioned in *text*, or None."""
+    mentions = find_country_mentions(text)
+    return mentions[0][2] if mentions else None
+
+
+if __name__ == "__main__":
+    test_claims = [
+        "India's GDP growth rate was 7.5% in 2024",
+        "US GDP growth rate stood at 2.5% in 2023",
+        "Let us know what inflation was in 2023",
+        "Brazil's inflation rate fell to 4.6% in 2023",
+        "The UAE's non-oil economy grew 6.2%",
+        "Latin America's growth slowed to 2.2%",
+        "Turkish inflation hit 61% while turkey prices rose",
+        "Côte d'Ivoire recorded 6.5% growth",
+    ]
+
+    print(f"Gazetteer {GAZETTEER_VERSION}: {len(COUNTRIES)} countries")
+    for claim in test_claims:
+        print(f"\nClaim: \"{claim}\"")
+        print(f"  → Country:  {resolve_country(claim)}")
+        print(f"  → Mentions: {find_country_mentions(claim)}")
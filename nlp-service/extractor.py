@@ -19,7 +19,14 @@ Example:
 import re
 import html
 import unicodedata
-from metrics import find_metric, PERCENTAGE_METRICS
+from datetime import date, datetime
+
+from countries import resolve_country
+from lexer import Lexed, lex, _clean_number, _fiscal_year_end, _is_year_like
+from memo import LruMemo
+from metrics import find_metric, METRIC_CURRENCIES, PERCENTAGE_METRICS
+from periods import as_reference_date, resolve_period
+from units import currency_near, infer_currency
 
 # =============================================================================
 # N-7: PRE-COMPILED REGEXES — built once at module load, not on every call
@@ -31,41 +38,47 @@ _RE_FY_SHORT      = re.compile(r"\b(\d{4})-(\d{2})\b")                      # 20
 
 _RE_PERCENT_VAL   = re.compile(r"(-?\d+(?:,\d+)*(?:\.\d+)?)\s*(?:%|percent|per\s*cent)", re.IGNORECASE)
 _RE_NUMBER        = re.compile(r"(?<!\d)(-?\d+(?:,\d+)*(?:\.\d+)?)(?!\d)")
-_RE_YEAR_LIKE     = re.compile(r"^(?:19|20)\d{2}$")
 _RE_PERCENT_NEAR  = re.compile(r"\d\s*(?:%|percent|per\s*cent)", re.IGNORECASE)
 
 # N-2: Word-form number multipliers (longest phrases first to avoid partial hits)
 # NOTE: lakh crore must come before lakh and crore individually.
 # Non-raw strings used for the \u20b9 (\u20b9 = ₹) to be processed by Python.
+# The last column is a word every match contains, so a lexed text without
+# it skips the search (see _locate_value).
 _WORD_MULTIPLIERS = [
-    (re.compile("(?:\u20b9|rs\\.?\\s*)?(\\d+(?:\\.\\d+)?)\\s*lakh\\s*crore",  re.IGNORECASE), 1e12),
-    (re.compile("(?:\u20b9|rs\\.?\\s*)?(\\d+(?:\\.\\d+)?)\\s*lakh",           re.IGNORECASE), 1e5),
-    (re.compile("(?:\u20b9|rs\\.?\\s*)?(\\d+(?:\\.\\d+)?)\\s*crore",          re.IGNORECASE), 1e7),
-    (re.compile(r"(\d+(?:\.\d+)?)\s*trillion",                                  re.IGNORECASE), 1e12),
-    (re.compile(r"(\d+(?:\.\d+)?)\s*billion",                                   re.IGNORECASE), 1e9),
-    (re.compile(r"(\d+(?:\.\d+)?)\s*million",                                   re.IGNORECASE), 1e6),
-    (re.compile(r"(\d+(?:\.\d+)?)\s*thousand",                                  re.IGNORECASE), 1e3),
+    (re.compile("(?:\u20b9|rs\\.?\\s*)?(\\d+(?:\\.\\d+)?)\\s*lakh\\s*crore",  re.IGNORECASE), 1e12, "lakh crore", "lakh"),
+    (re.compile("(?:\u20b9|rs\\.?\\s*)?(\\d+(?:\\.\\d+)?)\\s*lakh",           re.IGNORECASE), 1e5,  "lakh",       "lakh"),
+    (re.compile("(?:\u20b9|rs\\.?\\s*)?(\\d+(?:\\.\\d+)?)\\s*crore",          re.IGNORECASE), 1e7,  "crore",      "crore"),
+    (re.compile(r"(\d+(?:\.\d+)?)\s*trillion",                                  re.IGNORECASE), 1e12, "trillion",   "trillion"),
+    (re.compile(r"(\d+(?:\.\d+)?)\s*billion",                                   re.IGNORECASE), 1e9,  "billion",    "billion"),
+    (re.compile(r"(\d+(?:\.\d+)?)\s*million",                                   re.IGNORECASE), 1e6,  "million",    "million"),
+    (re.compile(r"(\d+(?:\.\d+)?)\s*thousand",                                  re.IGNORECASE), 1e3,  "thousand",   "thousand"),
 ]
 
-# N-19: Country name → ISO 3166 alpha-3 (top 10 economies + India focus)
-# Listed most-specific first — "united states" before "states"
-_COUNTRY_PATTERNS = [
-    (re.compile(r"\bindia(?:'s)?\b",                         re.IGNORECASE), "IND"),
-    (re.compile(r"\bindian\b",                               re.IGNORECASE), "IND"),
-    (re.compile(r"\b(?:united\s+states|usa|u\.s\.a\.)\b",   re.IGNORECASE), "USA"),
-    (re.compile(r"\bUS\b"),                                                  "USA"),  # case-sensitive — avoids matching "us" in normal prose
-    (re.compile(r"\bamerican?\b",                            re.IGNORECASE), "USA"),
-    (re.compile(r"\b(?:united\s+kingdom|uk|u\.k\.)\b",      re.IGNORECASE), "GBR"),
-    (re.compile(r"\b(?:britain|british)\b",                  re.IGNORECASE), "GBR"),
-    (re.compile(r"\bchin(?:a|ese)\b",                        re.IGNORECASE), "CHN"),
-    (re.compile(r"\bjapan(?:ese)?\b",                        re.IGNORECASE), "JPN"),
-    (re.compile(r"\bgerman(?:y)?\b",                         re.IGNORECASE), "DEU"),
-    (re.compile(r"\bfran(?:ce|ch)\b",                        re.IGNORECASE), "FRA"),
-    (re.compile(r"\bbrazil(?:ian)?\b",                       re.IGNORECASE), "BRA"),
-    (re.compile(r"\bcanad(?:a|ian)\b",                       re.IGNORECASE), "CAN"),
-    (re.compile(r"\baustrali(?:a|an)\b",                     re.IGNORECASE), "AUS"),
-    (re.compile(r"\b(?:south\s+)?kor(?:ea|ean)\b",          re.IGNORECASE), "KOR"),
-]
+# N-19: Country name → ISO 3166 alpha-3 lives in countries.py, which resolves
+# every ISO 3166 country (names, aliases, demonyms) from data/countries.json.
+DEFAULT_COUNTRY = "IND"   # most B-ware claims are about India
+
+# The multi-claim tokenizer (_RE_CLAIM_TOKEN: fiscal years, percentages,
+# word-form amounts and plain numbers in one scan) lives in lexer.py.
+
+
+# Preprocessing helpers — see preprocess_claim()
+_RE_HTML_TAG        = re.compile(r"<[^>]+>")
+_RE_WHITESPACE_RUN  = re.compile(r"[ \t\r\n]+")       # one pass for tabs/newlines AND repeated spaces
+_ZERO_WIDTH_TABLE   = dict.fromkeys(map(ord, "\u200b\u200c\u200d\ufeff"))   # str.translate → delete
+
+
+class NormalizedText(str):
+    """
+    A str that has already been through preprocess_claim().
+
+    preprocess_claim() returns this marker type and hands it straight back
+    when it sees it again, so the /verify path (endpoint → router →
+    extract_all) normalizes each claim exactly once. Slicing or otherwise
+    deriving a new string drops the marker, as it should.
+    """
+    __slots__ = ()
 
 
 def preprocess_claim(text: str) -> str:
@@ -80,71 +93,116 @@ def preprocess_claim(text: str) -> str:
       4. NFC normalization — unify composed/decomposed Unicode forms
       5. Collapse whitespace — tabs, newlines, multiple spaces → single space
       6. Strip leading/trailing whitespace
+
+    Fast paths: text that is already a NormalizedText is returned untouched,
+    and plain ASCII with no markup or whitespace noise skips every step.
+    Returns a NormalizedText.
     """
+    if type(text) is NormalizedText:
+        return text
+
+    # Fast path: clean ASCII — nothing to unescape, strip, delete or compose.
+    # Plain substring checks: each is a C-level scan, cheaper than one regex here.
+    if (text.isascii()
+            and "&" not in text and "<" not in text and "  " not in text
+            and "\n" not in text and "\t" not in text and "\r" not in text
+            and not text[:1].isspace() and not text[-1:].isspace()):
+        return NormalizedText(text)
+
     # Step 1: HTML unescape (&amp; &lt; &gt; etc.)
-    text = html.unescape(text)
+    if "&" in text:
+        text = html.unescape(text)
 
     # Step 2: Strip HTML tags
-    text = re.sub(r"<[^>]+>", " ", text)
+    if "<" in text:
+        text = _RE_HTML_TAG.sub(" ", text)
 
-    # Step 3: Remove zero-width and BOM characters
-    text = re.sub(r"[\u200b\u200c\u200d\ufeff]", "", text)
+    if not text.isascii():
+        # Step 3: Remove zero-width and BOM characters
+        text = text.translate(_ZERO_WIDTH_TABLE)
 
-    # Step 4: Unicode NFC normalization (e.g. é as one codepoint, not e + combining accent)
-    text = unicodedata.normalize("NFC", text)
+        # Step 4: Unicode NFC normalization (e.g. é as one codepoint, not e + combining accent)
+        if not unicodedata.is_normalized("NFC", text):
+            text = unicodedata.normalize("NFC", text)
 
     # Step 5 & 6: Collapse whitespace and strip
-    text = re.sub(r"[\t\r\n]+", " ", text)   # newlines/tabs → space
-    text = re.sub(r" {2,}", " ", text)         # multiple spaces → one
-    text = text.strip()
+    text = _RE_WHITESPACE_RUN.sub(" ", text).strip()
+
+    return NormalizedText(text)
 
-    return text
+
+def _preprocess_claim_reference(text: str) -> str:
+    """
+    Reference implementation: the original six-pass preprocess_claim.
+    Kept so tests and benchmarks/bench_preprocess.py can check the fast
+    paths against it.
+    """
+    text = html.unescape(text)
+    text = re.sub(r"<[^>]+>", " ", text)
+    text = re.sub(r"[\u200b\u200c\u200d\ufeff]", "", text)
+    text = unicodedata.normalize("NFC", text)
+    text = re.sub(r"[\t\r\n]+", " ", text)
+    text = re.sub(r" {2,}", " ", text)
+    return text.strip()
 
 
 
 
 # extract_year(text) — Find the year in a claim
-def extract_year(text: str) -> int | None:
+def extract_year(text: str, reference_date: date | datetime | None = None) -> int | None:
     """
     Extract the most relevant year from claim text.
 
     N-1: Handles fiscal year formats:
       - "FY2024-25" → 2025  (ending year of the fiscal year)
       - "2023-24"   → 2024  (short format, only when followed by nothing suspicious)
-    Falls back to standard 4-digit year (most recent match).
+    Falls back to standard 4-digit year (most recent match), then to relative
+    and abbreviated periods ("last year", "this fiscal", "FY25") resolved
+    against *reference_date* (default: today) — see periods.py.
     """
     # ---- Step 1: FY2024-25 style (“FY2024-25” → 2025) ----
     fy_match = _RE_FY_FULL.search(text)
     if fy_match:
-        base_year = int(fy_match.group(1))  # e.g. 2024
-        suffix    = int(fy_match.group(2))  # e.g. 25
-        # Resolve ending year: base_century + suffix
-        century = (base_year // 100) * 100
-        ending  = century + suffix
-        # Edge case: suffix wraps century (e.g. FY1999-00 → 2000)
-        if ending < base_year:
-            ending += 100
-        return ending
+        # e.g. base 2024, suffix 25
+        return _fiscal_year_end(int(fy_match.group(1)), int(fy_match.group(2)))
 
     # ---- Step 2: 2023-24 style (only when no plain year found nearby) ----
     plain_years = _RE_YEAR.findall(text)
     if not plain_years:
         fy_short = _RE_FY_SHORT.search(text)
         if fy_short:
-            base_year = int(fy_short.group(1))
-            suffix    = int(fy_short.group(2))
-            century   = (base_year // 100) * 100
-            ending    = century + suffix
-            if ending < base_year:
-                ending += 100
-            return ending
+            return _fiscal_year_end(int(fy_short.group(1)), int(fy_short.group(2)))
 
     # ---- Step 3: Standard 4-digit year (take the last one mentioned) ----
     if plain_years:
         return int(plain_years[-1])
 
-    return None
+    # ---- Step 4: "last year", "this fiscal", "FY25" ... ----
+    return resolve_period(text, reference_date)
+
+
+def _lexed_year(lexed: Lexed, reference_date: date | datetime | None = None) -> int | None:
+    """
+    extract_year() of a lexed text: the FY2024-25 search only runs when
+    the text has an "fy", the 2023-24 one when it has a "-", and step 4
+    reuses the lexer's period stage.
+    """
+    text = lexed.text
+    if "fy" in lexed.folded:
+        fy_match = _RE_FY_FULL.search(text)
+        if fy_match:
+            return _fiscal_year_end(int(fy_match.group(1)), int(fy_match.group(2)))
 
+    plain_years = _RE_YEAR.findall(text)
+    if not plain_years and "-" in text:
+        fy_short = _RE_FY_SHORT.search(text)
+        if fy_short:
+            return _fiscal_year_end(int(fy_short.group(1)), int(fy_short.group(2)))
+    if plain_years:
+        return int(plain_years[-1])
+
+    periods = lexed.periods(reference_date)
+    return periods[0][2] if periods else None
 
 
 def extract_value(text: str) -> float | None:
@@ -155,59 +213,110 @@ def extract_value(text: str) -> float | None:
       2. N-2: Word-form multipliers  (“1.4 billion”, “₹2 lakh crore”)
       3. Plain numbers (fallback, skipping year-like values)
     """
+    found = _locate_value(text)
+    return found[0] if found else None
+
+
+def _locate_value(text: str, folded: str | None = None):
+    """
+    extract_value() plus where the value came from, for unit detection.
+    Returns (value, start, end, kind, scale, raw_number) or None —
+    kind is "percentage" | "multiplier" | "number", scale the word-form
+    multiplier ("lakh", "billion", ...) or None.
+
+    With *folded* (Lexed.folded) a pattern only runs if the word every
+    match contains is in the text: no "%" and no "per", no percentage.
+    """
     # ---- STEP 1: Percentage takes highest priority ----
-    pct_match = _RE_PERCENT_VAL.search(text)
-    if pct_match:
-        return _clean_number(pct_match.group(1))
+    if folded is None or "%" in text or "per" in folded:
+        pct_match = _RE_PERCENT_VAL.search(text)
+        if pct_match:
+            raw = pct_match.group(1)
+            return _clean_number(raw), pct_match.start(), pct_match.end(), "percentage", None, raw
 
     # ---- STEP 2: N-2 word-form multipliers ----
     # Check longest patterns first (lakh crore before lakh/crore individually)
-    for pattern, multiplier in _WORD_MULTIPLIERS:
+    for pattern, multiplier, scale, keyword in _WORD_MULTIPLIERS:
+        if folded is not None and keyword not in folded:
+            continue
         m = pattern.search(text)
         if m:
-            base = float(m.group(1).replace(",", ""))
-            return base * multiplier
+            raw = m.group(1)
+            base = float(raw.replace(",", ""))
+            return base * multiplier, m.start(), m.end(), "multiplier", scale, raw
 
     # ---- STEP 3: Plain numeric fallback ----
-    all_numbers = _RE_NUMBER.findall(text)
+    all_numbers = list(_RE_NUMBER.finditer(text))
     if not all_numbers:
         return None
 
-    for num_str in all_numbers:
-        if not _RE_YEAR_LIKE.match(num_str.replace(",", "")):
-            return _clean_number(num_str)
-
-    # All numbers looked like years — return first as fallback
-    return _clean_number(all_numbers[0])
+    for m in all_numbers:
+        if not _is_year_like(m.group(1).replace(",", "")):
+            break
+    else:
+        # All numbers looked like years — return first as fallback
+        m = all_numbers[0]
+    raw = m.group(1)
+    return _clean_number(raw), m.start(), m.end(), "number", None, raw
 
 
-def _clean_number(raw):
+def _value_units(text: str, metric_name: str | None, start: int, end: int,
+                 kind: str, scale: str | None, raw: str | None) -> str | None:
     """
-    Convert a raw number string to a float.
-    Handles commas in both Western (1,000) and Indian (1,00,000) formats.
-    
-    Args:
-        raw (str): A number string like "7.5", "1,00,000", "-2.3"
-    
-    Returns:
-        float: The cleaned number
+    Currency of the value at text[start:end] (ISO 4217), or None.
+    Percentages have none. For monetary metrics an unstated currency is
+    inferred from Indian scales / digit grouping (see units.infer_currency);
+    for everything else only a currency written next to the number counts.
     """
-    cleaned = raw.replace(",", "")
-    return float(cleaned)
+    if kind == "percentage":
+        return None
+    stated = currency_near(text, start, end)
+    if metric_name in METRIC_CURRENCIES:
+        return infer_currency(stated, scale, raw)
+    return stated
 
 
-def extract_country(text: str) -> str:
+def extract_country(text: str, default: str = DEFAULT_COUNTRY) -> str:
     """
     N-19: Extract the country being referenced and return its ISO 3166 alpha-3 code.
     Defaults to "IND" (India) if no country is found — B-ware is India-focused.
 
-    Supported countries: India, USA, UK, China, Japan, Germany, France,
-                         Brazil, Canada, Australia, South Korea.
+    Covers all 249 ISO 3166 countries via the countries.py gazetteer. When
+    several are mentioned, the first one in the text wins.
+    """
+    return resolve_country(text) or default
+
+
+def _value_type(metric_name: str | None, text: str) -> str:
+    """
+    N-20: value_type — "percentage" vs "absolute".
+    Determined by metric type; presence of % symbol is a secondary signal.
     """
-    for pattern, iso3 in _COUNTRY_PATTERNS:
-        if pattern.search(text):
-            return iso3
-    return "IND"   # default — most B-ware claims are about India
+    if metric_name in PERCENTAGE_METRICS:
+        return "percentage"
+    if _RE_PERCENT_NEAR.search(text):
+        return "percentage"
+    return "absolute"
+
+
+def _overall_confidence(metric_confidence: float, value, year) -> float:
+    """
+    N-9 confidence formula.
+    Weights: metric = 50%, value = 30%, year = 20%
+    All components scaled by metric_confidence so a weak metric match caps the score.
+    """
+    if metric_confidence == 0.0:
+        return 0.0
+    weight = 0.50  # metric is always present if confidence > 0
+    if value is not None:
+        weight += 0.30
+    if year is not None:
+        weight += 0.20
+    return round(metric_confidence * weight, 2)
+
+
+# Results keyed on the preprocessed text, shared by every endpoint (see memo.py)
+_extraction_memo = LruMemo("extract_all")
 
 
 # extract_all(text) — The Orchestrator
@@ -230,43 +339,85 @@ def extract_country(text: str) -> str:
 #   - Missing fields reduce confidence proportionally
 # =============================================================================
 
-def extract_all(text: str) -> dict:
+def extract_all(text: str, reference_date: date | datetime | None = None) -> dict:
     """
     Orchestrates all extractors and returns a unified result dict.
     This is the only function main.py endpoints call directly.
+
+    reference_date anchors relative periods ("last year") — pass the
+    article's publish date when you have it; defaults to today.
     """
-    # Sanitize input before anything else runs
-    text = preprocess_claim(text)
+    # Sanitize input before anything else runs, then serve repeats from the memo.
+    # The memo key includes the reference date: "last year" means different
+    # years for different articles.
+    # Copy so a caller mutating its result can't corrupt the cached entry.
+    key = (preprocess_claim(text), as_reference_date(reference_date))
+    return dict(_extraction_memo.get_or_compute(key, _extract_keyed))
 
-    # ---- STEP 1: Extract each field independently ----
-    metric_result = find_metric(text)       # {"metric": ..., "confidence": ...}
-    value         = extract_value(text)     # float | None
-    year          = extract_year(text)      # int   | None
-    country       = extract_country(text)   # ISO3 str  (N-19)
+
+def _extract_keyed(key: tuple[str, date]) -> dict:
+    return _extract_normalized(*key)
+
+
+def _extract_normalized(text: str, reference_date: date | datetime | None = None) -> dict:
+    """extract_all() minus preprocessing — *text* must already be sanitized."""
+    # ---- STEP 1: Extract each field from the shared token stages (lexer.py) ----
+    lexed         = lex(text)
+    metric_result = lexed.metric                        # {"metric": ..., "confidence": ...}
+    located       = _locate_value(text, lexed.folded)   # (value, start, end, kind, scale, raw) | None
+    value         = located[0] if located else None
+    year          = _lexed_year(lexed, reference_date)  # int | None
+    country       = lexed.countries[0][2] if lexed.countries else DEFAULT_COUNTRY   # N-19
 
     # ---- STEP 2: N-20 — value_type: percentage vs absolute ----
-    # Determined by metric type; presence of % symbol is a secondary signal.
+    # A "7%" / "8 percent" anywhere is exactly a percentage value from
+    # _locate_value(), which takes it before anything else
     metric_name = metric_result["metric"]
-    if metric_name in PERCENTAGE_METRICS:
-        value_type = "percentage"
-    elif _RE_PERCENT_NEAR.search(text):
+    if metric_name in PERCENTAGE_METRICS or (located is not None and located[3] == "percentage"):
         value_type = "percentage"
     else:
         value_type = "absolute"
+    scale       = located[4] if located else None
+    currency    = _value_units(text, metric_name, *located[1:]) if located else None
 
     # ---- STEP 3: N-9 — Improved confidence formula ----
-    # Weights: metric = 50%, value = 30%, year = 20%
-    # All components scaled by metric_confidence so a weak metric match caps the score.
-    metric_confidence = metric_result["confidence"]
-    if metric_confidence == 0.0:
-        overall_confidence = 0.0
-    else:
-        weight = 0.50  # metric is always present if confidence > 0
-        if value is not None:
-            weight += 0.30
-        if year is not None:
-            weight += 0.20
-        overall_confidence = round(metric_confidence * weight, 2)
+    overall_confidence = _overall_confidence(metric_result["confidence"], value, year)
+
+    # ---- STEP 4: Build and return the response ----
+    return {
+        "original_text": text,
+        "metric":        metric_name,
+        "value":         value,
+        "year":          year,
+        "country":       country,       # N-19
+        "value_type":    value_type,    # N-20
+        "currency":      currency,
+        "scale":         scale,
+        "confidence":    overall_confidence,
+    }
+
+
+def _extract_normalized_reference(text: str, reference_date: date | datetime | None = None) -> dict:
+    """
+    Reference implementation: _extract_normalized() with every field
+    extracted by its own scan of the text, as before lexer.py. Kept so
+    tests and benchmarks/bench_lexer.py can check the shared stages.
+    """
+    # ---- STEP 1: Extract each field independently ----
+    metric_result = find_metric(text)       # {"metric": ..., "confidence": ...}
+    located       = _locate_value(text)     # (value, start, end, kind, scale, raw) | None
+    value         = located[0] if located else None
+    year          = extract_year(text, reference_date)   # int | None
+    country       = extract_country(text)   # ISO3 str  (N-19)
+
+    # ---- STEP 2: N-20 — value_type: percentage vs absolute ----
+    metric_name = metric_result["metric"]
+    value_type  = _value_type(metric_name, text)
+    scale       = located[4] if located else None
+    currency    = _value_units(text, metric_name, *located[1:]) if located else None
+
+    # ---- STEP 3: N-9 — Improved confidence formula ----
+    overall_confidence = _overall_confidence(metric_result["confidence"], value, year)
 
     # ---- STEP 4: Build and return the response ----
     return {
@@ -276,9 +427,347 @@ def extract_all(text: str) -> dict:
         "year":          year,
         "country":       country,       # N-19
         "value_type":    value_type,    # N-20
+        "currency":      currency,
+        "scale":         scale,
         "confidence":    overall_confidence,
     }
 
+
+# =============================================================================
+# extract_many(texts) — Batch mode
+# WHAT IT DOES:
+#   Same result as [extract_all(t) for t in texts], minus the repeated work:
+#     1. each distinct raw text is preprocessed once
+#     2. texts that normalize to the same string are extracted once
+#        ("GDP grew 7%" and "GDP  grew 7%" share one extraction)
+#   Backfill jobs send tens of thousands of headlines with heavy duplication,
+#   so the saving grows with the duplicate ratio.
+# =============================================================================
+
+def extract_many(
+    texts: list[str],
+    reference_date: date | datetime | None = None,
+) -> list[dict | None]:
+    """
+    Extract every text in *texts*, in order.
+
+    Each result is a fresh dict (callers may mutate it). If extraction of a
+    text raises, its slot is None instead of failing the whole batch.
+    All texts share one reference_date (see extract_all).
+    """
+    ref = as_reference_date(reference_date)
+    normalized_by_raw: dict[str, str] = {}
+    results_by_norm: dict[str, dict | None] = {}
+    out: list[dict | None] = []
+
+    for raw in texts:
+        norm = normalized_by_raw.get(raw)
+        if norm is None:
+            norm = normalized_by_raw[raw] = preprocess_claim(raw)
+
+        if norm in results_by_norm:
+            result = results_by_norm[norm]
+        else:
+            try:
+                result = _extraction_memo.get_or_compute((norm, ref), _extract_keyed)
+            except Exception:
+                result = None
+            results_by_norm[norm] = result
+
+        out.append(dict(result) if result is not None else None)
+
+    return out
+
+# =============================================================================
+# extract_claims(text) — Multi-claim mode
+# WHAT IT DOES:
+#   extract_all() answers "what ONE claim is this text making?" and throws the
+#   rest away: "GDP grew from 6% in 2023 to 7.5% in 2024" becomes (6.0, 2024).
+#   extract_claims() makes one left-to-right pass over the text and returns
+#   EVERY (metric, value, year, country) tuple with the character span it
+#   came from, so callers can fan out without re-splitting the text.
+#
+# PAIRING RULES (each value anchors one claim):
+#   metric  — last metric mention before the value (since the previous value),
+#             else the first one after it, else carried over from earlier
+#             ("GDP grew from 6% ... to 7.5%" → both are GDP)
+#   year    — first year after the value (before the next value),
+#             else the last year between the previous value and this one,
+#             else the closest year anywhere in the text
+#   country — last country mention before the value, else the first one in
+#             the text, else "IND"
+# =============================================================================
+
+def extract_claims(text: str, reference_date: date | datetime | None = None) -> list[dict]:
+    """
+    Return every claim in *text* as a list of dicts.
+
+    Each dict has the same keys as extract_all() — original_text (the claim's
+    own span text), metric, value, year, country, value_type, currency,
+    scale, confidence —
+    plus "span": [start, end], character offsets into the preprocessed text.
+
+    A text with a metric but no numbers yields a single value-less claim;
+    a text with neither yields [].
+    reference_date anchors relative periods, as in extract_all().
+    """
+    text = preprocess_claim(text)
+    lexed = lex(text)
+
+    values, years = lexed.claim_tokens(reference_date)
+    metrics   = lexed.metric_mentions          # [(start, end, name, confidence)]
+    countries = [(start, iso3) for start, _, iso3 in lexed.countries]
+
+    if not values:
+        if not metrics:
+            return []
+        metric_result = lexed.metric
+        year = _lexed_year(lexed, reference_date)
+        first = metrics[0]
+        return [{
+            "original_text": text,
+            "metric":        metric_result["metric"],
+            "value":         None,
+            "year":          year,
+            "country":       countries[0][1] if countries else DEFAULT_COUNTRY,
+            "value_type":    _value_type(metric_result["metric"], text),
+            "currency":      None,
+            "scale":         None,
+            "confidence":    _overall_confidence(metric_result["confidence"], None, year),
+            "span":          [first[0], len(text)],
+        }]
+
+    claims = []
+    carried_metric = None
+    owned_year = None   # year token already taken by the previous claim
+    for i, (v_start, v_end, value, kind, scale) in enumerate(values):
+        prev_end   = values[i - 1][1] if i > 0 else 0
+        next_start = values[i + 1][0] if i + 1 < len(values) else len(text)
+
+        # ---- metric ----
+        before = [m for m in metrics if prev_end <= m[0] < v_start]
+        after  = [m for m in metrics if v_end <= m[0] < next_start]
+        if before:
+            metric = before[-1]
+        elif after and carried_metric is None:
+            metric = after[0]
+        else:
+            metric = carried_metric
+        if metric is not None:
+            carried_metric = metric
+
+        # ---- year ----
+        year_after  = [y for y in years if v_end <= y[0] < next_start]
+        year_before = [y for y in years if prev_end <= y[0] < v_start and y is not owned_year]
+        if year_after:
+            year = year_after[0]
+        elif year_before:
+            year = year_before[-1]
+        elif years:
+            year = min(years, key=lambda y: min(abs(y[0] - v_end), abs(v_start - y[1])))
+        else:
+            year = None
+        owned_year = year if year in year_after else None
+
+        # ---- country ----
+        country_before = [c for c in countries if c[0] < v_start]
+        if country_before:
+            country = country_before[-1][1]
+        elif countries:
+            country = countries[0][1]
+        else:
+            country = DEFAULT_COUNTRY
+
+        # ---- span: own metric mention (if not shared) → value → own year ----
+        start = v_start
+        if metric is not None and prev_end <= metric[0] < v_start:
+            start = metric[0]
+        if year in year_before:
+            start = min(start, year[0])
+        end = v_end
+        if year is not None and v_end <= year[0] < next_start:
+            end = year[1]
+
+        metric_name = metric[2] if metric else None
+        metric_conf = metric[3] if metric else 0.0
+        year_value  = year[2] if year else None
+        if metric_name in PERCENTAGE_METRICS or kind == "percentage":
+            value_type = "percentage"
+        else:
+            value_type = "absolute"
+
+        claims.append({
+            "original_text": text[start:end],
+            "metric":        metric_name,
+            "value":         value,
+            "year":          year_value,
+            "country":       country,
+            "value_type":    value_type,
+            "currency":      _value_units(text, metric_name, v_start, v_end, kind, scale, text[v_start:v_end]),
+            "scale":         scale,
+            "confidence":    _overall_confidence(metric_conf, value, year_value),
+            "span":          [start, end],
+        })
+
+    return claims
+
+
+# =============================================================================
+# extract_trend(text) — Trend / range claims
+# WHAT IT DOES:
+#   "Inflation fell from 7% in 2022 to 5.4% in 2023" is one claim about two
+#   data points, not two unrelated claims. extract_trend() recognises the two
+#   shapes below and returns both endpoints so Tier 1 can check them against
+#   ONE World Bank series fetch.
+#
+#   range  — "from A (in Y1) to B (in Y2)"
+#            "rose from 6% to 7.5% between 2022 and 2023"
+#   change — "fell by 1.6 percentage points between 2022 and 2023"
+#            "population grew by 12% from 2011 to 2021"
+#
+# WHY "%" IS NOT A CHANGE FOR RATES:
+#   "GDP grew by 7% between 2022 and 2023" is a growth-rate LEVEL, not a
+#   7-point change in the growth rate. For percentage metrics only explicit
+#   point units (percentage points, pp, basis points) count as a change;
+#   for absolute metrics "%" means a relative change.
+# =============================================================================
+
+_RE_YEAR_RANGE = re.compile(
+    r"\b(?:between|from)\s+((?:19|20)\d{2})\s*(?:and|to|-|–)\s*((?:19|20)\d{2})\b",
+    re.IGNORECASE,
+)
+_RE_CHANGE_BY = re.compile(
+    r"\bby\s+(?P<num>\d+(?:\.\d+)?)\s*"
+    r"(?P<unit>percentage\s+points?|pp\b|points?\b|basis\s+points?|bps?\b|%|percent\b|per\s*cent\b)",
+    re.IGNORECASE,
+)
+_RE_DIRECTION = re.compile(
+    r"\b(?:(?P<up>rose|risen|rises|rising|increased?|increases|increasing|grew|grown|grows|growing"
+    r"|climbed|jumped|surged|up)"
+    r"|(?P<down>fell|fallen|falls|falling|declined?|declines|declining|dropped|drops|decreased?"
+    r"|decreases|decreasing|slipped|slid|eased|down))\b",
+    re.IGNORECASE,
+)
+_RE_FROM = re.compile(r"\bfrom\b", re.IGNORECASE)
+_RE_TO   = re.compile(r"\bto\b", re.IGNORECASE)
+
+
+def _direction(text: str) -> str | None:
+    """"up" / "down" from the first direction verb in *text*, or None."""
+    m = _RE_DIRECTION.search(text)
+    if m is None:
+        return None
+    return "up" if m.group("up") else "down"
+
+
+def _year_range(text: str, years) -> tuple[int, int] | None:
+    """
+    Explicit "between Y1 and Y2" / "from Y1 to Y2", else the first two
+    distinct years. None unless the span runs forward (Y1 < Y2): Tier 1
+    can't check a trend over no time or backwards in time.
+    """
+    m = _RE_YEAR_RANGE.search(text)
+    if m:
+        span = int(m.group(1)), int(m.group(2))
+    else:
+        distinct = list(dict.fromkeys(y[2] for y in years))
+        if len(distinct) < 2:
+            return None
+        span = distinct[0], distinct[1]
+    return span if span[0] < span[1] else None
+
+
+def extract_trend(text: str, reference_date: date | datetime | None = None) -> dict | None:
+    """
+    Return the trend claim in *text*, or None if it isn't one.
+
+    Keys: original_text, kind ("range" | "change"), metric, country,
+    start_year, end_year, start_value, end_value (range only), change
+    (signed; end − start for ranges), change_unit ("absolute" — same units
+    as the metric, i.e. points for rates — or "relative" — percent change),
+    currency (of the endpoints, ranges only),
+    direction ("up" | "down" | None), confidence.
+    reference_date anchors relative periods, as in extract_all().
+    """
+    text = preprocess_claim(text)
+    lexed = lex(text)
+    values, years = lexed.claim_tokens(reference_date)
+
+    # ---- range: "from <value> ... to <value>" ----
+    for i in range(len(values) - 1):
+        v1, v2 = values[i], values[i + 1]
+        prev_end = values[i - 1][1] if i > 0 else 0
+        if not (_RE_FROM.search(text, prev_end, v1[0]) and _RE_TO.search(text, v1[1], v2[0])):
+            continue
+        claims = extract_claims(text, reference_date)
+        first, second = claims[i], claims[i + 1]
+        metric = first["metric"] or second["metric"]
+        if metric is None:
+            continue
+        start_year, end_year = first["year"], second["year"]
+        if start_year is None or end_year is None or start_year == end_year:
+            span = _year_range(text, years)
+            if span is None:
+                continue
+            start_year, end_year = span
+        if start_year >= end_year:
+            return None   # "from 4% in 2021 to 5% in 2019" — backwards in time
+        return {
+            "original_text": text,
+            "kind":          "range",
+            "metric":        metric,
+            "country":       first["country"],
+            "start_year":    start_year,
+            "end_year":      end_year,
+            "start_value":   v1[2],
+            "end_value":     v2[2],
+            "change":        round(v2[2] - v1[2], 6),
+            "change_unit":   "absolute",
+            "currency":      first["currency"] or second["currency"],
+            "direction":     "up" if v2[2] > v1[2] else "down" if v2[2] < v1[2] else None,
+            "confidence":    min(first["confidence"], second["confidence"]),
+        }
+
+    # ---- change: "<direction> by <amount> <unit> between Y1 and Y2" ----
+    m = _RE_CHANGE_BY.search(text)
+    if m is None:
+        return None
+    direction = _direction(text[:m.start()])
+    span = _year_range(text, years)
+    metric_result = lexed.metric
+    metric = metric_result["metric"]
+    if direction is None or span is None or metric is None:
+        return None
+
+    amount = float(m.group("num"))
+    unit = " ".join(m.group("unit").lower().split())
+    if unit.startswith(("basis", "bp")):
+        amount, change_unit = amount / 100, "absolute"
+    elif unit in ("%", "percent", "per cent"):
+        if metric in PERCENTAGE_METRICS:
+            return None   # "GDP grew by 7%" — a level, not a change (see above)
+        change_unit = "relative"
+    else:
+        change_unit = "absolute"
+
+    start_year, end_year = span
+    return {
+        "original_text": text,
+        "kind":          "change",
+        "metric":        metric,
+        "country":       lexed.countries[0][2] if lexed.countries else DEFAULT_COUNTRY,
+        "start_year":    start_year,
+        "end_year":      end_year,
+        "start_value":   None,
+        "end_value":     None,
+        "change":        amount if direction == "up" else -amount,
+        "change_unit":   change_unit,
+        "currency":      None,
+        "direction":     direction,
+        "confidence":    _overall_confidence(metric_result["confidence"], amount, end_year),
+    }
+
+
 if __name__ == "__main__":
 
     test_claims = [
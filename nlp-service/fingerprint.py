@@ -0,0 +1,126 @@
+"""
+fingerprint.py — Canonical claim fingerprint shared by the verification caches
+
+Answers: "Have we already verified THIS claim, however it was worded?"
+Example:
+    "India's GDP growth rate was 7.5 % in 2024"
+    "GDP grew 7.5% in 2024"
+    "In 2024 the GDP growth of India stood at 7.50 per cent"
+        → all three: GDP growth rate|IND|2024|7.5|-|affirmed|level
+
+WHY?
+  The caches used to key on the surface text: the router result cache on
+  MD5(text), the evidence cache on a query with str(claimed_value) in it,
+  and NLI not at all. A paraphrase, a trailing space or "7.50" vs "7.5"
+  missed every one of them and paid for World Bank + NewsAPI + NLI again.
+
+  Extraction (extractor.py) already normalises what the tiers actually
+  look at — metric, country, year (periods resolved), value (scale words
+  applied) and currency — so the fingerprint is built from those, once,
+  right after Layer 1:
+
+    metric     canonical metric name ("GDP growth rate")
+    country    ISO3 code
+    year       resolved year ("last year" is already a number here)
+    value      bucketed to 4 significant figures: "7.50" and "7.5" match,
+               and so do 1.4e12 written as "1.4 lakh crore" or "1,40,000 crore"
+    currency   stated / inferred currency (₹ and $ claims are different claims)
+    polarity   "negated" if the claim says not / never / no longer — the
+               numbers match but the claim means the opposite
+    shape      "level", or "range" / "change" for trend claims, with the
+               start point / change unit in detail
+
+The router and NLI caches use the full key. The evidence cache uses
+search_key — metric, country, year, value and currency only — because
+polarity and trend shape don't change what gets searched for.
+
+Direction words ("grew", "stood at") are deliberately NOT part of it: they
+don't change what Tier 1 or the evidence search look up.
+
+No metric or no value → no fingerprint; callers fall back to their old
+text keys, so unextractable text is never merged with anything else.
+"""
+
+import re
+from dataclasses import dataclass
+
+# "not", "never", "no longer", "didn't", "isn't", ... — a negated claim asserts the opposite
+_RE_NEGATION = re.compile(
+    r"n't\b|\b(?:not|never|no\s+longer|neither|nor|cannot|nowhere)\b",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class ClaimFingerprint:
+    metric: str
+    country: str
+    year: int | None
+    value: str                  # bucketed, see value_bucket()
+    currency: str | None
+    polarity: str               # "affirmed" | "negated"
+    shape: str = "level"        # "level" | "range" | "change"
+    detail: tuple = ()          # trend claims: (start_year, start bucket) or (start_year, change unit)
+
+    @property
+    def key(self) -> str:
+        """Stable string form, used as the cache key everywhere."""
+        parts = [
+            self.metric, self.country, str(self.year), self.value,
+            self.currency or "-", self.polarity, self.shape, *map(str, self.detail),
+        ]
+        return "|".join(parts)
+
+    @property
+    def search_key(self) -> str:
+        """
+        Key for the evidence search: only the fields the search query is
+        built from. "not 7.5%" and "fell from 8% to 7.5%" search for the
+        same thing as "7.5%", so they get the same snippets.
+        """
+        return "|".join([self.metric, self.country, str(self.year), self.value, self.currency or "-"])
+
+
+def value_bucket(value: float) -> str:
+    """4 significant figures — absorbs "7.50" vs "7.5" and float noise from scale words."""
+    return f"{value:.4g}"
+
+
+def claim_polarity(text: str) -> str:
+    return "negated" if _RE_NEGATION.search(text) else "affirmed"
+
+
+def claim_fingerprint(extraction: dict, text: str, trend: dict | None = None) -> ClaimFingerprint | None:
+    """
+    Fingerprint of an extract_all() / extract_claims() result (or, when
+    *trend* is given, of the extract_trend() result). None if there is no
+    metric or value to key on.
+    """
+    polarity = claim_polarity(text)
+    if trend is not None:
+        if trend["kind"] == "range":
+            value, detail = trend["end_value"], (trend["start_year"], value_bucket(trend["start_value"]))
+        else:
+            value, detail = trend["change"], (trend["start_year"], trend["change_unit"])
+        return ClaimFingerprint(
+            metric=trend["metric"],
+            country=trend["country"],
+            year=trend["end_year"],
+            value=value_bucket(value),
+            currency=trend.get("currency"),
+            polarity=polarity,
+            shape=trend["kind"],
+            detail=detail,
+        )
+
+    metric, value = extraction.get("metric"), extraction.get("value")
+    if metric is None or value is None:
+        return None
+    return ClaimFingerprint(
+        metric=metric,
+        country=extraction.get("country") or "IND",
+        year=extraction.get("year"),
+        value=value_bucket(value),
+        currency=extraction.get("currency"),
+        polarity=polarity,
+    )
@@ -0,0 +1,96 @@
+"""
+incremental.py — Sentence-level incremental re-analysis for live-edited documents
+
+The AnalyzePage re-posts the whole paragraph to /analyze as the user types.
+Every keystroke burst used to re-score, re-extract and re-build the
+response for EVERY sentence, although at most one or two changed.
+
+POST /analyze/incremental sends a document id with the new text. We keep
+the previous version's per-sentence results for that id and diff at
+sentence level:
+
+    v1: [A, B, C]          → analyze A, B, C
+    v2: [A, B', C]         → reuse A and C, analyze B' only
+    v3: [A, C, B', D]      → reuse A, C, B' (moves are free), analyze D
+
+Sentences are matched by their exact raw text (claim_detector.
+sentence_chunks — the text cut where split_into_sentences() would cut it),
+so a moved or duplicated sentence is still a hit, and only changed
+sentences are even re-split. Results also depend on the reference date
+("last year"), so a different reference date starts the document over.
+
+The store is an LruMemo (memo.py) keyed by document id — bounded by
+INCREMENTAL_DOC_LIMIT documents (default 1024), and its counters show up
+in GET /cache/stats: hits = sentences reused, misses = sentences analyzed.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from memo import LruMemo
+
+DEFAULT_DOC_LIMIT = int(os.getenv("INCREMENTAL_DOC_LIMIT", "1024"))
+
+
+@dataclass(frozen=True)
+class IncrementalUpdate:
+    results: list[Any]     # one per sentence, in order
+    reanalyzed: int        # distinct sentences passed to analyze()
+    reused: int            # sentences served from the previous version
+    version: int           # 1 for a new (or restarted) document
+
+
+class DocumentStore(LruMemo):
+    """Latest sentence → result map per document id."""
+
+    def __init__(self, name: str = "analyze_incremental", maxsize: int = DEFAULT_DOC_LIMIT):
+        super().__init__(name, maxsize)
+
+    def update(
+        self,
+        doc_id: str,
+        sentences: list[str],
+        context: Hashable,
+        analyze: Callable[[list[str]], list[Any]],
+    ) -> IncrementalUpdate:
+        """
+        Results for *sentences*, calling analyze() only on the ones the
+        previous version of *doc_id* didn't have. *context* is everything
+        else the results depend on (the reference date); when it changes,
+        nothing is reused.
+
+        analyze(new_sentences) must return one result per sentence. If it
+        raises, the stored version is left as it was.
+        """
+        with self._lock:
+            state = self._items.get(doc_id)
+            if state is not None:
+                self._items.move_to_end(doc_id)
+
+        if state is not None and state[0] == context:
+            version, previous = state[1] + 1, state[2]
+        else:
+            version, previous = 1, {}
+
+        missing = list(dict.fromkeys(s for s in sentences if s not in previous))
+        fresh = dict(zip(missing, analyze(missing))) if missing else {}
+
+        results, current = [], {}
+        for sentence in sentences:
+            result = previous[sentence] if sentence in previous else fresh[sentence]
+            current[sentence] = result
+            results.append(result)
+        reused = len(sentences) - sum(1 for s in sentences if s in fresh)
+
+        with self._lock:
+            self.hits += reused
+            self.misses += len(missing)
+            if self.maxsize > 0:
+                self._items[doc_id] = (context, version, current)
+                self._items.move_to_end(doc_id)
+                while len(self._items) > self.maxsize:
+                    self._items.popitem(last=False)
+                    self.evictions += 1
+
+        return IncrementalUpdate(results=results, reanalyzed=len(missing), reused=reused, version=version)
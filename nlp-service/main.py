@@ -16,24 +16,38 @@ To run:
 Swagger docs: http://localhost:5001/docs
 """
 import asyncio
+import codecs
+import hashlib
 import logging
 import os
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 from pydantic import BaseModel, Field
+from starlette.requests import ClientDisconnect
 
-from claim_detector import split_into_sentences, score_claim_probability, detect_claim_language
-from extractor import extract_all, preprocess_claim
+from claim_classifier import classifier_stats, filter_claims
+from claim_detector import (
+    SentenceSplitter, split_into_sentences, sentence_chunks, score_claim_probability, score_claims_batch,
+    detect_claim_language, language_gate_stats,
+)
+from extractor import extract_all, extract_claims, extract_many, preprocess_claim
+from incremental import DocumentStore
+from memo import LruMemo, all_stats as memo_stats
 from metrics import get_all_metric_names
+from periods import as_reference_date
 from swagger_ui import get_swagger_html, tags_metadata
+from verifier import http_client, indicator_store, warmup
 from verifier.tier1_numeric import tier1_numeric_check
-from verifier.verdict_router import route_verification, VerificationResult
+from verifier.verdict_router import route_verification, verify_claims, VerificationResult
 
 logging.basicConfig(
     level=logging.INFO,
@@ -53,11 +67,17 @@ class ClaimRequest(BaseModel):
         max_length=2000,
         description="The raw claim text to analyze. Can be a single sentence or a full paragraph.",
     )
+    reference_date: datetime | None = Field(
+        None,
+        description="When the claim was made (e.g. the article's published_at). Anchors relative "
+                    "periods like 'last year' or 'this fiscal'. Defaults to today.",
+    )
 
     model_config = {
         "json_schema_extra": {
             "example": {
-                "text": "India's GDP growth rate stood at 7.5 percent in 2024"
+                "text": "India's GDP growth rate stood at 7.5 percent in 2024",
+                "reference_date": "2025-02-01T09:30:00Z"
             }
         }
     }
@@ -70,6 +90,8 @@ class ExtractionResponse(BaseModel):
     value: float | None = None
     year: int | None = None
     value_type: str | None = None   # N-20: "percentage" | "absolute"
+    currency: str | None = None     # ISO 4217, stated ("₹", "$") or inferred (lakh/crore)
+    scale: str | None = None        # word-form multiplier applied: "lakh", "crore", "billion", ...
     confidence: float
 
     model_config = {
@@ -131,6 +153,53 @@ class MetricsListResponse(BaseModel):
     }
 
 
+class MemoStats(BaseModel):
+    """Counters for one in-process LRU memo (see memo.py)."""
+    name: str
+    size: int
+    maxsize: int | None     # None = bounded by TTL only
+    hits: int
+    misses: int
+    evictions: int
+    hit_rate: float
+
+
+class CacheStatsResponse(BaseModel):
+    """Hit / miss / eviction counters for the shared extraction memos."""
+    memos: list[MemoStats]
+    language_paths: dict[str, int] = Field(
+        default_factory=dict,
+        description="How many language checks each path decided: cache, script, keyword, detector, fallback",
+    )
+    claim_classifier: dict[str, int | bool] = Field(
+        default_factory=dict,
+        description="Whether the learned claim filter is on, and how many /analyze candidates it scored / rejected",
+    )
+    http_pool: dict = Field(
+        default_factory=dict,
+        description="Shared upstream HTTP client: pool limits, open / idle connections, requests vs new connections per host",
+    )
+    tier1_warmup: dict | None = Field(
+        default=None,
+        description="Last Tier 1 warm-up run (TIER1_WARMUP=1): bulk requests vs the per-claim path, series cached, failures",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "memos": [
+                    {"name": "extract_all", "size": 812, "maxsize": 4096, "hits": 5310,
+                     "misses": 812, "evictions": 0, "hit_rate": 0.8674},
+                    {"name": "score_claim_probability", "size": 1930, "maxsize": 4096, "hits": 7021,
+                     "misses": 1930, "evictions": 0, "hit_rate": 0.7844}
+                ],
+                "language_paths": {"cache": 412, "script": 9, "keyword": 318, "detector": 57, "fallback": 2},
+                "claim_classifier": {"enabled": True, "scored": 1530, "rejected": 212}
+            }
+        }
+    }
+
+
 class BatchRequest(BaseModel):
     """What the client sends for a batch extraction."""
     claims: list[str] = Field(
@@ -175,11 +244,48 @@ class BatchResponse(BaseModel):
 # N-5 — PARAGRAPH ANALYSIS RESPONSE MODELS
 # =============================================================================
 
+class ClaimSpan(BaseModel):
+    """
+    One claim found inside a sentence by extract_claims().
+    span = [start, end] character offsets into extraction.original_text.
+    """
+    text: str
+    metric: str | None = None
+    value: float | None = None
+    year: int | None = None
+    country: str | None = None
+    value_type: str | None = None
+    currency: str | None = None
+    scale: str | None = None
+    confidence: float
+    span: list[int]
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "text": "7.5% in 2024",
+                "metric": "GDP growth rate",
+                "value": 7.5,
+                "year": 2024,
+                "country": "IND",
+                "value_type": "percentage",
+                "confidence": 0.9,
+                "span": [28, 40]
+            }
+        }
+    }
+
+
 class SentenceAnalysis(BaseModel):
-    """One sentence from the analyzed paragraph, with its claim probability and extraction."""
+    """
+    One sentence from the analyzed paragraph, with its claim probability and extraction.
+    `claims` lists every (metric, value, year, country) tuple in the sentence —
+    "GDP grew from 6% in 2023 to 7.5% in 2024" yields two.
+    """
     sentence: str
     claim_probability: float
     extraction: ExtractionResponse
+    claims: list[ClaimSpan] = []
 
     model_config = {
         "json_schema_extra": {
@@ -207,11 +313,18 @@ class ParagraphResponse(BaseModel):
       total_sentences       — total sentences found in the paragraph
       verified_count        — sentences that scored > 0.5 claim probability
       high_confidence_count — verified claims with extraction confidence ≥ 0.8
+      duplicate_sentences   — sentences served from the sentence cache, not re-analyzed
+      duplicate_ratio       — duplicate_sentences / total_sentences
       results               — per-claim sentence, probability and extraction data
     """
     total_sentences: int
     verified_count: int
     high_confidence_count: int
+    duplicate_sentences: int = Field(
+        0, description="Sentences answered from the sentence cache: repeats within this request "
+                       "or of sentences already analyzed by an earlier one",
+    )
+    duplicate_ratio: float = Field(0.0, description="duplicate_sentences / total_sentences")
     results: list[SentenceAnalysis]
 
     model_config = {
@@ -220,6 +333,8 @@ class ParagraphResponse(BaseModel):
                 "total_sentences": 3,
                 "verified_count": 2,
                 "high_confidence_count": 1,
+                "duplicate_sentences": 1,
+                "duplicate_ratio": 0.3333,
                 "results": [
                     {
                         "sentence": "India's GDP growth rate was 7.5% in 2024",
@@ -239,10 +354,74 @@ class ParagraphResponse(BaseModel):
     }
 
 
+class IncrementalAnalyzeRequest(BaseModel):
+    """A new version of a document being edited live (POST /analyze/incremental)."""
+    doc_id: str = Field(
+        ...,
+        min_length=1,
+        max_length=128,
+        description="Stable id for the document being edited (e.g. a client-generated UUID).",
+    )
+    text: str = Field(
+        ...,
+        max_length=20000,
+        description="The full current text of the document.",
+    )
+    reference_date: datetime | None = Field(
+        None,
+        description="Anchors relative periods, as in ClaimRequest. Changing it re-analyzes everything.",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "doc_id": "draft-6f1c2a",
+                "text": "India has been growing. GDP hit 7.5% in 2024. Inflation fell to 4.8%.",
+            }
+        }
+    }
+
+
+class IncrementalParagraphResponse(ParagraphResponse):
+    """
+    ParagraphResponse for one version of a live-edited document.
+
+      version               — 1 for a new document, +1 per update
+      reanalyzed_sentences  — sentences scored and extracted for this version
+      reused_sentences      — sentences carried over from the previous version
+    """
+    doc_id: str
+    version: int
+    reanalyzed_sentences: int
+    reused_sentences: int
+
+
+class StreamedClaim(SentenceAnalysis):
+    """
+    One NDJSON line of POST /analyze/stream: a SentenceAnalysis, plus the
+    sentence's position among every sentence of the document (0-based).
+    """
+    index: int
+
+
+class StreamSummary(BaseModel):
+    """The last NDJSON line of POST /analyze/stream — /analyze's counters."""
+    done: bool = True
+    total_sentences: int
+    verified_count: int
+    high_confidence_count: int
+    duplicate_sentences: int = 0
+    duplicate_ratio: float = 0.0
+
+
 class NumericCheckResult(BaseModel):
     """
     The result of comparing a claimed value against official World Bank data.
     Returned as part of QuickVerificationResult.
+
+    compared_value is claimed_value in the indicator's own currency — it
+    differs only when the claim was stated in another currency, and
+    conversion then says how it was converted.
     """
     official_value: float | None = None
     claimed_value: float | None = None
@@ -251,6 +430,8 @@ class NumericCheckResult(BaseModel):
     indicator_code: str | None = None
     source_url: str | None = None
     year: int | None = None
+    compared_value: float | None = None
+    conversion: str | None = None
 
     model_config = {
         "json_schema_extra": {
@@ -267,6 +448,49 @@ class NumericCheckResult(BaseModel):
     }
 
 
+class TrendCheckResult(BaseModel):
+    """
+    Claimed vs official numbers for a trend claim
+    ("inflation fell from 7% in 2022 to 5.4% in 2023").
+    Returned as part of FullVerificationResult.
+
+    kind:
+      range  — two endpoints; percentage_error is the worse of the two
+      change — a change over the period ("fell by 1.6 percentage points");
+               change_unit is "absolute" (points) or "relative" (percent)
+    """
+    kind: str
+    start_year: int | None = None
+    end_year: int | None = None
+    claimed_start: float | None = None
+    claimed_end: float | None = None
+    official_start: float | None = None
+    official_end: float | None = None
+    claimed_change: float | None = None
+    official_change: float | None = None
+    change_unit: str = "absolute"
+    direction: str | None = None
+    conversion: str | None = None   # currency conversion applied to the endpoints, if any
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "kind": "range",
+                "start_year": 2022,
+                "end_year": 2023,
+                "claimed_start": 7.0,
+                "claimed_end": 5.4,
+                "official_start": 6.7,
+                "official_end": 5.65,
+                "claimed_change": -1.6,
+                "official_change": -1.05,
+                "change_unit": "absolute",
+                "direction": "down"
+            }
+        }
+    }
+
+
 class QuickVerificationResult(BaseModel):
     """
     Response shape for POST /verify/quick (Tier 1 only).
@@ -375,11 +599,18 @@ class FullVerificationResult(BaseModel):
     indicator_code: str | None = None
     source_url: str | None = None
 
+    # Trend claims only
+    trend: TrendCheckResult | None = None
+
     # Evidence + explanation
     evidence: list[VerificationEvidenceItem] = []
     explanation: str
     tiers_run: list[str] = []
 
+    # POST /verify on a text with several claims: every claim's result, in
+    # text order (the fields above are the first one's)
+    claims: list["FullVerificationResult"] = []
+
     model_config = {
         "json_schema_extra": {
             "example": {
@@ -428,8 +659,246 @@ def _compute_verdict(percentage_error: float | None) -> tuple[str, str]:
 
 
 
+def _claim_span(claim: dict) -> ClaimSpan:
+    """Convert one extract_claims() dict into the ClaimSpan response model."""
+    return ClaimSpan(
+        text=claim["original_text"],
+        metric=claim["metric"],
+        value=claim["value"],
+        year=claim["year"],
+        country=claim["country"],
+        value_type=claim["value_type"],
+        currency=claim["currency"],
+        scale=claim["scale"],
+        confidence=claim["confidence"],
+        span=claim["span"],
+    )
+
+
+# Bulk input (long articles, ingestion jobs) is scored as one numpy batch;
+# a handful of sentences is cheaper through the memoized scalar scorer
+_BATCH_SCORE_MIN_SENTENCES = 32
+
+# Sentence-level cache for the analysis pipeline: trending articles from
+# different outlets repeat the same wire-copy sentences, and each article is
+# posted to /analyze on its own. Keyed on a hash of the sentence as the
+# splitter cleaned it (trimmed, closing punctuation dropped) plus the
+# reference date — the results carry the sentence text and claim spans, so
+# only text that analyzes identically may share an entry. Holds the
+# (claim probability, SentenceAnalysis or None) pair. Bounded by
+# SENTENCE_CACHE_SIZE entries (default 16384); shows up in /cache/stats.
+_sentence_cache = LruMemo("analyze_sentence", int(os.getenv("SENTENCE_CACHE_SIZE", "16384")))
+
+
+def _sentence_key(sentence: str, ref) -> tuple[bytes, object]:
+    return hashlib.blake2b(sentence.encode("utf-8"), digest_size=16).digest(), ref
+
+
+def _analyze_sentences(sentences: list[str], reference_date) -> tuple[list[SentenceAnalysis | None], int]:
+    """
+    /analyze's per-sentence work, with duplicates answered from the sentence
+    cache: (one SentenceAnalysis or None per sentence, how many sentences
+    were duplicates — repeats within *sentences* or of an earlier request).
+    Only the rest go through _analyze_new_sentences().
+    """
+    ref = as_reference_date(reference_date)
+    keys = [_sentence_key(sentence, ref) for sentence in sentences]
+    found: dict[tuple, tuple[float, SentenceAnalysis | None] | None] = {}
+    new = []
+    for sentence, key in zip(sentences, keys):
+        if key not in found:
+            found[key] = _sentence_cache.get(key)
+            if found[key] is None:
+                new.append((sentence, key))
+
+    for (sentence, key), pair in zip(new, _analyze_new_sentences([s for s, _ in new], ref)):
+        _sentence_cache.put(key, pair)
+        found[key] = pair
+    return [found[key][1] for key in keys], len(sentences) - len(new)
+
+
+def _analyze_new_sentences(sentences: list[str], reference_date) -> list[tuple[float, SentenceAnalysis | None]]:
+    """
+    Score each sentence (as one numpy batch when there are many), then
+    extract the likely claims in one batch: (claim probability,
+    SentenceAnalysis) per sentence, with None for sentences that aren't
+    claims (probability <= 0.5, or rejected by the optional learned
+    classifier) or whose extraction failed.
+    """
+    if len(sentences) >= _BATCH_SCORE_MIN_SENTENCES:
+        scored = list(zip(sentences, score_claims_batch(sentences).tolist()))
+    else:
+        scored = [(sentence, score_claim_probability(sentence)) for sentence in sentences]
+    claims = [(sentence, prob) for sentence, prob in scored if prob > 0.5]
+    claims = [claim for claim, keep in zip(claims, filter_claims([s for s, _ in claims])) if keep]
+    extractions = extract_many([sentence for sentence, _ in claims], reference_date)
+
+    analyses: dict[str, SentenceAnalysis] = {
+        sentence: SentenceAnalysis(
+            sentence=sentence,
+            claim_probability=round(prob, 2),
+            extraction=ExtractionResponse(**extraction),
+            claims=[_claim_span(c) for c in extract_claims(sentence, reference_date)],
+        )
+        for (sentence, prob), extraction in zip(claims, extractions)
+        if extraction is not None
+    }
+    return [(prob, analyses.get(sentence)) for sentence, prob in scored]
+
+
+def _paragraph_counts(
+    sentences: list[str], analyses: list[SentenceAnalysis | None], duplicates: int = 0,
+) -> dict:
+    """ParagraphResponse fields for a split paragraph and its per-sentence analyses."""
+    sentence_results = [a for a in analyses if a is not None]
+    return dict(
+        total_sentences=len(sentences),
+        verified_count=len(sentence_results),
+        high_confidence_count=sum(
+            1 for r in sentence_results if r.extraction.confidence >= 0.8
+        ),
+        duplicate_sentences=duplicates,
+        duplicate_ratio=_duplicate_ratio(duplicates, len(sentences)),
+        results=sentence_results,
+    )
+
+
+def _duplicate_ratio(duplicates: int, total: int) -> float:
+    return round(duplicates / total, 4) if total else 0.0
+
+
+def _reject_non_english(text: str) -> None:
+    """N-24: 422 unless *text* is detected as English."""
+    lang = detect_claim_language(text)
+    if lang != "en":
+        raise HTTPException(
+            status_code=422,
+            detail=f"Only English claims are supported. Detected language: '{lang}'.",
+        )
+
+
+# POST /analyze/stream reads the body as it arrives and analyzes it in small
+# batches, so the first claim goes out before the rest is read and only the
+# sentence in progress plus one batch are held in memory:
+#   - the N-24 English check runs on the first _STREAM_LANGUAGE_SAMPLE
+#     characters, before the response starts (it can still be a 422)
+#   - body chunks are fed to the splitter _STREAM_FEED_CHARS at a time and
+#     the sentences analyzed in the threadpool in batches growing from
+#     _STREAM_FIRST_BATCH to _STREAM_BATCH_SENTENCES, so neither one huge
+#     chunk nor a big first batch delays the first line
+#   - a run of STREAM_MAX_SENTENCE_CHARS with no sentence boundary is
+#     analyzed as one sentence
+_STREAM_LANGUAGE_SAMPLE = 2000
+_STREAM_FEED_CHARS = 16_384
+_STREAM_FIRST_BATCH = 4
+_STREAM_BATCH_SENTENCES = 64
+_STREAM_MAX_SENTENCE_CHARS = int(os.getenv("STREAM_MAX_SENTENCE_CHARS", "8000"))
+
+
+class _BodyStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse whose content is still reading the request body.
+    The stock one also runs a disconnect listener that calls receive() —
+    it would swallow body chunks meant for request.stream(). Here a
+    disconnect shows up as ClientDisconnect from the body reader instead.
+    """
+
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+
+
+async def _decoded_body(request: Request):
+    """The request body as UTF-8 text pieces, as the client sends them."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    async for chunk in request.stream():
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+async def _sentence_batches(head: list[str], body):
+    """
+    Sentences of *head* then the rest of *body*, in lists of _STREAM_FIRST_BATCH
+    sentences doubling up to _STREAM_BATCH_SENTENCES — the first claims go
+    out after a few sentences' work, the rest in batches large enough to
+    score as one numpy batch.
+    """
+    splitter = SentenceSplitter(max_sentence_chars=_STREAM_MAX_SENTENCE_CHARS)
+    size = _STREAM_FIRST_BATCH
+
+    async def pieces():
+        for text in head:
+            yield text
+        async for text in body:
+            yield text
+
+    async def split():
+        async for text in pieces():
+            for i in range(0, len(text), _STREAM_FEED_CHARS):
+                yield splitter.feed(text[i:i + _STREAM_FEED_CHARS])
+        yield splitter.close()
+
+    async for sentences in split():
+        start = 0
+        while start < len(sentences):
+            yield sentences[start:start + size]
+            start += size
+            size = min(2 * size, _STREAM_BATCH_SENTENCES)
+
+
+async def _stream_claims(batches, reference_date):
+    """NDJSON: one StreamedClaim line per claim as its batch is done, then a StreamSummary."""
+    total = verified = high_confidence = duplicates = 0
+    try:
+        async for sentences in batches:
+            analyses, repeated = await run_in_threadpool(_analyze_sentences, sentences, reference_date)
+            duplicates += repeated
+            for offset, analysis in enumerate(analyses):
+                if analysis is None:
+                    continue
+                verified += 1
+                high_confidence += analysis.extraction.confidence >= 0.8
+                line = StreamedClaim(index=total + offset, **analysis.model_dump())
+                yield line.model_dump_json() + "\n"
+            total += len(sentences)
+    except ClientDisconnect:
+        return      # the client left mid-upload — nobody to send the rest to
+    summary = StreamSummary(
+        total_sentences=total, verified_count=verified, high_confidence_count=high_confidence,
+        duplicate_sentences=duplicates, duplicate_ratio=_duplicate_ratio(duplicates, total),
+    )
+    yield summary.model_dump_json() + "\n"
+
+
+# Previous version of each live-edited document (POST /analyze/incremental)
+_documents = DocumentStore()
+
+
 # THE FASTAPI APP
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled client for World Bank, Fact Check, NewsAPI and Gemini calls,
+    # so verifications reuse warm connections (verifier/http_client.py)
+    await http_client.startup()
+    # Load the local World Bank store before the first request, so every
+    # worker answers Tier 1 from memory from the start (verifier/indicator_store.py)
+    await run_in_threadpool(indicator_store.preload)
+    # TIER1_WARMUP=1: bulk-prefetch the indicators it doesn't hold into the
+    # Tier 1 cache, in the background and on a schedule (verifier/warmup.py)
+    warmup_task = warmup.start()
+    yield
+    if warmup_task is not None:
+        # Let a run in flight unwind before its pooled client is closed
+        warmup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup_task
+    await http_client.shutdown()
+
+
 app = FastAPI(
     title="B-ware NLP Service",
     version="1.0.0",
@@ -495,6 +964,7 @@ curl -X POST http://localhost:5001/analyze \\
     },
     openapi_tags=tags_metadata,
     docs_url=None,   # we override /docs below with custom settings
+    lifespan=lifespan,
 )
 
 # ---------------------------------------------------------------------------
@@ -586,8 +1056,9 @@ def extract_claim(request: ClaimRequest):
     Extract the economic metric, numeric value, and year from a **single claim sentence**.
 
     The extraction pipeline runs three steps in sequence:
-    1. **Metric detection** — matches against 10 supported economic indicators using
-       two-tier regex (strong patterns → 0.9 confidence, weak patterns → 0.6 confidence)
+    1. **Metric detection** — matches against 62 supported economic indicators using
+       two-tier regex (strong patterns → 0.9 confidence, weak patterns → 0.6 confidence),
+       looked up through a trigram index so only plausible patterns are run
     2. **Value extraction** — finds the numeric value, prioritising percentages over
        plain numbers. Handles Indian formats (1,72,000) and negative values.
     3. **Year extraction** — finds the most recent 4-digit year mentioned (1900–2099)
@@ -598,13 +1069,8 @@ def extract_claim(request: ClaimRequest):
     - `0.0` — metric not recognised
     """
     # N-24: Reject non-English input with a clear error
-    lang = detect_claim_language(request.text)
-    if lang != "en":
-        raise HTTPException(
-            status_code=422,
-            detail=f"Only English claims are supported. Detected language: '{lang}'.",
-        )
-    result = extract_all(request.text)
+    _reject_non_english(request.text)
+    result = extract_all(request.text, request.reference_date)
     return result
 
 @app.post(
@@ -631,20 +1097,19 @@ def batch_extract(request: BatchRequest):
     """
     results = []
 
-    for claim_text in request.claims:        # loop over the list
-        try:
-            result = extract_all(claim_text)     # same function /extract uses
-            results.append(result)
-        except Exception as e:
+    # extract_many normalizes each claim once and extracts duplicates once
+    for claim_text, result in zip(request.claims, extract_many(request.claims)):
+        if result is None:
             # If one claim fails, don't crash the whole batch.
             # Return a zeroed-out result for that claim instead.
-            results.append({
+            result = {
                 "original_text": claim_text,
                 "metric": None,
                 "value": None,
                 "year": None,
                 "confidence": 0.0
-            })
+            }
+        results.append(result)
 
     return {
         "results": results,
@@ -683,37 +1148,115 @@ def analyze_text(request: ClaimRequest):
 
     Only sentences scoring **above 0.5** are passed to the extractor.
     Commentary, questions, and context sentences are automatically filtered out.
+
+    Each result also carries `claims`: every metric/value/year/country tuple in
+    the sentence with its character span, so multi-claim sentences can be
+    verified claim-by-claim without another request.
     """
     # N-24: Reject non-English paragraphs before any processing
-    lang = detect_claim_language(request.text)
-    if lang != "en":
-        raise HTTPException(
-            status_code=422,
-            detail=f"Only English claims are supported. Detected language: '{lang}'.",
-        )
+    _reject_non_english(request.text)
 
     sentences = split_into_sentences(request.text)
-    sentence_results: list[SentenceAnalysis] = []
-
-    for sentence in sentences:
-        prob = score_claim_probability(sentence)
-        if prob > 0.5:
-            extraction = extract_all(sentence)
-            sentence_results.append(
-                SentenceAnalysis(
-                    sentence=sentence,
-                    claim_probability=round(prob, 2),
-                    extraction=ExtractionResponse(**extraction),
-                )
-            )
+    analyses, duplicates = _analyze_sentences(sentences, request.reference_date)
+    return ParagraphResponse(**_paragraph_counts(sentences, analyses, duplicates))
 
-    return ParagraphResponse(
-        total_sentences=len(sentences),
-        verified_count=len(sentence_results),
-        high_confidence_count=sum(
-            1 for r in sentence_results if r.extraction.confidence >= 0.8
-        ),
-        results=sentence_results,
+
+@app.post(
+    "/analyze/stream",
+    response_class=StreamingResponse,
+    tags=["Paragraph Analysis"],
+    summary="Analyze a document of any size, streaming claims as NDJSON",
+    response_description="One JSON line per claim as soon as it is extracted, then a summary line",
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+    openapi_extra={"requestBody": {
+        "required": True,
+        "content": {"text/plain": {"schema": {"type": "string"}}},
+    }},
+)
+async def analyze_stream(request: Request, reference_date: datetime | None = None):
+    """
+    `/analyze` for **full articles and transcripts** (no 2,000-character cap):
+    send the document as a plain-text (UTF-8) body, optionally with
+    `?reference_date=...`.
+
+    The body is read as it arrives, split into sentences and scored/extracted
+    in small batches. Each claim is written as one JSON line — a `/analyze`
+    result plus its sentence `index` — as soon as its batch is done, so the
+    first claims arrive while the rest of the document is still being read.
+    The last line is `{"done": true, ...}` with `/analyze`'s counters.
+
+    Memory stays bounded whatever the document size: only the sentence in
+    progress and one batch are held. The English check uses the opening
+    2,000 characters.
+
+    ```bash
+    curl -N -X POST http://localhost:5001/analyze/stream \\
+      -H "Content-Type: text/plain" --data-binary @article.txt
+    ```
+    """
+    body = _decoded_body(request)
+    head, read = [], 0
+    async for text in body:
+        head.append(text)
+        read += len(text)
+        if read >= _STREAM_LANGUAGE_SAMPLE:
+            break
+    # N-24: Reject non-English documents before the stream starts — in the
+    # threadpool, like the batches: langdetect is milliseconds of CPU
+    await run_in_threadpool(_reject_non_english, "".join(head)[:_STREAM_LANGUAGE_SAMPLE])
+
+    return _BodyStreamingResponse(
+        _stream_claims(_sentence_batches(head, body), reference_date),
+        media_type="application/x-ndjson",
+    )
+
+
+@app.post(
+    "/analyze/incremental",
+    response_model=IncrementalParagraphResponse,
+    tags=["Paragraph Analysis"],
+    summary="Re-analyze a live-edited document, reusing unchanged sentences",
+    response_description="Same shape as /analyze, plus version and reuse counters",
+)
+def analyze_incremental(request: IncrementalAnalyzeRequest):
+    """
+    `/analyze` for text that is being edited: send the **whole current text**
+    with a stable `doc_id` on every keystroke burst.
+
+    The service keeps the previous version's per-sentence results for that
+    `doc_id`, diffs at sentence level, and splits, scores and extracts **only
+    the sentences that changed**. The response is identical to `/analyze` on
+    the same text, with `reanalyzed_sentences` / `reused_sentences` showing
+    how much work the update actually cost.
+
+    The English check runs on the whole current text, exactly as `/analyze`
+    runs it, on the first version and whenever sentences change — an
+    unchanged resend checks nothing. Documents are kept in a bounded LRU (`INCREMENTAL_DOC_LIMIT`,
+    default 1024); an evicted document is simply analyzed in full again.
+    """
+    # One chunk of raw text per sentence — only changed chunks are re-split
+    chunks = sentence_chunks(request.text)
+    duplicates = 0
+
+    def analyze(changed: list[str]) -> list[list[tuple[str, SentenceAnalysis | None]]]:
+        nonlocal duplicates
+        # N-24 on the whole current text, as /analyze checks it: langdetect
+        # misreads short fragments ("Okay." → tl), so an edit alone can't be judged
+        _reject_non_english(request.text)
+        split = [split_into_sentences(chunk) for chunk in changed]
+        sentences = [sentence for part in split for sentence in part]
+        analyses, duplicates = _analyze_sentences(sentences, request.reference_date)
+        analyses = iter(analyses)
+        return [[(sentence, next(analyses)) for sentence in part] for part in split]
+
+    update = _documents.update(request.doc_id, chunks, as_reference_date(request.reference_date), analyze)
+    pairs = [pair for chunk_result in update.results for pair in chunk_result]
+    return IncrementalParagraphResponse(
+        **_paragraph_counts([s for s, _ in pairs], [a for _, a in pairs], duplicates),
+        doc_id=request.doc_id,
+        version=update.version,
+        reanalyzed_sentences=update.reanalyzed,
+        reused_sentences=update.reused,
     )
 
 
@@ -734,7 +1277,7 @@ def list_metrics():
     - Build dropdown filters in your frontend
     - Know when a claim falls outside the supported scope
 
-    The 10 supported metrics map directly to **World Bank and IMF indicator codes**
+    Every supported metric maps directly to a **World Bank indicator code**
     for data verification.
     """
     names = get_all_metric_names()
@@ -743,6 +1286,53 @@ def list_metrics():
         "count": len(names)
     }
 
+@app.get(
+    "/cache/stats",
+    response_model=CacheStatsResponse,
+    tags=["Service Info"],
+    summary="Extraction memo counters",
+    response_description="Size, hits, misses and evictions for each in-process memo"
+)
+def cache_stats():
+    """
+    Counters for the bounded LRU memos in front of `extract_all` and
+    `score_claim_probability`. Every endpoint shares these memos, so a claim
+    extracted by `/analyze` is a hit for `/verify/quick` a moment later.
+
+    Also lists the verification caches keyed on the claim fingerprint
+    (`verify_result`, `evidence`, `nli`); the TTL-bounded ones report
+    `maxsize: null`.
+
+    `language_paths` counts how the English check (N-24) was decided:
+    from its memo, by Unicode script, by an ASCII text naming a known
+    metric, or by full langdetect detection — only the last one is slow.
+
+    `indicator_store` (under `memos`) counts Tier 1 series lookups answered
+    from the local World Bank store (hits) vs sent to the API (misses);
+    `tier1_range_cache` counts those answered from series the warm-up
+    (`TIER1_WARMUP=1`) prefetched in bulk. `tier1_warmup` is the last
+    warm-up run's report: bulk requests vs the single-year requests the
+    per-claim path needs for the same data, or null before the first run.
+
+    `http_pool` describes the shared upstream HTTP client: open and idle
+    connections per host, and requests vs new TCP connections / TLS
+    handshakes — `reuse_rate` is the share of requests that skipped the
+    handshake.
+
+    `claim_classifier` counts the sentences the optional learned filter
+    (`CLAIM_CLASSIFIER=1`) scored and rejected before extraction — each
+    rejection is one verification that never runs.
+
+    Size per memo is set by the `EXTRACTION_MEMO_SIZE` env var (default 4096).
+    """
+    return {
+        "memos": memo_stats(),
+        "language_paths": language_gate_stats(),
+        "claim_classifier": classifier_stats(),
+        "tier1_warmup": warmup.last_report.as_dict() if warmup.last_report else None,
+        "http_pool": http_client.stats(),
+    }
+
 # =============================================================================
 # VERIFICATION ENDPOINTS (RAV Engine — Tier 1)
 # =============================================================================
@@ -779,7 +1369,7 @@ async def verify_quick(request: ClaimRequest):
     - For qualitative claims or deeper analysis, use `POST /verify` (coming soon).
     """
     # Step 1: Extract structured fields from the raw text
-    extraction = extract_all(request.text)
+    extraction = extract_all(request.text, request.reference_date)
 
     # Step 2: Run Tier 1 numeric check (async World Bank API call)
     t1 = await tier1_numeric_check(
@@ -787,6 +1377,7 @@ async def verify_quick(request: ClaimRequest):
         claimed_value=extraction["value"],
         year=extraction["year"],
         country=extraction.get("country", "IND") or "IND",   # N-19
+        currency=extraction.get("currency"),
     )
 
     # Step 3: If extraction failed entirely, return unverifiable immediately
@@ -812,6 +1403,8 @@ async def verify_quick(request: ClaimRequest):
         indicator_code=t1.indicator_code,
         source_url=t1.source_url,
         year=t1.year,
+        compared_value=t1.compared_value,
+        conversion=t1.conversion,
     )
 
     # Step 5: Compute verdict
@@ -821,7 +1414,8 @@ async def verify_quick(request: ClaimRequest):
     if t1.official_value is not None:
         explanation = (
             f"Claimed {t1.claimed_value} for '{extraction['metric']}' in {t1.year}. "
-            f"Official World Bank value: {t1.official_value:.4f}. "
+            + (f"Compared as {t1.conversion}. " if t1.conversion else "")
+            + f"Official World Bank value: {t1.official_value:.4f}. "
             f"{explanation_fragment} "
             f"Source: {t1.source_url}"
         )
@@ -857,6 +1451,39 @@ async def verify_quick(request: ClaimRequest):
 # FULL VERIFICATION ENDPOINTS (RAV Engine — Tier 1 + 2 + 3)
 # =============================================================================
 
+def _full_result(result: VerificationResult) -> FullVerificationResult:
+    """The API shape of one route_verification() result."""
+    return FullVerificationResult(
+        original_text=result.original_text,
+        tier_used=result.tier_used,
+        verdict=result.verdict,
+        confidence=result.confidence,
+        extracted_metric=result.extracted_metric,
+        extracted_value=result.extracted_value,
+        extracted_year=result.extracted_year,
+        extraction_confidence=result.extraction_confidence,
+        official_value=result.official_value,
+        percentage_error=result.percentage_error,
+        official_source=result.official_source,
+        indicator_code=result.indicator_code,
+        source_url=result.source_url,
+        trend=TrendCheckResult(**result.trend) if result.trend else None,
+        evidence=[
+            VerificationEvidenceItem(
+                source=e.source,
+                snippet=e.snippet,
+                url=e.url,
+                evidence_type=e.evidence_type,
+                nli_verdict=e.nli_verdict,
+                nli_score=e.nli_score,
+            )
+            for e in result.evidence
+        ],
+        explanation=result.explanation,
+        tiers_run=result.tiers_run,
+    )
+
+
 @app.post(
     "/verify",
     response_model=FullVerificationResult,
@@ -871,6 +1498,9 @@ async def verify_full(request: ClaimRequest):
     Routing logic:
     1. **Tier 1 (always)** — numeric World Bank check.
        If clear result (error < 5% or ≥ 20%) with high extraction confidence → return immediately.
+       Trend claims (*"inflation fell from 7% in 2022 to 5.4% in 2023"*, *"fell by 1.6
+       percentage points between 2022 and 2023"*) are checked here as one unit — both
+       endpoints or the claimed change — and reported in `trend`.
     2. **Tier 2** — fetch news + fact-check evidence, run NLI model over snippets.
        If NLI confidence ≥ 0.6 → return merged Tier 1 + Tier 2 verdict.
     3. **Tier 3** — Gemini 1.5 Flash LLM reasoning over all collected context.
@@ -878,11 +1508,16 @@ async def verify_full(request: ClaimRequest):
 
     Returns the `tier_used` field so you know which layer produced the verdict.
     Use `POST /verify/deep` to force all three tiers regardless of early exit conditions.
+
+    A text with several claims (*"GDP growth was 7.5% in 2024 while inflation fell
+    to 5.4%"*) is verified claim by claim, concurrently, each judged in the context
+    of the whole sentence: `claims` lists every result in text order and the
+    top-level fields are the first claim's. A trend is one claim.
     """
     clean_text = preprocess_claim(request.text)
     try:
-        result: VerificationResult = await asyncio.wait_for(
-            route_verification(clean_text, force_tier3=False),
+        results: list[VerificationResult] = await asyncio.wait_for(
+            verify_claims(clean_text, force_tier3=False, reference_date=request.reference_date),
             timeout=30.0,
         )
     except asyncio.TimeoutError:
@@ -900,34 +1535,10 @@ async def verify_full(request: ClaimRequest):
             explanation="Verification timed out after 30 seconds.",
             tiers_run=[],
         )
-    return FullVerificationResult(
-        original_text=result.original_text,
-        tier_used=result.tier_used,
-        verdict=result.verdict,
-        confidence=result.confidence,
-        extracted_metric=result.extracted_metric,
-        extracted_value=result.extracted_value,
-        extracted_year=result.extracted_year,
-        extraction_confidence=result.extraction_confidence,
-        official_value=result.official_value,
-        percentage_error=result.percentage_error,
-        official_source=result.official_source,
-        indicator_code=result.indicator_code,
-        source_url=result.source_url,
-        evidence=[
-            VerificationEvidenceItem(
-                source=e.source,
-                snippet=e.snippet,
-                url=e.url,
-                evidence_type=e.evidence_type,
-                nli_verdict=e.nli_verdict,
-                nli_score=e.nli_score,
-            )
-            for e in result.evidence
-        ],
-        explanation=result.explanation,
-        tiers_run=result.tiers_run,
-    )
+    full = [_full_result(result) for result in results]
+    if len(full) == 1:
+        return full[0]
+    return full[0].model_copy(update={"claims": full})
 
 
 @app.post(
@@ -954,7 +1565,7 @@ async def verify_deep(request: Request, body: ClaimRequest):
     clean_text = preprocess_claim(body.text)
     try:
         result: VerificationResult = await asyncio.wait_for(
-            route_verification(clean_text, force_tier3=True),
+            route_verification(clean_text, force_tier3=True, reference_date=body.reference_date),
             timeout=30.0,
         )
     except asyncio.TimeoutError:
@@ -972,34 +1583,7 @@ async def verify_deep(request: Request, body: ClaimRequest):
             explanation="Verification timed out after 30 seconds.",
             tiers_run=[],
         )
-    return FullVerificationResult(
-        original_text=result.original_text,
-        tier_used=result.tier_used,
-        verdict=result.verdict,
-        confidence=result.confidence,
-        extracted_metric=result.extracted_metric,
-        extracted_value=result.extracted_value,
-        extracted_year=result.extracted_year,
-        extraction_confidence=result.extraction_confidence,
-        official_value=result.official_value,
-        percentage_error=result.percentage_error,
-        official_source=result.official_source,
-        indicator_code=result.indicator_code,
-        source_url=result.source_url,
-        evidence=[
-            VerificationEvidenceItem(
-                source=e.source,
-                snippet=e.snippet,
-                url=e.url,
-                evidence_type=e.evidence_type,
-                nli_verdict=e.nli_verdict,
-                nli_score=e.nli_score,
-            )
-            for e in result.evidence
-        ],
-        explanation=result.explanation,
-        tiers_run=result.tiers_run,
-    )
+    return _full_result(result)
 
 
 # Run the server directly: python main.py
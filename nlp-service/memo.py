@@ -0,0 +1,126 @@
+"""
+memo.py — Bounded LRU memoization shared by the extraction pipeline
+
+The trending feed and user traffic resubmit the same claim texts constantly.
+Rather than each endpoint keeping its own dict, the pure functions at the
+bottom of the pipeline memoize themselves here:
+
+    extractor.extract_all               → keyed on the preprocessed claim text
+    claim_detector.score_claim_probability → keyed on the sentence itself
+
+so /extract, /batch, /analyze, /verify and /verify/quick all share the hits.
+
+Other caches (the verification result / evidence TTL caches) can register()
+themselves to show up in the same stats and be cleared with clear_all().
+
+Size is configurable with the EXTRACTION_MEMO_SIZE env var (entries per memo,
+default 4096; 0 disables memoization). Counters are exposed via
+GET /cache/stats.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_MEMO_SIZE = int(os.getenv("EXTRACTION_MEMO_SIZE", "4096"))
+
+# Every LruMemo registers itself here so stats/clear can reach all of them
+_REGISTRY: list["LruMemo"] = []
+
+
+class LruMemo:
+    """
+    Thread-safe LRU map with hit / miss / eviction counters.
+    Sync FastAPI endpoints run in a thread pool, so every access takes a lock.
+    """
+
+    def __init__(self, name: str, maxsize: int = DEFAULT_MEMO_SIZE):
+        self.name = name
+        self.maxsize = maxsize
+        self._items: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _REGISTRY.append(self)
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached value for *key*, or call compute(key), store and return it.
+        Exceptions from compute propagate and nothing is cached.
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+
+        value = compute(key)   # outside the lock — compute may be slow
+
+        if self.maxsize > 0:
+            with self._lock:
+                self._items[key] = value
+                self._items.move_to_end(key)
+                while len(self._items) > self.maxsize:
+                    self._items.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def get(self, key, default=None):
+        """Cached value for *key* (a hit), else *default* (a miss)."""
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value) -> None:
+        """Store *value* for *key*, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._items),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters. Used in tests."""
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+def register(cache) -> None:
+    """
+    Add a non-LruMemo cache to all_stats() / clear_all(). It needs
+    stats() -> dict (same keys as LruMemo.stats) and clear().
+    """
+    _REGISTRY.append(cache)
+
+
+def all_stats() -> list[dict]:
+    """Stats for every memo created in this process."""
+    return [memo.stats() for memo in _REGISTRY]
+
+
+def clear_all() -> None:
+    for memo in _REGISTRY:
+        memo.clear()
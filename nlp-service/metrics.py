@@ -5,162 +5,149 @@ Example:
     Output: {"metric": "GDP growth rate", "confidence": 0.9}
 """
 
+import json
+import os
 import re
+from functools import lru_cache
+
+from metric_index import MetricIndex
+
+# =============================================================================
+# METRIC REGISTRY — data/metrics.json
+# One entry per metric, in match precedence order:
+#   name       — canonical metric name ("GDP growth rate")
+#   unit       — "percentage" or "absolute" (drives value_type in extractor.py)
+#   indicator  — World Bank indicator code (used by verifier/tier1_numeric.py)
+#   currency   — ISO 4217 currency the indicator is published in, monetary
+#                metrics only (claimed values are converted to it, see units.py)
+#   keywords   — extra short forms claim_detector.py looks for ("gdp", "forex").
+#                Matched as substrings, so no stems that hide inside common
+#                words ("import" → important, "gni" → significant)
+#   strong     — regexes that pin the metric down (confidence 0.9)
+#   weak       — regexes that only hint at it (confidence 0.6)
+# Every other table below is derived from this file — add a metric there,
+# not here.
+# =============================================================================
+REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "metrics.json")
+
+
+def _load_registry(path: str = REGISTRY_PATH) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        metrics = json.load(f)["metrics"]
+    for m in metrics:
+        if m.get("unit") not in ("percentage", "absolute"):
+            raise ValueError(f"metrics.json: {m.get('name')!r} has unknown unit {m.get('unit')!r}")
+    return metrics
+
+
+METRIC_REGISTRY = _load_registry()
 
 # N-20: Metric type sets — used by extractor.py for value_type determination
-PERCENTAGE_METRICS = {
-    "GDP growth rate", "inflation rate", "unemployment rate",
-    "fiscal deficit", "literacy rate", "poverty rate",
-    "current account deficit",
-}
-ABSOLUTE_METRICS = {
-    "population", "per capita income", "foreign exchange reserves",
-}
+PERCENTAGE_METRICS = {m["name"] for m in METRIC_REGISTRY if m["unit"] == "percentage"}
+ABSOLUTE_METRICS = {m["name"] for m in METRIC_REGISTRY if m["unit"] == "absolute"}
 
 METRIC_PATTERNS = [
-    {
-        "name": "GDP growth rate",
-        "strong": [
-            r"gdp\s+growth\s+rate",        # "GDP growth rate"
-            r"rate\s+of\s+gdp\s+growth",    # "rate of GDP growth"  
-            r"economic\s+growth\s+rate",     # "economic growth rate"
-            r"gdp\s+grew",                  # "GDP grew by 7%"
-            r"gdp\s+growth",                # "GDP growth was 7%"
-        ],
-        "weak": [
-            r"\bgdp\b",                     # just "GDP" alone — ambiguous
-        ]
-    },
-    {
-        "name": "inflation rate",
-        "strong": [
-            r"inflation\s+rate",            # "inflation rate"
-            r"rate\s+of\s+inflation",       # "rate of inflation"
-            r"cpi\s+inflation",             # "CPI inflation"
-            r"consumer\s+price\s+in",       # "consumer price index/inflation"
-            r"retail\s+inflation",          # "retail inflation"
-        ],
-        "weak": [
-            r"\binflation\b",              # just "inflation"
-        ]
-    },
-
-    {
-        "name": "unemployment rate",
-        "strong": [
-            r"unemployment\s+rate",         # "unemployment rate"
-            r"jobless\s+rate",              # "jobless rate"
-            r"rate\s+of\s+unemployment",    # "rate of unemployment"
-        ],
-        "weak": [
-            r"\bunemployment\b",           # just "unemployment"
-            r"\bjobless\b",                # just "jobless"
-        ]
-    },
-
-    {
-        "name": "fiscal deficit",
-        "strong": [
-            r"fiscal\s+deficit",            # "fiscal deficit"
-            r"budget\s+deficit",            # "budget deficit"
-            r"fiscal\s+gap",               # "fiscal gap"
-        ],
-        "weak": [
-            r"\bdeficit\b",                # just "deficit" — could be trade deficit too
-        ]
-    },
-
-    {
-        "name": "literacy rate",
-        "strong": [
-            r"literacy\s+rate",             # "literacy rate"
-            r"rate\s+of\s+literacy",        # "rate of literacy"
-        ],
-        "weak": [
-            r"\bliteracy\b",               # just "literacy"
-            r"\bliterate\b",               # "literate population"
-        ]
-    },
-
-    {
-        "name": "population",
-        "strong": [
-            r"population\s+of\s+india",     # "population of India"
-            r"india.{0,15}population",      # "India's population"
-            r"total\s+population",          # "total population"
-        ],
-        "weak": [
-            r"\bpopulation\b",             # just "population"
-        ]
-    },
-
-    {
-        "name": "per capita income",
-        "strong": [
-            r"per\s+capita\s+income",       # "per capita income"
-            r"income\s+per\s+capita",       # "income per capita"
-            r"per\s+capita\s+gdp",          # "per capita GDP"
-            r"gdp\s+per\s+capita",          # "GDP per capita"
-            r"average\s+income",            # "average income"
-        ],
-        "weak": [
-            r"per\s+capita",               # just "per capita" — could be anything
-        ]
-    },
-
-    {
-        "name": "poverty rate",
-        "strong": [
-            r"poverty\s+rate",              # "poverty rate"
-            r"below\s+poverty\s+line",      # "below poverty line"
-            r"bpl\s+(?:rate|percentage)",   # "BPL rate/percentage"
-            r"rate\s+of\s+poverty",         # "rate of poverty"
-        ],
-        "weak": [
-            r"\bpoverty\b",               # just "poverty"
-            r"\bbpl\b",                    # just "BPL"
-        ]
-    },
-
-    {
-        "name": "foreign exchange reserves",
-        "strong": [
-            r"forex\s+reserves?",           # "forex reserve(s)"
-            r"foreign\s+exchange\s+reserves?",  # "foreign exchange reserve(s)"
-            r"fx\s+reserves?",              # "FX reserves"
-            r"foreign\s+reserves?",         # "foreign reserves"
-        ],
-        "weak": [
-            r"\bforex\b",                  # just "forex"
-        ]
-    },
-
-    {
-        "name": "current account deficit",
-        "strong": [
-            r"current\s+account\s+deficit", # "current account deficit"
-            r"trade\s+deficit",             # "trade deficit"
-            r"trade\s+gap",                # "trade gap"
-            r"\bcad\b",                    # "CAD" abbreviation
-        ],
-        "weak": [
-            r"trade\s+balance",            # "trade balance" — could be surplus too
-        ]
-    },
+    {"name": m["name"], "strong": m["strong"], "weak": m["weak"]}
+    for m in METRIC_REGISTRY
 ]
 
+# Metric name → World Bank indicator code (Tier 1)
+METRIC_INDICATORS = {m["name"]: m["indicator"] for m in METRIC_REGISTRY if m.get("indicator")}
+
+# Metric name → native currency of its indicator (monetary metrics only)
+METRIC_CURRENCIES = {m["name"]: m["currency"] for m in METRIC_REGISTRY if m.get("currency")}
+
+# Lowercase substrings that signal "this sentence mentions a metric" (claim_detector.py)
+METRIC_KEYWORDS = tuple(dict.fromkeys(
+    kw
+    for m in METRIC_REGISTRY
+    for kw in (m["name"].lower(), *m.get("keywords", []))
+))
+
 
 # =============================================================================
-# N-7: PRE-COMPILED PATTERNS — built once at module load, reused on every call
+# N-7: PRE-COMPILED PATTERNS — for the reference implementations below.
+# Compiled on first use: the index (metric_index.py) compiles its own
+# patterns lazily, and serving code never needs all of them at once.
 # =============================================================================
-_COMPILED_METRIC_PATTERNS = [
-    {
-        "name": m["name"],
-        "strong": [re.compile(p) for p in m["strong"]],
-        "weak":   [re.compile(p) for p in m["weak"]],
-    }
-    for m in METRIC_PATTERNS
-]
+@lru_cache(maxsize=1)
+def _compiled_metric_patterns():
+    return [
+        {
+            "name": m["name"],
+            "strong": [re.compile(p) for p in m["strong"]],
+            "weak":   [re.compile(p) for p in m["weak"]],
+        }
+        for m in METRIC_PATTERNS
+    ]
+
+_TIER_CONFIDENCE = {"strong": 0.9, "weak": 0.6}
+
+
+# =============================================================================
+# INDEXED METRIC MATCHER (metric_index.py)
+# Every strong and weak pattern goes into one MetricIndex, ranked by the same
+# precedence the two-pass loop used: all strong patterns (metric order, then
+# pattern order), then all weak ones. Lower rank wins.
+#
+# WHY A RANK AND NOT JUST THE FIRST MATCH?
+#   The old loop picks the highest-precedence pattern found ANYWHERE in the
+#   text, not the leftmost one. "gdp ... inflation rate" must still return
+#   inflation rate (strong) over GDP (weak).
+#
+# WHY AN INDEX?
+#   With hundreds of World Bank indicators in the registry, trying every
+#   pattern (one by one, or as one alternation) at every position costs
+#   ~1 ms per claim. The index only runs the few patterns whose literal
+#   anchor actually occurs in the claim — see metric_index.py.
+# =============================================================================
+
+def _build_metric_index(metric_patterns) -> MetricIndex:
+    """One index entry per pattern; payload = (metric_name, tier)."""
+    return MetricIndex([
+        (pattern, (metric["name"], tier))
+        for tier in ("strong", "weak")
+        for metric in metric_patterns
+        for pattern in metric[tier]
+    ])
+
+
+_METRIC_INDEX = _build_metric_index(METRIC_PATTERNS)
+
+
+def find_metric_mentions(text):
+    """
+    Return every metric mention in *text* as a list of
+    (start, end, metric_name, confidence), left to right.
+
+    At each position the highest-precedence pattern wins; a mention that
+    starts inside the previous one ("gdp growth" inside "gdp growth rate")
+    is dropped. Used by extractor.extract_claims() to pair metrics with
+    the values around them.
+    """
+    payloads = _METRIC_INDEX.payloads
+    mentions = []
+    for start, end, rank in _METRIC_INDEX.mentions(text.lower()):
+        name, tier = payloads[rank]
+        mentions.append((start, end, name, _TIER_CONFIDENCE[tier]))
+    return mentions
+
+
+def find_metric_and_mentions(text):
+    """
+    (find_metric(text), find_metric_mentions(text)) from one index pass —
+    for lexer.py, which needs both for every claim sentence.
+    """
+    best, found = _METRIC_INDEX.scan(text.lower())
+    payloads = _METRIC_INDEX.payloads
+    mentions = []
+    for start, end, rank in found:
+        name, tier = payloads[rank]
+        mentions.append((start, end, name, _TIER_CONFIDENCE[tier]))
+    if best is None:
+        return {"metric": None, "confidence": 0.0}, mentions
+    name, tier = payloads[best]
+    return {"metric": name, "confidence": _TIER_CONFIDENCE[tier]}, mentions
 
 
 # find_metric(text) — The Matching Function
@@ -168,10 +155,32 @@ _COMPILED_METRIC_PATTERNS = [
 
 def find_metric(text):
 
+    best = _METRIC_INDEX.best(text.lower())
+
+    # NOTHING MATCHED — we don't recognize this metric
+    if best is None:
+        return {
+            "metric": None,
+            "confidence": 0.0
+        }
+
+    name, tier = _METRIC_INDEX.payloads[best]
+    return {
+        "metric": name,
+        "confidence": _TIER_CONFIDENCE[tier]
+    }
+
+
+def _find_metric_linear(text):
+    """
+    Reference implementation: the original strong-pass / weak-pass loop.
+    Kept so tests and benchmarks/bench_find_metric.py can check the
+    indexed matcher against it.
+    """
     text_lower = text.lower()
 
     # FIRST PASS — check all strong patterns (high confidence)
-    for metric in _COMPILED_METRIC_PATTERNS:
+    for metric in _compiled_metric_patterns():
         for pattern in metric["strong"]:
             if pattern.search(text_lower):
                 return {
@@ -180,7 +189,7 @@ def find_metric(text):
                 }
 
     # SECOND PASS — check all weak patterns (lower confidence)
-    for metric in _COMPILED_METRIC_PATTERNS:
+    for metric in _compiled_metric_patterns():
         for pattern in metric["weak"]:
             if pattern.search(text_lower):
                 return {
@@ -188,13 +197,36 @@ def find_metric(text):
                     "confidence": 0.6
                 }
 
-    # NOTHING MATCHED — we don't recognize this metric
     return {
         "metric": None,
         "confidence": 0.0
     }
 
 
+def _find_metric_mentions_linear(text):
+    """
+    Reference implementation of find_metric_mentions(): try every pattern
+    at every position, best rank first. O(len(text) × patterns) — tests only.
+    """
+    text_lower = text.lower()
+    ranked = [
+        (re.compile(pattern), metric["name"], tier)
+        for tier in ("strong", "weak")
+        for metric in METRIC_PATTERNS
+        for pattern in metric[tier]
+    ]
+    mentions = []
+    for start in range(len(text_lower)):
+        if mentions and start < mentions[-1][1]:
+            continue
+        for regex, name, tier in ranked:
+            match = regex.match(text_lower, start)
+            if match:
+                mentions.append((start, match.end(), name, _TIER_CONFIDENCE[tier]))
+                break
+    return mentions
+
+
 # get_all_metric_names() — Utility function 
 # WHAT IT DOES: Returns a list of all known metric names.
 #   Useful for: API responses ("here are the metrics we support"),
@@ -0,0 +1,143 @@
+"""
+periods.py — Relative and abbreviated period resolution
+
+Answers: "Which year does 'last year' / 'this fiscal' / 'FY25' mean?"
+Example:
+    Input:  "Inflation eased to 5.4% last year"   (published 2024-03-10)
+    Output: 2023
+
+extractor.extract_year() only understands explicit years ("2024",
+"FY2024-25"). News copy mostly says "last year" or "this fiscal", which
+left the year empty, cut extraction confidence by a third and pushed the
+claim past the Tier 1 fast path. This module fills that gap.
+
+ANCHOR:
+  Relative periods only mean something relative to WHEN the text was
+  written. Callers pass a reference_date (e.g. the article's published_at);
+  without one we assume the text is current (today).
+
+FISCAL YEARS:
+  Indian fiscal years run April → March and are named by the year they
+  END in, matching extractor._fiscal_year_end(): FY2024-25 = FY25 = 2025.
+  "This fiscal" on 2024-08-01 is FY2024-25 → 2025.
+
+SUPPORTED FORMS:
+  FY25, FY'25, FY 25, FY24-25, FY2025
+  last / previous / past / prior / this / current / next + year / fiscal
+      (year) / financial year / quarter / month
+  N years / quarters / months ago   ("two years ago", "a year ago")
+"""
+
+import re
+from datetime import date, datetime
+
+FISCAL_YEAR_START_MONTH = 4   # April — India's fiscal year
+
+_NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+}
+
+_RE_PERIOD = re.compile(
+    # FY25 / FY'25 / FY 25 / FY24-25 (two-digit fiscal years)
+    r"(?P<fy_short>\bFY\s?'?(?P<fy_yy>\d{2})(?:\s?-\s?(?P<fy_yy2>\d{2}))?\b)"
+    # FY2025 (FY2024-25 is already handled by extractor._RE_FY_FULL)
+    r"|(?P<fy_long>\bFY\s?(?P<fy_yyyy>(?:19|20)\d{2})\b(?!\s?-\s?\d))"
+    # last year / this fiscal / previous quarter / next financial year
+    r"|(?P<rel>\b(?P<which>last|previous|past|prior|this|current|present|next|coming)\s+"
+    r"(?P<unit>fiscal(?:\s+year)?|financial\s+year|calendar\s+year|year|quarter|month)\b)"
+    # two years ago / a year ago / 3 quarters ago
+    r"|(?P<ago>\b(?P<n>\d{1,2}|an?|one|two|three|four|five|six|seven|eight|nine|ten)\s+"
+    r"(?P<ago_unit>year|quarter|month)s?\s+ago\b)",
+    re.IGNORECASE,
+)
+
+# Every _RE_PERIOD match contains one of these (case-insensitively), so
+# text without any of them needs no scan — see lexer.Lexed.periods()
+PERIOD_KEYWORDS = ("fy", "year", "quarter", "month", "fiscal")
+
+_OFFSET = {
+    "last": -1, "previous": -1, "past": -1, "prior": -1,
+    "this": 0, "current": 0, "present": 0,
+    "next": 1, "coming": 1,
+}
+_MONTHS_PER_UNIT = {"month": 1, "quarter": 3}
+
+
+def as_reference_date(reference_date: date | datetime | None) -> date:
+    """Normalise a reference date (date, datetime or None → today)."""
+    if reference_date is None:
+        return date.today()
+    if isinstance(reference_date, datetime):
+        return reference_date.date()
+    return reference_date
+
+
+def _two_digit_year(yy: str) -> int:
+    n = int(yy)
+    return 2000 + n if n < 50 else 1900 + n
+
+
+def _fiscal_year_of(day: date) -> int:
+    """Fiscal year (named by its ending year) that *day* falls in."""
+    return day.year + 1 if day.month >= FISCAL_YEAR_START_MONTH else day.year
+
+
+def _shift_months(day: date, months: int) -> int:
+    """Calendar year of the month *months* away from *day*."""
+    index = day.year * 12 + (day.month - 1) + months
+    return index // 12
+
+
+def _resolve(m: re.Match, ref: date) -> int:
+    if m.group("fy_short"):
+        return _two_digit_year(m.group("fy_yy2") or m.group("fy_yy"))
+    if m.group("fy_long"):
+        return int(m.group("fy_yyyy"))
+
+    if m.group("rel"):
+        offset = _OFFSET[m.group("which").lower()]
+        unit = m.group("unit").lower()
+    else:
+        n = m.group("n").lower()
+        offset = -(int(n) if n.isdigit() else _NUMBER_WORDS[n])
+        unit = m.group("ago_unit").lower()
+
+    if unit.startswith(("fiscal", "financial")):
+        return _fiscal_year_of(ref) + offset
+    if unit in _MONTHS_PER_UNIT:
+        return _shift_months(ref, offset * _MONTHS_PER_UNIT[unit])
+    return ref.year + offset   # year / calendar year
+
+
+def find_periods(
+    text: str,
+    reference_date: date | datetime | None = None,
+) -> list[tuple[int, int, int]]:
+    """Every period mention in *text* as (start, end, year), left to right."""
+    ref = as_reference_date(reference_date)
+    return [(m.start(), m.end(), _resolve(m, ref)) for m in _RE_PERIOD.finditer(text)]
+
+
+def resolve_period(text: str, reference_date: date | datetime | None = None) -> int | None:
+    """Year of the first period mention in *text*, or None."""
+    m = _RE_PERIOD.search(text)
+    if m is None:
+        return None
+    return _resolve(m, as_reference_date(reference_date))
+
+
+if __name__ == "__main__":
+    published = date(2024, 8, 1)
+    test_claims = [
+        "Inflation eased to 5.4% last year",
+        "Fiscal deficit will be 5.1% this fiscal",
+        "GDP grew 7.8% in the previous quarter",
+        "Unemployment was 3.2% in FY25",
+        "Forex reserves rose to $600 billion two years ago",
+        "GDP growth rate was 7.5% in 2024",
+    ]
+    print(f"Reference date: {published}")
+    for claim in test_claims:
+        print(f"\nClaim: \"{claim}\"")
+        print(f"  → Year: {resolve_period(claim, published)}")
@@ -4,10 +4,11 @@ conftest.py — pytest fixtures shared across all test modules.
 AUTOUSE FIXTURES DEFINED HERE:
   clear_verification_cache — Clears the in-process result cache before and after
   every test. Prevents the L1 cache in verdict_router.py from returning stale
-  results across tests that share the same input text.
+  results across tests that share the same input text. Also resets the
+  extraction memos (memo.py) so hit/miss counters start from zero.
 
   WHY THIS MATTERS:
-    route_verification() caches results by MD5(text). Tests like
+    route_verification() caches results by claim fingerprint. Tests like
     test_tier1_accurate_passes_fast_path and test_tier1_fast_path_false
     both use "GDP grew 7.5% in 2024". Without clearing, the first test's
     real result would be returned to subsequent tests that expect mocked
@@ -29,6 +30,9 @@ def clear_verification_cache():
     This fixture runs for ALL tests (autouse=True) automatically.
     """
     from verifier.verdict_router import _result_cache
+    from memo import clear_all
     _result_cache.clear()
+    clear_all()
     yield
     _result_cache.clear()
+    clear_all()
@@ -0,0 +1,131 @@
+"""
+test_claim_classifier.py — Tests for the optional learned claim filter
+========================================================================
+Run with:  pytest tests/test_claim_classifier.py -v
+
+WHAT WE'RE TESTING:
+  - Features: numbers fold to <num>/<year>/<pct>, hashing is stable
+  - The model: weight file layout, batch == one-by-one, training learns
+  - The shipped weights reject known heuristic false positives and keep claims
+  - /analyze: untouched when CLAIM_CLASSIFIER is off, filters when it's on
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pytest
+
+import claim_classifier
+from claim_classifier import ClaimClassifier, WEIGHTS_PATH, _tokens, featurize, load_labels
+from claim_detector import score_claim_probability
+
+LABELS_PATH = os.path.join(os.path.dirname(WEIGHTS_PATH), "claim_labels.jsonl")
+
+
+@pytest.fixture
+def classifier_on(monkeypatch):
+    """Turn the filter on with the shipped weights, and reset its state after."""
+    monkeypatch.setattr(claim_classifier, "CLASSIFIER_ENABLED", True)
+    monkeypatch.setitem(claim_classifier._stats, "scored", 0)
+    monkeypatch.setitem(claim_classifier._stats, "rejected", 0)
+    claim_classifier.get_classifier.cache_clear()
+    yield
+    claim_classifier.get_classifier.cache_clear()
+
+
+class TestFeatures:
+
+    def test_numbers_are_folded(self):
+        assert _tokens("GDP grew 7.5% in 2024, to $3,900 billion") == \
+            ["gdp", "grew", "<pct>", "in", "<year>", "to", "<num>", "billion"]
+
+    def test_paraphrased_numbers_share_features(self):
+        a = featurize(["Inflation was 5.4% in 2023"], 4096)
+        b = featurize(["Inflation was 6.1 % in 2019"], 4096)
+        for x, y in zip(a, b):
+            assert np.array_equal(x, y)
+
+    def test_buckets_stay_in_range(self):
+        _, rows, buckets, signs = featurize(["India's GDP growth rate was 7.5% in 2024", "Hello"], 64)
+        assert rows.tolist() == sorted(rows.tolist())
+        assert buckets.max() < 64
+        assert set(signs.tolist()) <= {-1.0, 1.0}
+
+
+class TestModel:
+
+    def test_weights_must_be_bias_dense_and_power_of_two_buckets(self):
+        ClaimClassifier(np.zeros(claim_classifier._OFFSET + 256))
+        with pytest.raises(ValueError):
+            ClaimClassifier(np.zeros(claim_classifier._OFFSET + 100))
+        with pytest.raises(ValueError):
+            ClaimClassifier(np.zeros((2, 256)))
+
+    def test_save_load_round_trip(self, tmp_path):
+        model = ClaimClassifier(np.arange(claim_classifier._OFFSET + 16, dtype=np.float32) / 100)
+        model.save(tmp_path / "w.npy")
+        assert np.array_equal(ClaimClassifier.load(tmp_path / "w.npy").weights, model.weights)
+
+    def test_batch_matches_one_by_one(self):
+        sentences, _ = load_labels(LABELS_PATH)
+        model = ClaimClassifier.load(WEIGHTS_PATH)
+        batch = model.predict_proba(sentences[:40])
+        single = [model.predict_proba([s])[0] for s in sentences[:40]]
+        assert np.allclose(batch, single)
+        assert model.predict_proba([]).shape == (0,)
+
+    def test_training_separates_the_classes(self):
+        sentences = ["GDP grew 7.5% in 2024", "Inflation was 5.4% in 2023",
+                     "GDP will grow 7% by 2030, the minister said", "Inflation is expected to ease in 2025"]
+        model = ClaimClassifier.train(sentences, [1, 1, 0, 0], n_buckets=256)
+        p = model.predict_proba(sentences)
+        assert p[0] > 0.5 and p[1] > 0.5 and p[2] < 0.5 and p[3] < 0.5
+
+    def test_verdict_rows_are_labels(self, tmp_path):
+        path = tmp_path / "claims.jsonl"
+        path.write_text('{"text": "a", "verdict": "false"}\n{"text": "b", "verdict": "unverifiable"}\n'
+                        '\n{"text": "c", "label": 1}\n')
+        assert load_labels(path) == (["a", "b", "c"], [1, 0, 1])
+
+
+class TestShippedWeights:
+
+    @pytest.mark.parametrize("text", [
+        "Analysts expect Beijing to set a growth target of about 5% again for 2024, supported by fiscal stimulus",
+        "The government has asked states to prepare contingency plans for districts that received deficient rain in 2023",
+        "India will become a $5 trillion economy by 2027, PM says",
+    ])
+    def test_rejects_heuristic_false_positives(self, text):
+        assert score_claim_probability(text) > 0.5
+        assert ClaimClassifier.load(WEIGHTS_PATH).predict_proba([text])[0] < 0.5
+
+    @pytest.mark.parametrize("text", [
+        "India's GDP growth rate was 7.5% in 2024",
+        "Forex reserves hit a record $704 billion in 2024",
+        "The unemployment rate rose to 8 percent in 2023",
+    ])
+    def test_keeps_claims(self, text):
+        assert ClaimClassifier.load(WEIGHTS_PATH).predict_proba([text])[0] > 0.5
+
+
+class TestAnalyzeFilter:
+
+    TEXT = ("India's GDP growth rate was 7.5% in 2024. "
+            "Analysts expect Beijing to set a growth target of about 5% again for 2024, supported by fiscal stimulus.")
+
+    def test_off_by_default(self):
+        from main import analyze_text, ClaimRequest
+        assert claim_classifier.get_classifier() is None
+        assert analyze_text(ClaimRequest(text=self.TEXT)).verified_count == 2
+
+    def test_drops_rejected_candidates(self, classifier_on):
+        from main import analyze_text, cache_stats, ClaimRequest
+        response = analyze_text(ClaimRequest(text=self.TEXT))
+        assert [r.sentence for r in response.results] == ["India's GDP growth rate was 7.5% in 2024"]
+        assert cache_stats()["claim_classifier"] == {"enabled": True, "scored": 2, "rejected": 1}
+
+    def test_missing_weights_disable_the_filter(self, classifier_on, tmp_path):
+        assert claim_classifier.get_classifier(str(tmp_path / "missing.npy")) is None
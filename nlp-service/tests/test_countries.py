@@ -0,0 +1,100 @@
+"""
+test_countries.py — Tests for the ISO 3166 country gazetteer (countries.py)
+=============================================================================
+Run with:  pytest tests/test_countries.py -v
+
+WHAT WE'RE TESTING:
+  - Every ISO 3166 country resolves by its common name
+  - Case rules: "US" vs "us", "Turkey" vs "turkey"
+  - Longest match wins, regions ("Latin America") don't resolve to a country
+  - extractor.extract_country and tier1's ISO3 → ISO2 table use the gazetteer
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from countries import COUNTRIES, ISO3_TO_ISO2, find_country_mentions, resolve_country
+from extractor import extract_country, extract_all
+from verifier.tier1_numeric import _world_bank_source_url
+
+
+class TestGazetteer:
+
+    def test_covers_all_iso_countries(self):
+        assert len(COUNTRIES) == 249
+        assert len(ISO3_TO_ISO2) == 249
+
+    def test_every_common_name_resolves_to_itself(self):
+        wrong = {
+            iso3: resolve_country(f"{c.name} GDP growth was 3% in 2023")
+            for iso3, c in COUNTRIES.items()
+        }
+        wrong = {k: v for k, v in wrong.items() if k != v}
+        assert wrong == {}
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Brazilian inflation was 4.6%", "BRA"),
+        ("Nigeria's unemployment rate", "NGA"),
+        ("The UAE economy grew 6%", "ARE"),
+        ("U.S. GDP growth", "USA"),
+        ("Bharat's literacy rate", "IND"),
+        ("Cote d'Ivoire grew 6.5%", "CIV"),
+        ("Côte d'Ivoire grew 6.5%", "CIV"),
+        ("Emiratis", "ARE"),
+    ])
+    def test_aliases_and_demonyms(self, text, expected):
+        assert resolve_country(text) == expected
+
+
+class TestCaseRules:
+
+    def test_lowercase_us_is_a_pronoun(self):
+        assert resolve_country("Let us check inflation in 2023") is None
+
+    def test_uppercase_us_is_the_country(self):
+        assert resolve_country("US inflation in 2023") == "USA"
+
+    def test_common_word_names_need_capitals(self):
+        assert resolve_country("turkey prices rose 10%") is None
+        assert resolve_country("Turkey's inflation hit 61%") == "TUR"
+
+    def test_plain_names_match_any_case(self):
+        assert resolve_country("india gdp growth") == "IND"
+
+
+class TestLongestMatch:
+
+    def test_multiword_name_beats_prefix(self):
+        assert resolve_country("South Korea grew 2%") == "KOR"
+        assert resolve_country("North Korea grew 2%") == "PRK"
+        assert resolve_country("Papua New Guinea's population") == "PNG"
+
+    def test_regions_are_not_countries(self):
+        assert resolve_country("Latin America's growth slowed") is None
+        assert resolve_country("Indian Ocean trade routes") is None
+
+    def test_mentions_have_spans_and_dont_overlap(self):
+        text = "India and the United States"
+        assert find_country_mentions(text) == [(0, 5, "IND"), (14, 27, "USA")]
+
+
+class TestIntegration:
+
+    def test_extract_country_defaults_to_india(self):
+        assert extract_country("GDP growth rate was 7%") == "IND"
+        assert extract_country("GDP growth rate was 7%", default="USA") == "USA"
+
+    def test_first_mention_wins(self):
+        assert extract_country("Unlike China, India grew 7%") == "CHN"
+
+    def test_extract_all_beyond_top_economies(self):
+        assert extract_all("Kenya's inflation rate was 7.7% in 2023")["country"] == "KEN"
+
+    def test_tier1_source_url_uses_gazetteer(self):
+        # IRL → IE; the old 11-country table fell back to country[:2] = "IR" (Iran)
+        url = _world_bank_source_url("FP.CPI.TOTL.ZG", country="IRL")
+        assert url.endswith("?locations=IE")
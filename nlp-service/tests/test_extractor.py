@@ -24,9 +24,16 @@ import os
 # one level up (in nlp-service/, not nlp-service/tests/).
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from extractor import extract_year, extract_value, extract_all
-from metrics import find_metric, get_all_metric_names
-from claim_detector import split_into_sentences, score_claim_probability
+import pytest
+
+from extractor import extract_year, extract_value, extract_all, extract_claims, extract_many, extract_trend
+from extractor import preprocess_claim, NormalizedText, _preprocess_claim_reference
+from metrics import find_metric, get_all_metric_names, _find_metric_linear
+from claim_detector import (
+    split_into_sentences, score_claim_probability, score_claims_batch, iter_sentences, SentenceSplitter,
+)
+from claim_detector import _split_into_sentences_reference
+from claim_detector import _score_sentence, _score_sentence_reference
 
 # =============================================================================
 # YEAR EXTRACTION TESTS
@@ -155,12 +162,43 @@ class TestFindMetric:
         assert result["metric"] == "GDP growth rate"
 
     def test_get_all_metric_names(self):
-        """Utility function should return all 10 metric names."""
+        """Utility function should return all 62 metric names."""
         names = get_all_metric_names()
-        assert len(names) == 10
+        assert len(names) == 62
         assert "GDP growth rate" in names
         assert "inflation rate" in names
 
+    def test_strong_match_beats_earlier_weak_match(self):
+        """A strong pattern anywhere wins over a weak one seen earlier in the text."""
+        result = find_metric("GDP data aside, the inflation rate hit 6%")
+        assert result["metric"] == "inflation rate"
+        assert result["confidence"] == 0.9
+
+    def test_metric_order_breaks_ties_not_position(self):
+        """Two strong matches: the metric listed first in METRIC_PATTERNS wins."""
+        result = find_metric("Unemployment rate and GDP growth rate both moved")
+        assert result["metric"] == "GDP growth rate"
+
+    def test_word_boundary_preserved(self):
+        r"""\bcad\b must not fire inside 'cadre'."""
+        assert find_metric("The cadre review is pending")["metric"] is None
+
+    def test_single_pass_matches_reference(self):
+        """The single-pass matcher must agree with the original two-pass loop."""
+        samples = [
+            "India's GDP growth rate was 7.5% in 2024",
+            "Retail CPI inflation fell to 4.8% in January 2024",
+            "Officials said the deficit could widen, and the trade gap too",
+            "The jobless rate and literacy both improved",
+            "India's total population is 1.4 billion",
+            "Trade balance turned positive as forex reserves rose",
+            "BPL percentage fell while poverty stayed in focus",
+            "Nothing about the economy here",
+            "",
+        ]
+        for text in samples:
+            assert find_metric(text) == _find_metric_linear(text), text
+
 
 # Claim Detector tests will go here once we implement the claim_detector.py functions.
 
@@ -177,11 +215,130 @@ class TestClaimDetector:
             "Unemployment rose to 8%"
         ]
 
+    @pytest.mark.parametrize("text", [
+        "Per capita income rose to Rs. 1,85,854. Dr. Rao said so. No. 10 is next.",
+        "Costs rose etc. The end. Rs. Five. MRS. Smith! Is it? Yes.",
+        "U.S. GDP grew 2.5% in 2023.  Then it slowed.\nThe Fed held rates.",
+        "Prices rose in Jan. And Feb. was worse. APPROX. 5% of it.",
+        "Literal <DOT> placeholders. Trailing space. ",
+        "no boundary here at all",
+        "",
+    ])
+    def test_iter_sentences_matches_reference(self, text):
+        assert list(iter_sentences(text)) == _split_into_sentences_reference(text)
+        assert split_into_sentences(text) == _split_into_sentences_reference(text)
+
+    def test_iter_sentences_accepts_chunks(self):
+        """Any chunking of the text — even one character at a time — gives the same sentences."""
+        text = "Rs. 5 was paid. Dr. Rao agreed.  Inflation hit 6.2%? Unemployment rose to 8%. No. 10 next."
+        expected = split_into_sentences(text)
+        assert list(iter_sentences(iter(text))) == expected
+        assert list(iter_sentences([text[:3], text[3:16], text[16:17], text[17:]])) == expected
+
+    def test_iter_sentences_is_lazy(self):
+        """A sentence is yielded as soon as its boundary is decided, before the rest is read."""
+        def chunks():
+            yield "GDP grew 7% in 2024. Inflation hit 5%. "
+            raise AssertionError("read too far")
+        sentences = iter_sentences(chunks())
+        assert next(sentences) == "GDP grew 7% in 2024"
+
+    def test_splitter_bounds_the_sentence_in_progress(self):
+        """With max_sentence_chars, unpunctuated text is cut at whitespace instead of piling up."""
+        splitter = SentenceSplitter(max_sentence_chars=100)
+        words, out = ["word%d" % i for i in range(5000)], []
+        for i in range(0, len(words), 7):
+            out += splitter.feed(" ".join(words[i:i + 7]) + " ")
+            assert len(splitter._buffer._text) <= 100
+        out += splitter.close()
+        assert all(len(s) <= 100 for s in out)
+        assert " ".join(out).split() == words
+
+    def test_splitter_without_limit_matches_split(self):
+        text = "Rs. 5 was paid. Dr. Rao agreed.  Inflation hit 6.2%? Unemployment rose to 8%. No. 10 next."
+        splitter = SentenceSplitter()
+        out = [s for ch in text for s in splitter.feed(ch)] + splitter.close()
+        assert out == split_into_sentences(text)
+
     def test_score_claim_probability(self):
         """Test claim probability scoring on different sentences."""
         assert score_claim_probability("India's GDP growth was 7.5% in 2024") > 0.8
         assert score_claim_probability("The weather is nice today") < 0.2
 
+    def test_scanner_matches_reference(self):
+        """The single-pass scanner scores every hot-path sentence exactly as the original did."""
+        import json
+        path = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "data", "hotpath_corpus.json")
+        with open(path, encoding="utf-8") as f:
+            corpus = json.load(f)
+        sentences = list(corpus["claims"])
+        for article in corpus["articles"]:
+            sentences.extend(split_into_sentences(article))
+        for sentence in sentences:
+            assert _score_sentence(sentence) == _score_sentence_reference(sentence), sentence
+
+    def test_scanner_overlapping_signals(self):
+        """Signals hidden inside or behind another match still count."""
+        for sentence in [
+            "Government debt",                      # metric keyword containing a subject
+            "gdp per capita growth",                # nested metric keywords
+            "the indiarbi reached",                 # subject running into a subject
+            "this is 2024-25 and 140000 units",     # year then digit runs
+            "under-5 mortality",                    # keyword with a digit
+            "crisis is here",                       # "is" inside a word, then as a word
+            "Stood at 19999 vs 1999",
+            "İ2024 population",                     # lowercasing moves a word boundary
+            "",
+        ]:
+            assert _score_sentence(sentence) == _score_sentence_reference(sentence), sentence
+
+    def test_scanner_verifies_verbs_and_years_at_keyword_starts(self):
+        """A keyword beginning with a verb or a year can't hide it."""
+        import lexer
+        scanner = lexer._build_signal_scanner(("hit list", "2030 target", "hitlist"), ())
+        assert lexer._scan_signals("hit list", scanner) & lexer._VERB
+        assert not lexer._scan_signals("xhit list", scanner) & lexer._VERB
+        assert not lexer._scan_signals("hitlist", scanner) & lexer._VERB
+        assert lexer._scan_signals("the 2030 target", scanner) & lexer._YEAR
+        assert not lexer._scan_signals("x2030 target", scanner) & lexer._YEAR
+
+    @pytest.mark.parametrize("word", [
+        "important", "significant", "recognize", "assigning", "magnitude", "imagining",
+    ])
+    def test_common_words_are_not_metric_keywords(self, word):
+        """Keywords match as substrings: none may hide inside everyday English."""
+        import lexer
+        assert not lexer._scan_signals(word) & lexer._METRIC
+        assert not any(keyword in word for keyword in lexer.METRIC_KEYWORDS)
+
+    def test_common_words_do_not_lift_the_score(self):
+        sentence = "It is important that we remain calm about this"
+        assert _score_sentence(sentence) == _score_sentence_reference(sentence) == 0.2
+
+    def test_score_claims_batch_matches_scalar(self):
+        sentences = [
+            "India's GDP growth was 7.5% in 2024",
+            "The weather is nice today",
+            "Hi",
+            "Inflation hit 6.2%",
+            "India's GDP growth was 7.5% in 2024",       # duplicates are scored once, returned twice
+            " ".join(["word"] * 80) + " 2024 gdp",       # long-sentence penalty
+        ]
+        scores = score_claims_batch(sentences)
+        assert scores.shape == (len(sentences),)
+        assert scores.tolist() == [score_claim_probability(s) for s in sentences]
+        assert score_claims_batch([]).tolist() == []
+
+    def test_batch_arithmetic_matches_scalar_for_every_feature_combination(self):
+        """Vectorized weights, penalties, clamp and rounding give the scalar float every time."""
+        import numpy as np
+        from claim_detector import _batch_scores, _score_from_features
+        found, word_counts = np.meshgrid(np.arange(32), np.arange(80))
+        found, word_counts = found.ravel(), word_counts.ravel()
+        flags = (found[:, None] >> np.arange(5)) & 1
+        expected = [_score_from_features(int(f), int(w)) for f, w in zip(found, word_counts)]
+        assert _batch_scores(flags, word_counts).tolist() == expected
+
 # Analyze endpoint tests will go here once we implement the /analyze endpoint in main.py.
 
 class TestAnalyzeEndpoint:
@@ -214,6 +371,135 @@ class TestAnalyzeEndpoint:
         assert response.results[2].extraction.year is None
         assert response.results[2].extraction.confidence > 0.4  # weak metric match, no year → 0.6 * 0.8 = 0.48
 
+    def test_repeated_sentences_are_analyzed_once(self):
+        """Within a request and across requests, a sentence seen before comes from the sentence cache."""
+        from unittest.mock import patch
+        import main
+        from main import analyze_text, ClaimRequest
+
+        wire = "India's GDP growth was 7.5% in 2024. Inflation hit 6.2% in 2023."
+        with patch.object(main, "_analyze_new_sentences", wraps=main._analyze_new_sentences) as spy:
+            first = analyze_text(ClaimRequest(text=wire + " Markets closed higher. " + wire))
+            second = analyze_text(ClaimRequest(text="Exports rose 3% in October. " + wire))
+
+        assert [call.args[0] for call in spy.call_args_list] == [
+            ["India's GDP growth was 7.5% in 2024", "Inflation hit 6.2% in 2023", "Markets closed higher"],
+            ["Exports rose 3% in October"],
+        ]
+        assert (first.total_sentences, first.duplicate_sentences, first.duplicate_ratio) == (5, 2, 0.4)
+        assert (second.total_sentences, second.duplicate_sentences, second.duplicate_ratio) == (3, 2, 0.6667)
+        assert second.results[1:] == first.results[:2]
+
+    def test_sentence_cache_is_keyed_on_reference_date(self):
+        """'last year' means a different year for another reference date, so it is not a duplicate."""
+        from main import analyze_text, ClaimRequest
+
+        text = "Inflation eased to 5.4% last year."
+        a = analyze_text(ClaimRequest(text=text, reference_date="2024-03-01T00:00:00Z"))
+        b = analyze_text(ClaimRequest(text=text, reference_date="2025-03-01T00:00:00Z"))
+        assert b.duplicate_sentences == 0
+        assert (a.results[0].extraction.year, b.results[0].extraction.year) == (2023, 2024)
+
+    def test_sentence_cache_is_bounded(self, monkeypatch):
+        import main
+        from main import analyze_text, ClaimRequest
+        from memo import LruMemo
+
+        monkeypatch.setattr(main, "_sentence_cache", LruMemo("analyze_sentence_test", maxsize=2))
+        analyze_text(ClaimRequest(text="GDP grew 7% in 2024. Inflation hit 5% in 2023. Jobs rose 2% in 2022."))
+        stats = main._sentence_cache.stats()
+        assert (stats["size"], stats["evictions"]) == (2, 1)
+
+    def test_analyze_stream_matches_analyze(self):
+        """The NDJSON stream carries /analyze's results, each with its sentence index, then the counters."""
+        import json
+        from fastapi.testclient import TestClient
+        from main import app, analyze_text, ClaimRequest
+
+        text = ("India's GDP growth was 7.5% in 2024. The minister spoke at length. "
+                "Inflation hit 6.2% in 2023. Exports rose 3% to $38 billion in October.")
+        response = TestClient(app).post("/analyze/stream", content=text.encode())
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        *claims, summary = [json.loads(line) for line in response.text.splitlines()]
+
+        expected = analyze_text(ClaimRequest(text=text))
+        assert [c.pop("index") for c in claims] == [0, 2, 3]
+        assert claims == [r.model_dump() for r in expected.results]
+        assert summary == {"done": True, "total_sentences": 4, "verified_count": 3,
+                           "high_confidence_count": expected.high_confidence_count,
+                           "duplicate_sentences": 0, "duplicate_ratio": 0.0}
+
+    def test_analyze_stream_takes_large_chunked_documents(self):
+        """Far past /analyze's 2,000-character cap, uploaded in chunks that split UTF-8 characters."""
+        import json
+        from fastapi.testclient import TestClient
+        from main import app
+
+        text = "Per capita income is ₹1,72,000 in 2024. Markets closed higher today. " * 3000
+        body = text.encode()
+        chunks = (body[i:i + 1000] for i in range(0, len(body), 1000))
+        response = TestClient(app).post(
+            "/analyze/stream", params={"reference_date": "2025-01-01T00:00:00Z"}, content=chunks,
+        )
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[-1] == {"done": True, "total_sentences": 6000, "verified_count": 3000,
+                             "high_confidence_count": lines[-1]["high_confidence_count"],
+                             "duplicate_sentences": 5998, "duplicate_ratio": 0.9997}
+        assert lines[0]["sentence"] == "Per capita income is ₹1,72,000 in 2024"
+        assert [line["index"] for line in lines[:-1]] == list(range(0, 6000, 2))
+
+    def test_analyze_stream_rejects_non_english(self):
+        from fastapi.testclient import TestClient
+        from main import app
+
+        response = TestClient(app).post("/analyze/stream", content="La inflación en España fue del 3% en 2023".encode())
+        assert response.status_code == 422
+
+    def test_stream_language_check_runs_off_the_event_loop(self, monkeypatch):
+        import asyncio
+        from fastapi.testclient import TestClient
+        from main import app
+
+        on_loop = []
+
+        def detect(text):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:             # a threadpool worker has no running loop
+                on_loop.append(False)
+            return "en"
+
+        monkeypatch.setattr("main.detect_claim_language", detect)
+        assert TestClient(app).post("/analyze/stream", content=b"GDP grew 7% in 2024.").status_code == 200
+        assert on_loop == [False]
+
+    def test_analyze_returns_every_claim_in_a_sentence(self):
+        """Multi-claim sentences list each claim with its span."""
+        from main import analyze_text, ClaimRequest
+
+        response = analyze_text(ClaimRequest(text="India's GDP grew from 6% in 2023 to 7.5% in 2024."))
+        claims = response.results[0].claims
+        assert [(c.value, c.year) for c in claims] == [(6.0, 2023), (7.5, 2024)]
+
+    def test_long_paragraph_scored_as_a_batch(self, monkeypatch):
+        """Above the batch threshold /analyze returns exactly what per-sentence scoring gives."""
+        import main
+        from main import analyze_text, ClaimRequest
+
+        text = " ".join(
+            sentence.format(i)
+            for i in range(10)
+            for sentence in ("India's GDP growth was 7.5% in 2024 (report {}).", "The minister spoke at length ({}).",
+                             "Inflation hit 6.2% in 2023 (report {}).", "Exports rose 3% to $38 billion in October ({}).")
+        )
+        batched = analyze_text(ClaimRequest(text=text))
+        main._sentence_cache.clear()
+        monkeypatch.setattr(main, "_BATCH_SCORE_MIN_SENTENCES", 10_000)
+        assert analyze_text(ClaimRequest(text=text)) == batched
+        assert (batched.total_sentences, batched.duplicate_sentences) == (40, 0)
+
         
 
 # =============================================================================
@@ -330,4 +616,180 @@ class TestAllTenMetrics:
 
     def test_fiscal_deficit_coverage(self):
         result = extract_all("Fiscal deficit was 3.2% of GDP in 2024")
-        assert result["metric"] == "fiscal deficit"
\ No newline at end of file
+        assert result["metric"] == "fiscal deficit"
+
+
+# =============================================================================
+# MULTI-CLAIM EXTRACTION TESTS (extract_claims)
+# =============================================================================
+
+class TestExtractClaims:
+    """extract_claims returns every (metric, value, year, country) tuple with its span."""
+
+    def test_from_to_yields_two_claims(self):
+        text = "GDP grew from 6% in 2023 to 7.5% in 2024"
+        claims = extract_claims(text)
+        assert [(c["metric"], c["value"], c["year"]) for c in claims] == [
+            ("GDP growth rate", 6.0, 2023),
+            ("GDP growth rate", 7.5, 2024),
+        ]
+
+    def test_spans_point_into_text(self):
+        text = "GDP grew from 6% in 2023 to 7.5% in 2024"
+        for claim in extract_claims(text):
+            start, end = claim["span"]
+            assert text[start:end] == claim["original_text"]
+        assert extract_claims(text)[1]["original_text"] == "7.5% in 2024"
+
+    def test_two_metrics_in_one_sentence(self):
+        claims = extract_claims("India's GDP growth rate was 7.5% in 2024 while inflation fell to 5.4%")
+        assert [c["metric"] for c in claims] == ["GDP growth rate", "inflation rate"]
+        assert claims[1]["value"] == 5.4
+        assert claims[1]["year"] == 2024   # borrowed from the nearest year
+
+    def test_country_per_claim(self):
+        claims = extract_claims("In 2024, US unemployment rate was 4% and China's GDP growth was 5.2%")
+        assert [c["country"] for c in claims] == ["USA", "CHN"]
+
+    def test_single_claim_matches_extract_all(self):
+        text = "India's GDP growth rate was 7.5% in 2024"
+        (claim,) = extract_claims(text)
+        single = extract_all(text)
+        for key in ("metric", "value", "year", "country", "value_type", "confidence"):
+            assert claim[key] == single[key]
+
+    def test_year_range_is_not_a_negative_value(self):
+        claims = extract_claims("Between 2023-2024 deficit was 5.6%")
+        assert [c["value"] for c in claims] == [5.6]
+
+    def test_metric_without_value(self):
+        claims = extract_claims("Inflation is high")
+        assert len(claims) == 1
+        assert claims[0]["metric"] == "inflation rate"
+        assert claims[0]["value"] is None
+
+    def test_nothing_extractable(self):
+        assert extract_claims("Hello world") == []
+
+
+# =============================================================================
+# TREND CLAIM TESTS (extract_trend)
+# =============================================================================
+
+class TestExtractTrend:
+    """extract_trend recognises from/to ranges and changes over a period."""
+
+    def test_from_to_range(self):
+        trend = extract_trend("Inflation fell from 7% in 2022 to 5.4% in 2023")
+        assert trend["kind"] == "range"
+        assert trend["metric"] == "inflation rate"
+        assert (trend["start_year"], trend["end_year"]) == (2022, 2023)
+        assert (trend["start_value"], trend["end_value"]) == (7.0, 5.4)
+        assert trend["change"] == -1.6
+        assert trend["direction"] == "down"
+
+    def test_range_with_year_span(self):
+        trend = extract_trend("The unemployment rate rose from 6.1% to 7.2% between 2019 and 2020")
+        assert (trend["start_year"], trend["end_year"]) == (2019, 2020)
+        assert (trend["start_value"], trend["end_value"]) == (6.1, 7.2)
+
+    def test_change_in_points(self):
+        trend = extract_trend("Inflation fell by 1.6 percentage points between 2022 and 2023")
+        assert trend["kind"] == "change"
+        assert trend["change"] == -1.6
+        assert trend["change_unit"] == "absolute"
+
+    def test_basis_points(self):
+        assert extract_trend("Inflation eased by 50 basis points from 2022 to 2023")["change"] == -0.5
+
+    def test_relative_change_for_absolute_metric(self):
+        trend = extract_trend("India's population grew by 12% from 2011 to 2021")
+        assert trend["change"] == 12.0
+        assert trend["change_unit"] == "relative"
+
+    def test_percent_on_a_rate_is_a_level_not_a_change(self):
+        assert extract_trend("GDP grew by 7% between 2022 and 2023") is None
+
+    def test_empty_year_span_is_not_a_trend(self):
+        assert extract_trend("Inflation rose from 5% to 6% between 2022 and 2022") is None
+        assert extract_trend("Inflation rose by 1 percentage point between 2022 and 2022") is None
+
+    def test_backwards_range_is_not_a_trend(self):
+        assert extract_trend("Inflation rose from 4% in 2021 to 5% in 2019") is None
+        assert extract_trend("Inflation fell by 1 percentage point from 2023 to 2020") is None
+
+    def test_single_value_claim_is_not_a_trend(self):
+        assert extract_trend("India's GDP growth rate was 7.5% in 2024") is None
+
+
+# =============================================================================
+# BATCH EXTRACTION TESTS (extract_many)
+# =============================================================================
+
+class TestExtractMany:
+    """extract_many must give the same answers as calling extract_all in a loop."""
+
+    def test_matches_extract_all(self):
+        texts = [
+            "India's GDP growth rate was 7.5% in 2024",
+            "Inflation rate is 6.2%",
+            "Hello world",
+        ]
+        assert extract_many(texts) == [extract_all(t) for t in texts]
+
+    def test_preserves_order_and_length_with_duplicates(self):
+        texts = ["GDP grew 7% in 2024", "Hello world", "GDP grew 7% in 2024"]
+        results = extract_many(texts)
+        assert len(results) == 3
+        assert results[0] == results[2]
+        assert results[1]["metric"] is None
+
+    def test_normalized_duplicates_share_one_extraction(self):
+        """Texts that differ only in whitespace/markup normalize to the same claim."""
+        results = extract_many(["GDP grew 7% in 2024", "<b>GDP</b>   grew 7% in 2024"])
+        assert results[0]["original_text"] == results[1]["original_text"]
+
+    def test_results_are_independent_copies(self):
+        results = extract_many(["GDP grew 7% in 2024", "GDP grew 7% in 2024"])
+        results[0]["metric"] = "mutated"
+        assert results[1]["metric"] == "GDP growth rate"
+
+    def test_empty_batch(self):
+        assert extract_many([]) == []
+
+
+# =============================================================================
+# PREPROCESSING TESTS (preprocess_claim fast paths)
+# =============================================================================
+
+class TestPreprocessClaim:
+    """The fast paths must produce exactly what the six-pass version did."""
+
+    SAMPLES = [
+        "India's GDP growth rate was 7.5% in 2024",
+        "  leading and trailing  ",
+        "tabs\tand\nnewlines\r\nmixed   with  spaces",
+        "India&#8217;s GDP &amp; inflation",
+        "<b>GDP</b> grew <em>7%</em>",
+        "&lt;b&gt;escaped tags&lt;/b&gt;",
+        "zero\u200bwidth\u200c\u200d\ufeffchars",
+        "Cafe\u0301 decomposed accent",
+        "non-breaking\u00a0space\u00a0",
+        "",
+    ]
+
+    def test_matches_reference(self):
+        for text in self.SAMPLES:
+            assert preprocess_claim(text) == _preprocess_claim_reference(text), repr(text)
+
+    def test_returns_normalized_marker(self):
+        assert isinstance(preprocess_claim("GDP grew 7%"), NormalizedText)
+        assert isinstance(preprocess_claim(" <b>GDP</b> grew 7% "), NormalizedText)
+
+    def test_marker_short_circuits_second_call(self):
+        once = preprocess_claim("<b>GDP</b>  grew 7%")
+        assert preprocess_claim(once) is once
+
+    def test_derived_strings_lose_the_marker(self):
+        assert type(preprocess_claim("GDP grew 7%")[:3]) is str
+
@@ -0,0 +1,167 @@
+"""
+test_fingerprint.py — Tests for the canonical claim fingerprint
+=================================================================
+Run with:  pytest tests/test_fingerprint.py -v
+
+WHAT WE'RE TESTING:
+  - fingerprint.py: paraphrases of one claim share a key; a different
+    value, year, currency, polarity or trend shape does not
+  - The router result cache, evidence cache and NLI memo are all keyed on
+    it, so a paraphrase is a hit in each of them
+"""
+
+import sys
+import os
+import asyncio
+from datetime import date
+from unittest.mock import patch, AsyncMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from extractor import extract_all, extract_trend
+from fingerprint import claim_fingerprint, claim_polarity, value_bucket
+from verifier.evidence_fetcher import EvidenceSnippet, fetch_evidence
+from verifier.tier1_numeric import WorldBankNumericCheck
+from verifier.tier2_nli import run_nli
+from verifier.verdict_router import route_verification, _result_cache
+
+
+def _fp(text: str, ref: date | None = None):
+    return claim_fingerprint(extract_all(text, ref), text, extract_trend(text, ref))
+
+
+class TestClaimFingerprint:
+
+    def test_paraphrases_share_a_key(self):
+        keys = {_fp(t).key for t in [
+            "India's GDP growth rate was 7.5 % in 2024",
+            "GDP grew 7.5% in 2024",
+            "In 2024 the GDP growth of India stood at 7.50 per cent",
+        ]}
+        assert keys == {"GDP growth rate|IND|2024|7.5|-|affirmed|level"}
+
+    def test_scale_words_share_a_key(self):
+        assert _fp("India's population was 142.8 crore in 2023") == \
+            _fp("Population of India stood at 1.428 billion in 2023")
+
+    @pytest.mark.parametrize("other", [
+        "GDP grew 7.6% in 2024",
+        "GDP grew 7.5% in 2023",
+        "GDP growth did not reach 7.5% in 2024",
+        "GDP growth rate of China was 7.5% in 2024",
+    ])
+    def test_different_claims_differ(self, other):
+        assert _fp(other) != _fp("GDP grew 7.5% in 2024")
+
+    def test_currency_is_part_of_the_key(self):
+        assert _fp("Per capita income was ₹2,500 in 2023") != _fp("Per capita income was $2,500 in 2023")
+
+    def test_relative_year_resolves_before_keying(self):
+        assert _fp("Inflation was 5.4% last year", date(2024, 3, 1)) == _fp("Inflation was 5.4% in 2023")
+
+    def test_trend_shape(self):
+        fp = _fp("Inflation fell from 6.7% in 2022 to 5.4% in 2023")
+        assert (fp.shape, fp.detail) == ("range", (2022, "6.7"))
+        assert fp != _fp("Inflation was 5.4% in 2023")
+        assert fp.search_key == _fp("Inflation was 5.4% in 2023").search_key
+
+    def test_no_metric_or_value_means_no_fingerprint(self):
+        assert _fp("Markets closed higher today") is None
+        assert claim_fingerprint({"metric": "GDP growth rate", "value": None, "year": 2024}, "GDP growth") is None
+
+    @pytest.mark.parametrize("text, expected", [
+        ("GDP didn't grow 7.5% in 2024", "negated"),
+        ("Inflation is no longer 6%", "negated"),
+        ("Unemployment never fell below 4%", "negated"),
+        ("GDP grew 7.5% in 2024", "affirmed"),
+        ("Nothing beats 7.5% growth", "affirmed"),
+    ])
+    def test_polarity(self, text, expected):
+        assert claim_polarity(text) == expected
+
+    def test_value_bucket(self):
+        assert value_bucket(7.5) == value_bucket(7.50000001) == "7.5"
+        assert value_bucket(1.4e12) != value_bucket(1.41e12)
+
+
+# =============================================================================
+# CACHES
+# =============================================================================
+
+def _t1(official_value=7.4, percentage_error=1.3):
+    return WorldBankNumericCheck(
+        official_value=official_value, claimed_value=7.5,
+        percentage_error=percentage_error, source="World Bank",
+        indicator_code="NY.GDP.MKTP.KD.ZG",
+        source_url="https://data.worldbank.org/indicator/NY.GDP.MKTP.KD.ZG?locations=IN",
+        year=2024,
+    )
+
+
+class TestRouterCache:
+
+    @patch("verifier.verdict_router.tier1_numeric_check", new_callable=AsyncMock)
+    def test_paraphrase_is_a_hit(self, mock_t1):
+        mock_t1.return_value = _t1()
+        first = asyncio.run(route_verification("India's GDP growth rate was 7.5% in 2024"))
+        second = asyncio.run(route_verification("GDP grew 7.5% in 2024"))
+
+        assert mock_t1.await_count == 1
+        assert second.verdict == first.verdict
+        assert second.original_text == "GDP grew 7.5% in 2024"
+        assert _result_cache.stats()["hits"] == 1
+
+    @patch("verifier.verdict_router.tier1_numeric_check", new_callable=AsyncMock)
+    def test_different_extraction_confidence_is_a_miss(self, mock_t1):
+        """Confidence decides the Tier 1 fast path, so it is part of the key."""
+        mock_t1.return_value = _t1()
+        asyncio.run(route_verification("GDP grew 7.5% in 2024"))
+        asyncio.run(route_verification("GDP did grow to 7.5% during 2024, more or less"))
+        assert mock_t1.await_count == 2
+
+    @patch("verifier.verdict_router.tier1_numeric_check", new_callable=AsyncMock)
+    def test_unextractable_text_falls_back_to_text_key(self, mock_t1):
+        mock_t1.return_value = _t1(official_value=None, percentage_error=None)
+        with patch("verifier.verdict_router.fetch_evidence", new_callable=AsyncMock, return_value=[]), \
+             patch("verifier.verdict_router.tier3_llm_check", new_callable=AsyncMock) as mock_t3:
+            asyncio.run(route_verification("Markets closed higher today"))
+            asyncio.run(route_verification("The minister spoke about reforms"))
+        assert mock_t3.await_count == 2
+
+
+class TestEvidenceAndNliCaches:
+
+    def test_evidence_keyed_on_fingerprint(self):
+        fetch = AsyncMock(return_value=[])
+        fp = _fp("GDP grew 7.5% in 2024")
+        with patch("verifier.evidence_fetcher.fetch_google_fact_checks", fetch), \
+             patch("verifier.evidence_fetcher.fetch_news_snippets", AsyncMock(return_value=[])):
+            asyncio.run(fetch_evidence("GDP growth rate", 2024, 7.5, fingerprint=fp))
+            asyncio.run(fetch_evidence("GDP growth rate", 2024, 7.50000001,
+                                       fingerprint=_fp("GDP growth was 7.50 per cent in 2024")))
+        assert fetch.await_count == 1
+
+    @patch("verifier.tier2_nli._run_nli_sync")
+    def test_nli_shared_across_paraphrases(self, mock_nli):
+        mock_nli.return_value = {"labels": ["supports the claim"], "scores": [0.9]}
+        snippets = [EvidenceSnippet(
+            source="Reuters", title="GDP", snippet="India's economy grew 7.5 percent in 2024",
+            url="", published_date=None, evidence_type="news",
+        )]
+        for text in ("GDP grew 7.5% in 2024", "India's GDP growth rate was 7.5% in 2024"):
+            result = asyncio.run(run_nli(text, snippets, fingerprint=_fp(text)))
+            assert result.verdict == "entailment"
+        assert mock_nli.call_count == 1
+
+    @patch("verifier.tier2_nli._run_nli_sync")
+    def test_nli_negated_claim_is_scored_separately(self, mock_nli):
+        mock_nli.return_value = {"labels": ["supports the claim"], "scores": [0.9]}
+        snippets = [EvidenceSnippet(
+            source="Reuters", title="GDP", snippet="India's economy grew 7.5 percent in 2024",
+            url="", published_date=None, evidence_type="news",
+        )]
+        for text in ("GDP grew 7.5% in 2024", "GDP did not grow 7.5% in 2024"):
+            asyncio.run(run_nli(text, snippets, fingerprint=_fp(text)))
+        assert mock_nli.call_count == 2
@@ -0,0 +1,137 @@
+"""
+test_http_client.py — Tests for the shared pooled upstream client
+===================================================================
+Run with:  pytest tests/test_http_client.py -v
+
+WHAT WE'RE TESTING:
+  - While the service runs, upstream calls share one client and reuse its
+    keep-alive connections: one TCP connect for many requests to a host
+  - Outside the lifespan every call falls back to a client of its own
+  - HTTP2=1 without the h2 package falls back to HTTP/1.1
+  - The FastAPI lifespan opens and closes the client; /cache/stats shows it
+
+WHY A LOCAL SERVER:
+  Connection reuse only shows on a real socket, so the tests talk to a
+  keep-alive HTTP/1.1 server on 127.0.0.1 that answers like the World Bank.
+"""
+
+import sys
+import os
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from verifier import http_client, indicator_store, tier1_numeric
+from verifier.tier1_numeric import fetch_world_bank_series
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"          # keep-alive
+    disable_nagle_algorithm = True         # headers and body go out as separate writes
+
+    def do_GET(self):
+        body = json.dumps([{"page": 1, "pages": 1}, [{"date": "2023", "value": 5.65}]]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    http_client.clear_stats()
+    monkeypatch.setattr(indicator_store, "_store", None)
+    monkeypatch.setattr(tier1_numeric, "_series_cache", tier1_numeric._TtlCache(tier1_numeric.timedelta(hours=1)))
+
+
+async def _get(url, n):
+    for _ in range(n):
+        async with http_client.client() as client:
+            (await client.get(url, timeout=5)).raise_for_status()
+
+
+def _in_service(calls):
+    """startup(), await *calls*, stats() while still running, shutdown() — all on one loop, like the lifespan."""
+    async def scenario():
+        await http_client.startup()
+        try:
+            await calls()
+            return http_client.stats()
+        finally:
+            await http_client.shutdown()
+    return asyncio.run(scenario())
+
+
+class TestPool:
+
+    def test_shared_client_reuses_the_connection(self, server):
+        stats = _in_service(lambda: _get(f"{server}/a", 5))
+        assert stats["running"] and not stats["http2"]
+        assert (stats["requests"], stats["connects"], stats["reuse_rate"]) == (5, 1, 0.8)
+        assert stats["hosts"]["127.0.0.1"] == {"requests": 5, "connects": 1, "tls_handshakes": 0,
+                                               "open": 1, "idle": 1, "busy": 0}
+        assert stats["fallback_clients"] == 0
+
+    def test_without_the_lifespan_each_call_has_its_own_client(self, server):
+        asyncio.run(_get(f"{server}/a", 3))
+        stats = http_client.stats()
+        assert not stats["running"]
+        assert (stats["requests"], stats["connects"], stats["fallback_clients"]) == (3, 3, 3)
+
+    def test_startup_is_idempotent_and_shutdown_closes(self):
+        async def scenario():
+            first = await http_client.startup()
+            assert await http_client.startup() is first
+            await http_client.shutdown()
+            return first
+
+        assert asyncio.run(scenario()).is_closed
+        assert not http_client.stats()["running"]
+
+    def test_http2_without_h2_falls_back(self, server, monkeypatch, caplog):
+        monkeypatch.setattr(http_client, "HTTP2_REQUESTED", True)
+        monkeypatch.setattr(http_client, "_http2_available", lambda: False)
+
+        assert _in_service(lambda: _get(f"{server}/a", 2))["http2"] is False
+        assert "h2 package is missing" in caplog.text
+
+    def test_tier1_fetches_share_the_pool(self, server, monkeypatch):
+        monkeypatch.setattr(tier1_numeric, "WORLD_BANK_API_BASE", server)
+
+        async def fetches():
+            for year in (2021, 2022, 2023):
+                await fetch_world_bank_series(indicator_code="FP.CPI.TOTL.ZG", country="IND",
+                                              start_year=year, end_year=2023)
+
+        stats = _in_service(fetches)
+        assert (stats["requests"], stats["connects"]) == (3, 1)
+
+
+class TestLifespan:
+
+    def test_service_opens_and_closes_the_client(self):
+        from fastapi.testclient import TestClient
+        import main
+
+        with TestClient(main.app) as client:
+            stats = client.get("/cache/stats").json()["http_pool"]
+            assert stats["running"]
+            assert stats["max_connections"] == http_client.MAX_CONNECTIONS
+        assert not http_client.stats()["running"]
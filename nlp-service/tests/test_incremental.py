@@ -0,0 +1,203 @@
+"""
+test_incremental.py — Tests for incremental re-analysis (POST /analyze/incremental)
+=====================================================================================
+Run with:  pytest tests/test_incremental.py -v
+
+WHAT WE'RE TESTING:
+  - DocumentStore only calls analyze() on sentences the previous version
+    of the document didn't have, and keeps results in sentence order
+  - sentence_chunks cuts exactly where split_into_sentences does
+  - The endpoint returns exactly what /analyze returns for the same text,
+    English check included: it judges the whole text, not the edit
+"""
+
+import sys
+import os
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from claim_detector import split_into_sentences, sentence_chunks
+from incremental import DocumentStore
+
+
+class Recorder:
+    """analyze() stand-in that records which sentences it was asked for."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, sentences):
+        self.calls.append(list(sentences))
+        return [s.upper() for s in sentences]
+
+
+class TestDocumentStore:
+
+    def test_first_version_analyzes_everything(self):
+        store, analyze = DocumentStore("t"), Recorder()
+        update = store.update("doc", ["a", "b"], None, analyze)
+        assert update.results == ["A", "B"]
+        assert (update.version, update.reanalyzed, update.reused) == (1, 2, 0)
+
+    def test_only_changed_sentences_are_reanalyzed(self):
+        store, analyze = DocumentStore("t"), Recorder()
+        store.update("doc", ["a", "b", "c"], None, analyze)
+        update = store.update("doc", ["a", "b2", "c"], None, analyze)
+        assert analyze.calls[-1] == ["b2"]
+        assert update.results == ["A", "B2", "C"]
+        assert (update.version, update.reanalyzed, update.reused) == (2, 1, 2)
+
+    def test_moves_and_duplicates_are_reused(self):
+        store, analyze = DocumentStore("t"), Recorder()
+        store.update("doc", ["a", "b"], None, analyze)
+        update = store.update("doc", ["b", "a", "a"], None, analyze)
+        assert len(analyze.calls) == 1
+        assert update.results == ["B", "A", "A"]
+
+    def test_unchanged_document_calls_nothing(self):
+        store, analyze = DocumentStore("t"), Recorder()
+        store.update("doc", ["a"], None, analyze)
+        store.update("doc", ["a"], None, analyze)
+        assert len(analyze.calls) == 1
+
+    def test_removed_sentences_are_dropped(self):
+        store, analyze = DocumentStore("t"), Recorder()
+        store.update("doc", ["a", "b"], None, analyze)
+        store.update("doc", ["a"], None, analyze)
+        store.update("doc", ["a", "b"], None, analyze)
+        assert analyze.calls[-1] == ["b"]
+
+    def test_context_change_starts_over(self):
+        store, analyze = DocumentStore("t"), Recorder()
+        store.update("doc", ["a"], date(2024, 1, 1), analyze)
+        update = store.update("doc", ["a"], date(2025, 1, 1), analyze)
+        assert update.version == 1 and update.reanalyzed == 1
+
+    def test_documents_are_independent_and_bounded(self):
+        store, analyze = DocumentStore("t", maxsize=1), Recorder()
+        store.update("one", ["a"], None, analyze)
+        store.update("two", ["a"], None, analyze)
+        assert store.update("one", ["a"], None, analyze).version == 1
+        assert store.stats()["evictions"] == 2
+
+    def test_failed_analysis_keeps_previous_version(self):
+        store, analyze = DocumentStore("t"), Recorder()
+        store.update("doc", ["a"], None, analyze)
+
+        def boom(sentences):
+            raise ValueError("no")
+        with pytest.raises(ValueError):
+            store.update("doc", ["a", "b"], None, boom)
+        assert store.update("doc", ["a"], None, analyze).version == 2
+
+    def test_counters(self):
+        store, analyze = DocumentStore("t"), Recorder()
+        store.update("doc", ["a", "b"], None, analyze)
+        store.update("doc", ["a", "c"], None, analyze)
+        stats = store.stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 3, 1)
+
+
+class TestSentenceChunks:
+
+    @pytest.mark.parametrize("text", [
+        "India's GDP growth was 7.5% in 2024! Inflation hit 6.2%? Unemployment rose to 8%.",
+        "Per capita income rose to Rs. 1,85,854. Dr. Rao said so. No. 10 is next.",
+        "Costs rose etc. The end. Rs. Five. MRS. Smith! Is it? Yes.",
+        "U.S. GDP grew 2.5% in 2023.  Then it slowed.\nThe Fed held rates.",
+        "no boundary here at all",
+        "",
+    ])
+    def test_same_sentences_as_split_into_sentences(self, text):
+        chunks = sentence_chunks(text)
+        assert [s for chunk in chunks for s in split_into_sentences(chunk)] == split_into_sentences(text)
+
+    def test_editing_one_sentence_changes_one_chunk(self):
+        before = sentence_chunks("GDP grew 7% in 2024. Inflation hit 5%. Jobs rose.")
+        after = sentence_chunks("GDP grew 7% in 2024. Inflation hit 5.4%. Jobs rose.")
+        assert [a == b for a, b in zip(before, after)] == [True, False, True]
+
+
+PARAGRAPH = "India's GDP growth was 7.5% in 2024! Inflation hit 6.2%? Unemployment rose to 8%."
+
+
+class TestIncrementalEndpoint:
+
+    def _request(self, text, doc_id="doc-1", reference_date=None):
+        from main import IncrementalAnalyzeRequest
+        return IncrementalAnalyzeRequest(doc_id=doc_id, text=text, reference_date=reference_date)
+
+    def test_matches_analyze(self):
+        from main import analyze_incremental, analyze_text, ClaimRequest
+
+        full = analyze_text(ClaimRequest(text=PARAGRAPH))
+        first = analyze_incremental(self._request(PARAGRAPH))
+        assert first.results == full.results
+        assert (first.total_sentences, first.verified_count) == (full.total_sentences, full.verified_count)
+        assert (first.version, first.reanalyzed_sentences, first.reused_sentences) == (1, 3, 0)
+
+    def test_edit_reanalyzes_only_the_changed_sentence(self):
+        from main import analyze_incremental, analyze_text, ClaimRequest
+
+        analyze_incremental(self._request(PARAGRAPH))
+        edited = PARAGRAPH.replace("6.2%", "5.4% in 2023")
+        update = analyze_incremental(self._request(edited))
+
+        assert (update.version, update.reanalyzed_sentences, update.reused_sentences) == (2, 1, 2)
+        assert update.results == analyze_text(ClaimRequest(text=edited)).results
+        assert update.results[1].extraction.value == 5.4
+
+    def test_language_check_sees_the_whole_text_when_sentences_change(self):
+        from main import analyze_incremental
+
+        analyze_incremental(self._request(PARAGRAPH))
+        checked = []
+        edited = PARAGRAPH + " Exports rose 3% in 2024."
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("main.detect_claim_language", lambda text: checked.append(text) or "en")
+            analyze_incremental(self._request(PARAGRAPH + " Exports rose 3% in 2024."))
+            analyze_incremental(self._request(edited))
+        assert checked == [edited]                          # nothing for the unchanged resend
+
+    def test_short_english_sentence_appended_is_accepted(self):
+        from main import analyze_incremental, analyze_text, ClaimRequest
+
+        analyze_incremental(self._request(PARAGRAPH))
+        edited = PARAGRAPH + " Okay."                       # langdetect alone says "tl"
+        update = analyze_incremental(self._request(edited))
+        assert (update.reanalyzed_sentences, update.reused_sentences) == (1, 3)
+        assert update.results == analyze_text(ClaimRequest(text=edited)).results
+
+    def test_non_english_rewrite_rejected(self):
+        from fastapi import HTTPException
+        from main import analyze_incremental
+
+        analyze_incremental(self._request(PARAGRAPH))
+        with pytest.raises(HTTPException) as exc:
+            analyze_incremental(self._request(
+                "India's GDP growth was 7.5% in 2024! मुद्रास्फीति 6.2% पर पहुंच गई। बेरोज़गारी बढ़कर 8% हो गई।"
+            ))
+        assert exc.value.status_code == 422
+        assert analyze_incremental(self._request(PARAGRAPH)).reanalyzed_sentences == 0
+
+    def test_non_english_document_rejected(self):
+        from fastapi import HTTPException
+        from main import analyze_incremental
+
+        with pytest.raises(HTTPException) as exc:
+            analyze_incremental(self._request(
+                "भारत की जीडीपी वृद्धि दर 2024 में 7.5% थी। मुद्रास्फीति 6.2% पर पहुंच गई।"
+            ))
+        assert exc.value.status_code == 422
+
+    def test_reference_date_is_part_of_the_version(self):
+        from main import analyze_incremental
+
+        text = "Inflation eased to 5.4% last year."
+        a = analyze_incremental(self._request(text, reference_date=datetime(2024, 3, 1)))
+        b = analyze_incremental(self._request(text, reference_date=datetime(2025, 3, 1)))
+        assert b.version == 1
+        assert (a.results[0].extraction.year, b.results[0].extraction.year) == (2023, 2024)
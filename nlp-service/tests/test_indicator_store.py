@@ -0,0 +1,164 @@
+"""
+test_indicator_store.py — Tests for the local World Bank indicator store
+==========================================================================
+Run with:  pytest tests/test_indicator_store.py -v
+
+WHAT WE'RE TESTING:
+  - sync() writes every country-year of an indicator, then skips it until
+    the World Bank's "lastupdated" changes
+  - A failed sync leaves the previous data in place
+  - preload() + fetch_world_bank_series: synced ranges are answered locally,
+    anything else still goes to the API
+  - A missing store file just turns the store off
+
+WHY WE MOCK:
+  sync() would call api.worldbank.org. We give it an httpx.Client over a
+  MockTransport that serves a tiny fake indicator, and count its requests.
+"""
+
+import sys
+import os
+import asyncio
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+import pytest
+
+from memo import all_stats
+from verifier import indicator_store, tier1_numeric
+from verifier.tier1_numeric import fetch_world_bank_series, fetch_world_bank_value
+
+CODE = "FP.CPI.TOTL.ZG"
+POINTS = [
+    {"countryiso3code": "IND", "date": "2023", "value": 5.65},
+    {"countryiso3code": "IND", "date": "2022", "value": 6.7},
+    {"countryiso3code": "IND", "date": "2021", "value": None},
+    {"countryiso3code": "USA", "date": "2023", "value": 4.12},
+    {"countryiso3code": "", "date": "2023", "value": 1.0},       # aggregate without ISO3
+]
+
+
+class FakeWorldBank:
+    """Serves CODE from POINTS; everything else is an API error payload."""
+
+    def __init__(self):
+        self.last_updated = "2024-06-28"
+        self.points = list(POINTS)
+        self.fail = False
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.fail:
+            return httpx.Response(503)
+        if CODE not in request.url.path:
+            return httpx.Response(200, json=[{"message": [{"key": "Invalid value"}]}])
+        meta = {"page": 1, "pages": 1, "lastupdated": self.last_updated}
+        per_page = int(request.url.params["per_page"])
+        return httpx.Response(200, json=[meta, self.points[:per_page]])
+
+    def client(self) -> httpx.Client:
+        return httpx.Client(transport=httpx.MockTransport(self))
+
+
+@pytest.fixture
+def api():
+    return FakeWorldBank()
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "indicators.sqlite3")
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(indicator_store, "_store", None)
+    monkeypatch.setattr(tier1_numeric, "_series_cache", tier1_numeric._TtlCache(tier1_numeric.timedelta(hours=1)))
+    monkeypatch.setattr(tier1_numeric, "_value_cache", tier1_numeric._TtlCache(tier1_numeric.timedelta(hours=1)))
+
+
+def _sync(path, api, **kwargs):
+    with api.client() as client:
+        return indicator_store.sync(path, [CODE], first_year=2000, last_year=2023, client=client, **kwargs)
+
+
+class TestSync:
+
+    def test_writes_every_country_year(self, path, api):
+        assert _sync(path, api) == {CODE: "updated"}
+        store = indicator_store.IndicatorStore.load(path)
+        assert store.coverage == {CODE: (2000, 2023)}
+        assert len(store) == 4                      # the aggregate without a code is dropped
+        assert store.series(CODE, "ind", 2020, 2023) == {2022: 6.7, 2023: 5.65}
+
+    def test_unchanged_indicator_costs_one_request(self, path, api):
+        _sync(path, api)
+        api.requests.clear()
+        assert _sync(path, api) == {CODE: "unchanged"}
+        assert len(api.requests) == 1
+        assert api.requests[0].url.params["per_page"] == "1"
+
+    def test_new_release_is_refetched(self, path, api):
+        _sync(path, api)
+        api.last_updated = "2024-12-16"
+        api.points = [{"countryiso3code": "IND", "date": "2023", "value": 5.4}]
+        assert _sync(path, api) == {CODE: "updated"}
+        assert indicator_store.IndicatorStore.load(path).series(CODE, "IND", 2000, 2023) == {2023: 5.4}
+
+    def test_wider_range_is_refetched(self, path, api):
+        _sync(path, api)
+        with api.client() as client:
+            result = indicator_store.sync(path, [CODE], first_year=1990, last_year=2023, client=client)
+        assert result == {CODE: "updated"}
+
+    def test_failure_keeps_old_data(self, path, api):
+        _sync(path, api)
+        api.fail = True
+        assert _sync(path, api, force=True)[CODE].startswith("failed")
+        assert indicator_store.IndicatorStore.load(path).series(CODE, "USA", 2023, 2023) == {2023: 4.12}
+
+    def test_error_payload_is_a_failure(self, path, api):
+        with api.client() as client:
+            result = indicator_store.sync(path, ["NO.SUCH.CODE"], first_year=2000, last_year=2023, client=client)
+        assert result["NO.SUCH.CODE"].startswith("failed")
+
+    def test_status(self, path, api):
+        _sync(path, api)
+        [(indicator, last_updated, first, last, _, n)] = indicator_store.status(path)
+        assert (indicator, last_updated, first, last, n) == (CODE, "2024-06-28", 2000, 2023, 4)
+
+
+class TestServing:
+
+    def test_synced_range_never_calls_the_api(self, path, api):
+        _sync(path, api)
+        assert indicator_store.preload(path) is not None
+        with patch("verifier.tier1_numeric.httpx.AsyncClient", side_effect=AssertionError("network")):
+            series = asyncio.run(fetch_world_bank_series(
+                indicator_code=CODE, country="IND", start_year=2021, end_year=2023, timeout_seconds=1))
+            value = asyncio.run(fetch_world_bank_value(
+                indicator_code=CODE, country="IND", year=2022))
+        assert series == {2022: 6.7, 2023: 5.65}
+        assert value == 6.7
+
+    def test_outside_coverage_falls_back_to_the_api(self, path, api):
+        _sync(path, api)
+        indicator_store.preload(path)
+        assert indicator_store.lookup(CODE, "IND", 2023, 2024) is None
+        assert indicator_store.lookup("NY.GDP.MKTP.KD.ZG", "IND", 2023, 2023) is None
+
+    def test_missing_file_turns_the_store_off(self, path):
+        assert indicator_store.preload(path) is None
+        assert indicator_store.lookup(CODE, "IND", 2023, 2023) is None
+        assert indicator_store.preload("") is None
+
+    def test_hits_and_misses_in_cache_stats(self, path, api):
+        _sync(path, api)
+        indicator_store.preload(path)
+        indicator_store.lookup(CODE, "IND", 2023, 2023)
+        indicator_store.lookup(CODE, "IND", 2030, 2030)
+        stats = next(s for s in all_stats() if s["name"] == "indicator_store")
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 4)
@@ -0,0 +1,113 @@
+"""
+test_language_gate.py — Tests for the cached, short-circuiting language check (N-24)
+=====================================================================================
+Run with:  pytest tests/test_language_gate.py -v
+
+WHAT WE'RE TESTING:
+  - Obvious cases never reach langdetect: non-Latin scripts are decided by
+    a script scan, ASCII text naming a known metric is English
+  - Everything else still goes through langdetect, with the same answers
+  - Results are memoized by text hash, and each path is counted
+"""
+
+import sys
+import os
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+import claim_detector
+from claim_detector import detect_claim_language, language_gate_stats
+
+
+def _paths_after(*texts):
+    before = language_gate_stats()
+    languages = [detect_claim_language(t) for t in texts]
+    after = language_gate_stats()
+    return languages, {path: after[path] - before[path] for path in after if after[path] != before[path]}
+
+
+class TestShortCircuits:
+
+    @pytest.mark.parametrize("text, expected", [
+        ("भारत की जीडीपी वृद्धि दर 2024 में 7.5% थी।", "hi"),
+        ("ভারতের জিডিপি বৃদ্ধি ৭.৫%", "bn"),
+        ("இந்தியாவின் பணவீக்கம் 5%", "ta"),
+        ("Инфляция в России составила 7%", "ru"),
+        ("India की GDP वृद्धि दर 2024 में 7.5% थी", "hi"),     # mostly Devanagari
+    ])
+    def test_script_decides_non_latin_text(self, text, expected):
+        with patch("claim_detector._language_detector_factory", side_effect=AssertionError("detector ran")):
+            languages, paths = _paths_after(text)
+        assert languages == [expected]
+        assert paths == {"script": 1}
+
+    @pytest.mark.parametrize("text", [
+        "India's GDP growth was 7.5% in 2024",
+        "Per capita income to cross ₹2 lakh in FY25",        # symbols don't make it non-ASCII
+        "UNEMPLOYMENT ROSE TO 8%",
+    ])
+    def test_ascii_text_with_a_metric_is_english(self, text):
+        with patch("claim_detector._language_detector_factory", side_effect=AssertionError("detector ran")):
+            languages, paths = _paths_after(text)
+        assert languages == ["en"]
+        assert paths == {"keyword": 1}
+
+    @pytest.mark.parametrize("text, expected", [
+        ("La inflación en España fue del 3% en 2023", "es"),
+        ("Le PIB de la France a fortement augmenté cette année", "fr"),
+        ("The weather is nice today and the sun is shining", "en"),
+    ])
+    def test_ambiguous_text_runs_the_detector(self, text, expected):
+        from langdetect import detect, DetectorFactory
+        DetectorFactory.seed = 0
+        languages, paths = _paths_after(text)
+        assert languages == [expected] == [detect(text)]
+        assert paths == {"detector": 1}
+
+    def test_detector_failure_falls_back_to_english(self):
+        languages, paths = _paths_after("7.5% 2024")      # no letters — langdetect raises
+        assert languages == ["en"]
+        assert paths == {"fallback": 1}
+
+    def test_metric_must_be_a_whole_word(self):
+        """"gdpx" is not a metric mention, so the text is ambiguous."""
+        _, paths = _paths_after("gdpx zzz qqq")
+        assert "keyword" not in paths
+
+
+class TestLanguageCache:
+
+    def test_repeated_text_is_a_cache_hit(self):
+        text = "Le PIB de la France a fortement augmenté cette année"
+        with patch.object(claim_detector, "_detect_language", wraps=claim_detector._detect_language) as spy:
+            languages, paths = _paths_after(text, text, text)
+        assert languages == ["fr"] * 3
+        assert spy.call_count == 1
+        assert paths == {"detector": 1, "cache": 2}
+
+    def test_cache_is_keyed_on_a_hash_not_the_text(self):
+        text = "India's GDP growth was 7.5% in 2024 " * 100
+        detect_claim_language(text)
+        assert text not in claim_detector._language_memo._items
+        assert claim_detector._language_memo.stats()["size"] == 1
+
+    def test_profiles_load_once(self):
+        claim_detector._language_detector_factory.cache_clear()
+        with patch("langdetect.detector_factory.DetectorFactory.load_profile") as load:
+            for text in ("Le PIB de la France", "La inflación en España", "Die Wirtschaft wächst"):
+                detect_claim_language(text)
+        assert load.call_count == 1
+        claim_detector._language_detector_factory.cache_clear()
+
+
+class TestCacheStatsEndpoint:
+
+    def test_reports_language_paths(self):
+        from main import cache_stats
+        detect_claim_language("India's GDP growth was 7.5% in 2024")
+        stats = cache_stats()
+        assert set(stats["language_paths"]) == {"cache", "script", "keyword", "detector", "fallback"}
+        assert "detect_claim_language" in {m["name"] for m in stats["memos"]}
@@ -0,0 +1,127 @@
+"""
+test_lexer.py — Tests for the shared token stages
+====================================================
+Run with:  pytest tests/test_lexer.py -v
+
+WHAT WE'RE TESTING:
+  - Every stage equals the standalone function it replaces
+  - extract_all() on the shared stages equals the per-stage reference,
+    including the substring gates that skip patterns (and their Unicode
+    case-folding corners)
+  - The scorer and the extractors lex a sentence once between them
+"""
+
+import sys
+import os
+import random
+from datetime import date
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+import lexer
+from benchmarks.hotpath import load_corpus
+from claim_detector import split_into_sentences, score_claim_probability
+from countries import find_country_mentions
+from extractor import (
+    extract_all, extract_claims, extract_trend, preprocess_claim,
+    _extract_normalized, _extract_normalized_reference,
+)
+from lexer import Lexed, lex
+from metrics import find_metric, find_metric_mentions, _METRIC_INDEX
+from periods import find_periods
+
+
+def _corpus():
+    corpus = load_corpus()
+    texts = list(corpus["claims"]) + list(corpus["adversarial"])
+    for article in corpus["articles"]:
+        texts.extend(split_into_sentences(article))
+    return [preprocess_claim(t) for t in texts]
+
+
+CORPUS = _corpus()
+REFERENCE_DATES = (None, date(2021, 7, 1))
+
+# Unicode characters re.IGNORECASE matches to ASCII letters that lower() keeps
+FOLDING = [
+    "Growth was 7.5 ſpercent in 2023",
+    "GDP hit 5 thouſand crore",
+    "Debt rose to 5 mİllion",
+    "İnflation was 5 per cent",
+    "Exports were 3 bıllion last year",
+    "GDP grew 4 Kelvin thousand",
+    "Fy2023-24 inflation was 5%",
+    "The fıscal deficit was 6 this fıscal",
+]
+
+
+class TestStagesMatchStandaloneFunctions:
+
+    def test_metric_and_mentions(self):
+        for text in CORPUS:
+            lexed = Lexed(text)
+            assert lexed.metric == find_metric(text), text
+            assert lexed.metric_mentions == find_metric_mentions(text), text
+
+    def test_index_scan_is_best_and_mentions(self):
+        for text in CORPUS:
+            lower = text.lower()
+            assert _METRIC_INDEX.scan(lower) == (_METRIC_INDEX.best(lower), _METRIC_INDEX.mentions(lower))
+
+    def test_countries(self):
+        for text in CORPUS:
+            assert Lexed(text).countries == find_country_mentions(text), text
+
+    @pytest.mark.parametrize("ref", REFERENCE_DATES)
+    def test_periods(self, ref):
+        for text in CORPUS + FOLDING + ["two years ago", "this quarter", "FY'25", "next financial year"]:
+            assert Lexed(text).periods(ref) == find_periods(text, ref), text
+
+    def test_claim_tokens_merge_periods(self):
+        values, years = Lexed("Unemployment was 3.2% in FY25 and 3.5% in 2023").claim_tokens(date(2024, 8, 1))
+        assert [v[2] for v in values] == [3.2, 3.5]        # FY25 is not also the value 25
+        assert [y[2] for y in years] == [2025, 2023]
+
+
+class TestExtractionMatchesReference:
+
+    @pytest.mark.parametrize("ref", REFERENCE_DATES)
+    def test_corpus(self, ref):
+        for text in CORPUS:
+            assert _extract_normalized(text, ref) == _extract_normalized_reference(text, ref), text
+
+    @pytest.mark.parametrize("text", FOLDING)
+    def test_case_folding_never_skips_a_match(self, text):
+        assert _extract_normalized(text) == _extract_normalized_reference(text)
+
+    def test_random_fragments(self):
+        rng = random.Random(7)
+        parts = ["GDP", "inflation", "FY", "fy", "2023", "2024-25", "FY2023-24", "7.5", "%", " percent",
+                 " per cent", "lakh", "crore", "billion", "thouſand", "mİllion", "₹", "-", "1,500", "last year",
+                 "this fiscal", "FY25", "two years ago", "India", "rose", ",", "."]
+        for _ in range(3000):
+            text = preprocess_claim("".join(rng.choice(parts) + rng.choice(["", " "]) for _ in range(rng.randint(1, 10))))
+            assert _extract_normalized(text) == _extract_normalized_reference(text), text
+
+
+class TestSharedOnce:
+
+    def test_scorer_and_extractors_lex_a_sentence_once(self):
+        sentence = "India's GDP grew from 6% in 2023 to 7.5% in 2024"
+        with patch("lexer._scan_numbers", wraps=lexer._scan_numbers) as numbers, \
+             patch("lexer.find_country_mentions", wraps=lexer.find_country_mentions) as countries, \
+             patch("lexer.find_metric_and_mentions", wraps=lexer.find_metric_and_mentions) as metrics:
+            score_claim_probability(sentence)
+            extract_all(sentence)
+            extract_claims(sentence)
+            extract_trend(sentence)
+        assert numbers.call_count == countries.call_count == metrics.call_count == 1
+        assert lexer._lex_memo.stats()["misses"] == 1
+
+    def test_memo_size_zero_still_works(self, monkeypatch):
+        monkeypatch.setattr(lexer._lex_memo, "maxsize", 0)
+        assert lex("GDP grew 7%") is not lex("GDP grew 7%")
+        assert extract_all("GDP grew 7%")["value"] == 7.0
@@ -0,0 +1,84 @@
+"""
+test_memo.py — Tests for the shared extraction memo (memo.py)
+==============================================================
+Run with:  pytest tests/test_memo.py -v
+
+WHAT WE'RE TESTING:
+  - LruMemo bookkeeping: hits, misses, evictions, LRU order
+  - extract_all / score_claim_probability actually go through the memo
+  - Cached dicts can't be corrupted by callers mutating their copy
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from memo import LruMemo
+from extractor import extract_all, _extraction_memo
+from claim_detector import score_claim_probability, _score_memo
+
+
+class TestLruMemo:
+
+    def test_hit_and_miss_counters(self):
+        memo = LruMemo("t", maxsize=4)
+        calls = []
+        compute = lambda k: calls.append(k) or k.upper()
+
+        assert memo.get_or_compute("a", compute) == "A"
+        assert memo.get_or_compute("a", compute) == "A"
+        assert calls == ["a"]
+        stats = memo.stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_evicts_least_recently_used(self):
+        memo = LruMemo("t", maxsize=2)
+        compute = lambda k: k
+        memo.get_or_compute("a", compute)
+        memo.get_or_compute("b", compute)
+        memo.get_or_compute("a", compute)      # "a" is now most recent
+        memo.get_or_compute("c", compute)      # evicts "b"
+        assert memo.stats()["evictions"] == 1
+        memo.get_or_compute("a", compute)
+        assert memo.stats()["hits"] == 2       # "a" survived
+
+    def test_zero_size_disables_storage(self):
+        memo = LruMemo("t", maxsize=0)
+        memo.get_or_compute("a", lambda k: k)
+        memo.get_or_compute("a", lambda k: k)
+        assert memo.stats()["size"] == 0
+        assert memo.stats()["hits"] == 0
+
+    def test_exceptions_are_not_cached(self):
+        memo = LruMemo("t", maxsize=2)
+
+        def boom(_):
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError):
+            memo.get_or_compute("a", boom)
+        assert memo.get_or_compute("a", lambda k: 1) == 1
+
+
+class TestPipelineMemo:
+
+    def test_extract_all_keyed_on_normalized_text(self):
+        """Whitespace/markup variants of the same claim hit the same entry."""
+        extract_all("GDP grew 7% in 2024")
+        extract_all("  <b>GDP</b>   grew 7% in 2024 ")
+        stats = _extraction_memo.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_extract_all_returns_copies(self):
+        first = extract_all("GDP grew 7% in 2024")
+        first["metric"] = "mutated"
+        assert extract_all("GDP grew 7% in 2024")["metric"] == "GDP growth rate"
+
+    def test_score_claim_probability_memoized(self):
+        sentence = "India's GDP growth was 7.5% in 2024"
+        assert score_claim_probability(sentence) == score_claim_probability(sentence)
+        assert _score_memo.stats()["hits"] == 1
@@ -0,0 +1,113 @@
+"""
+test_metric_index.py — Tests for the trigram-indexed metric matcher
+=====================================================================
+Run with:  pytest tests/test_metric_index.py -v
+
+WHAT WE'RE TESTING:
+  - pattern_anchor finds a literal every match must contain
+  - MetricIndex returns exactly what trying every pattern returns, for the
+    real registry and for a synthetic 500-metric taxonomy
+  - the new World Bank indicators are recognised
+"""
+
+import sys
+import os
+import random
+import re
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from metric_index import MetricIndex, pattern_anchor
+from metrics import (
+    METRIC_INDICATORS, find_metric, find_metric_mentions,
+    _find_metric_linear, _find_metric_mentions_linear,
+)
+
+
+class TestPatternAnchor:
+
+    @pytest.mark.parametrize("pattern, anchor", [
+        (r"gdp\s+growth\s+rate", "growth"),
+        (r"forex\s+reserves?", "reserve"),
+        (r"foreign\s+exchange\s+reserves?", "exchange"),
+        (r"india.{0,15}population", "population"),
+        (r"bpl\s+(?:rate|percentage)", "bpl"),
+        (r"\bcad\b", "cad"),
+        (r"labou?r\s+force\s+participation", "participation"),
+        (r"\$\s?2\.15\s+(?:a|per)\s+day", "2.15"),
+        (r"r\s?&\s?d\s+spending", "spending"),
+    ])
+    def test_anchor(self, pattern, anchor):
+        assert pattern_anchor(pattern) == anchor
+
+    @pytest.mark.parametrize("pattern", [r"\bfx\b", r"gdp|gnp", r"(?:gdp|gnp)\s+up"])
+    def test_no_guaranteed_anchor(self, pattern):
+        assert pattern_anchor(pattern) is None
+
+    def test_unanchored_patterns_still_match(self):
+        index = MetricIndex([(r"\bfx\b", "fx"), (r"gdp|gnp", "gdp")])
+        assert index.best("gnp rose") == 1
+        assert index.best("fx reserves") == 0
+
+
+SAMPLES = [
+    "India's GDP growth rate was 7.5% in 2024",
+    "GDP data aside, the inflation rate hit 6% and the jobless rate 8%",
+    "India's FDI inflows hit $71 billion in 2023 while remittances rose",
+    "Female labour force participation rose to 37% as youth unemployment fell",
+    "Exports were 22% of GDP in 2023; merchandise exports topped $437 billion",
+    "India's population growth rate slowed while urban population rose",
+    "Infant mortality and maternal mortality both fell; life expectancy is 70",
+    "The cadre review is pending",
+    "Nothing about the economy here",
+    "",
+]
+
+
+class TestRegistryIndex:
+
+    @pytest.mark.parametrize("text", SAMPLES)
+    def test_same_as_trying_every_pattern(self, text):
+        assert find_metric(text) == _find_metric_linear(text)
+        assert find_metric_mentions(text) == _find_metric_mentions_linear(text)
+
+    @pytest.mark.parametrize("text, metric", [
+        ("India's FDI inflows hit $71 billion in 2023", "FDI inflows"),
+        ("Life expectancy rose to 70.8 years in 2021", "life expectancy"),
+        ("Youth unemployment rate was 23% in 2023", "youth unemployment rate"),
+        ("India is a $3.7 trillion economy", "nominal GDP"),
+        ("India's population growth rate was 0.8% in 2023", "population growth rate"),
+        ("India's population grew by 12% from 2011 to 2021", "population"),
+        ("Exports were 22% of GDP in 2023", "exports to GDP ratio"),
+        ("CO2 emissions per capita were 2 tonnes in 2022", "CO2 emissions per capita"),
+    ])
+    def test_new_indicators(self, text, metric):
+        assert find_metric(text)["metric"] == metric
+        assert metric in METRIC_INDICATORS
+
+
+def _synthetic_taxonomy(n_metrics: int, seed: int = 3):
+    rng = random.Random(seed)
+    words = ["net", "gross", "rural", "urban", "rail", "steel", "coal", "dairy", "index", "output",
+             "yield", "stock", "tariff", "freight", "cement", "export", "import", "subsidy"]
+    entries = []
+    for i in range(n_metrics):
+        a, b, c = rng.sample(words, 3)
+        entries.append((rf"{a}\s+{b}\s+{c}", ("m", i, "strong")))
+        entries.append((rf"\b{b}s?\s+{c}\b", ("m", i, "weak")))
+    return entries, words
+
+
+class TestSyntheticScale:
+
+    def test_matches_linear_scan_at_500_metrics(self):
+        entries, words = _synthetic_taxonomy(500)
+        index = MetricIndex(entries)
+        compiled = [re.compile(p) for p, _ in entries]
+        rng = random.Random(11)
+        for _ in range(300):
+            text = " ".join(rng.choice(words + ["the", "rose", "7%"]) for _ in range(12))
+            expected = next((i for i, regex in enumerate(compiled) if regex.search(text)), None)
+            assert index.best(text) == expected, text
@@ -0,0 +1,39 @@
+"""
+test_metric_registry.py — Tests for the metric registry
+=========================================================
+Run with:  pytest tests/test_metric_registry.py -v
+
+WHAT WE'RE TESTING:
+  - data/metrics.json drives every metric table (metrics, tier1, claim_detector)
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from metrics import (
+    METRIC_REGISTRY, METRIC_PATTERNS, METRIC_INDICATORS, METRIC_KEYWORDS,
+    PERCENTAGE_METRICS, ABSOLUTE_METRICS, get_all_metric_names,
+)
+from verifier.tier1_numeric import METRIC_TO_WORLD_BANK_INDICATOR
+
+
+class TestRegistry:
+
+    def test_every_metric_has_a_unit(self):
+        names = set(get_all_metric_names())
+        assert PERCENTAGE_METRICS | ABSOLUTE_METRICS == names
+        assert not PERCENTAGE_METRICS & ABSOLUTE_METRICS
+
+    def test_tier1_indicators_come_from_registry(self):
+        assert METRIC_TO_WORLD_BANK_INDICATOR == METRIC_INDICATORS
+        assert set(METRIC_INDICATORS) == set(get_all_metric_names())
+
+    def test_patterns_keep_registry_order(self):
+        assert [m["name"] for m in METRIC_PATTERNS] == [m["name"] for m in METRIC_REGISTRY]
+
+    def test_keywords_include_names_and_short_forms(self):
+        assert "gdp growth rate" in METRIC_KEYWORDS
+        assert "forex" in METRIC_KEYWORDS
+        assert len(METRIC_KEYWORDS) == len(set(METRIC_KEYWORDS))
@@ -0,0 +1,89 @@
+"""
+test_periods.py — Tests for relative / fiscal period resolution (periods.py)
+==============================================================================
+Run with:  pytest tests/test_periods.py -v
+
+WHAT WE'RE TESTING:
+  - "last year", "this fiscal", "previous quarter", "FY25" → concrete years
+  - Resolution is anchored on the caller's reference date
+  - extract_all / extract_claims use it, and the memo keeps dates apart
+"""
+
+import sys
+import os
+from datetime import date, datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from periods import resolve_period, find_periods
+from extractor import extract_all, extract_claims, extract_year
+
+AUG_2024 = date(2024, 8, 1)    # fiscal year 2024-25
+FEB_2024 = date(2024, 2, 14)   # fiscal year 2023-24
+
+
+class TestResolvePeriod:
+
+    @pytest.mark.parametrize("text, expected", [
+        ("inflation eased last year", 2023),
+        ("in the previous year", 2023),
+        ("this year", 2024),
+        ("next year", 2025),
+        ("two years ago", 2022),
+        ("a year ago", 2023),
+    ])
+    def test_calendar_years(self, text, expected):
+        assert resolve_period(text, AUG_2024) == expected
+
+    def test_fiscal_year_depends_on_month(self):
+        assert resolve_period("this fiscal", AUG_2024) == 2025
+        assert resolve_period("this fiscal", FEB_2024) == 2024
+        assert resolve_period("last fiscal year", AUG_2024) == 2024
+        assert resolve_period("the current financial year", AUG_2024) == 2025
+
+    def test_quarters_and_months_cross_year_boundaries(self):
+        assert resolve_period("the previous quarter", date(2024, 1, 20)) == 2023
+        assert resolve_period("the previous quarter", AUG_2024) == 2024
+        assert resolve_period("last month", date(2024, 1, 5)) == 2023
+
+    @pytest.mark.parametrize("text, expected", [
+        ("FY25", 2025), ("FY'24", 2024), ("FY 23", 2023), ("FY24-25", 2025), ("FY2025", 2025),
+    ])
+    def test_abbreviated_fiscal_years(self, text, expected):
+        assert resolve_period(text, AUG_2024) == expected
+
+    def test_full_fiscal_year_is_left_to_extract_year(self):
+        assert resolve_period("FY2024-25", AUG_2024) is None
+
+    def test_accepts_datetime(self):
+        published = datetime(2024, 3, 10, 8, 0, tzinfo=timezone.utc)
+        assert resolve_period("last year", published) == 2023
+
+    def test_no_period(self):
+        assert resolve_period("GDP growth was strong", AUG_2024) is None
+
+    def test_find_periods_spans(self):
+        text = "from 6.7% last year to 5.4% this year"
+        assert find_periods(text, AUG_2024) == [(10, 19, 2023), (28, 37, 2024)]
+
+
+class TestExtractorIntegration:
+
+    def test_explicit_year_wins(self):
+        assert extract_year("GDP grew 7% in 2022, faster than last year", AUG_2024) == 2022
+
+    def test_extract_all_resolves_relative_year(self):
+        result = extract_all("Retail inflation rate eased to 5.4% last year", FEB_2024)
+        assert result["year"] == 2023
+        assert result["confidence"] == 0.9   # all three fields → full confidence
+
+    def test_memo_keeps_reference_dates_apart(self):
+        text = "GDP growth rate was 8.2% last year"
+        assert extract_all(text, date(2025, 6, 2))["year"] == 2024
+        assert extract_all(text, date(2023, 6, 2))["year"] == 2022
+
+    def test_fy_abbreviation_is_not_a_value(self):
+        (claim,) = extract_claims("Unemployment rate dipped to 3.2% in FY24", AUG_2024)
+        assert (claim["value"], claim["year"]) == (3.2, 2024)
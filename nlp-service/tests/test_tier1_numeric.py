@@ -0,0 +1,168 @@
+"""
+test_tier1_numeric.py — Tests for Tier 1: World Bank numeric checks
+=====================================================================
+Run with:  pytest tests/test_tier1_numeric.py -v
+
+WHAT WE'RE TESTING:
+  - tier1_trend_check: range claims (both endpoints) and change claims
+    (absolute points or relative percent) against ONE series fetch
+  - The series fetch fills the per-year value cache
+
+WHY WE MOCK:
+  fetch_world_bank_series would call api.worldbank.org. We replace it with
+  an AsyncMock returning a fixed {year: value} series, so tests run offline
+  and we can count how many fetches were made.
+"""
+
+import sys
+import os
+import asyncio
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import patch, AsyncMock
+
+import pytest
+
+from verifier import tier1_numeric
+from verifier.tier1_numeric import tier1_trend_check, fetch_world_bank_value
+
+
+SERIES = {2022: 6.7, 2023: 5.65}
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches(monkeypatch):
+    monkeypatch.setattr(tier1_numeric, "_series_cache", tier1_numeric._TtlCache(tier1_numeric.timedelta(hours=1)))
+    monkeypatch.setattr(tier1_numeric, "_value_cache", tier1_numeric._TtlCache(tier1_numeric.timedelta(hours=1)))
+
+
+class TestTrendCheck:
+
+    @patch("verifier.tier1_numeric.fetch_world_bank_series", new_callable=AsyncMock)
+    def test_range_checks_both_endpoints_with_one_fetch(self, mock_series):
+        mock_series.return_value = SERIES
+        check = asyncio.run(tier1_trend_check(
+            metric="inflation rate", start_year=2022, end_year=2023,
+            start_value=6.7, end_value=7.0,
+        ))
+        assert mock_series.await_count == 1
+        assert mock_series.call_args.kwargs["start_year"] == 2022
+        assert mock_series.call_args.kwargs["end_year"] == 2023
+        assert (check.official_start, check.official_end) == (6.7, 5.65)
+        # start is exact, end is off by 23.89% — the worse endpoint wins
+        assert check.percentage_error == 23.89
+        assert check.official_change == -1.05
+
+    @patch("verifier.tier1_numeric.fetch_world_bank_series", new_callable=AsyncMock)
+    def test_absolute_change(self, mock_series):
+        mock_series.return_value = SERIES
+        check = asyncio.run(tier1_trend_check(
+            metric="inflation rate", start_year=2022, end_year=2023, change=-1.0,
+        ))
+        assert check.kind == "change"
+        assert check.official_change == -1.05
+        assert check.percentage_error == 4.76
+
+    @patch("verifier.tier1_numeric.fetch_world_bank_series", new_callable=AsyncMock)
+    def test_wrong_direction_is_a_large_error(self, mock_series):
+        mock_series.return_value = SERIES
+        check = asyncio.run(tier1_trend_check(
+            metric="inflation rate", start_year=2022, end_year=2023, change=1.05,
+        ))
+        assert check.percentage_error == 200.0
+
+    @patch("verifier.tier1_numeric.fetch_world_bank_series", new_callable=AsyncMock)
+    def test_relative_change(self, mock_series):
+        mock_series.return_value = {2011: 1.25e9, 2021: 1.40e9}
+        check = asyncio.run(tier1_trend_check(
+            metric="population", start_year=2011, end_year=2021,
+            change=12.0, change_unit="relative",
+        ))
+        assert check.official_change == 12.0
+        assert check.percentage_error == 0.0
+
+    @patch("verifier.tier1_numeric.fetch_world_bank_series", new_callable=AsyncMock)
+    def test_missing_year_is_unverifiable(self, mock_series):
+        mock_series.return_value = {2022: 6.7}
+        check = asyncio.run(tier1_trend_check(
+            metric="inflation rate", start_year=2022, end_year=2023, change=-1.0,
+        ))
+        assert check.percentage_error is None
+        assert check.official_start == 6.7
+
+    def test_unknown_metric_skips_fetch(self):
+        check = asyncio.run(tier1_trend_check(
+            metric="happiness index", start_year=2022, end_year=2023, change=1.0,
+        ))
+        assert check.indicator_code is None
+        assert check.percentage_error is None
+
+    @patch("verifier.tier1_numeric.fetch_world_bank_series", new_callable=AsyncMock)
+    def test_series_fills_value_cache(self, mock_series):
+        mock_series.return_value = SERIES
+        asyncio.run(tier1_trend_check(
+            metric="inflation rate", start_year=2022, end_year=2023, change=-1.0,
+        ))
+        value = asyncio.run(fetch_world_bank_value(indicator_code="FP.CPI.TOTL.ZG", year=2023))
+        assert value == 5.65
+        assert mock_series.await_count == 1   # served from the value cache
+
+
+class TestCurrencyConversion:
+
+    @patch("verifier.tier1_numeric.fetch_world_bank_value", new_callable=AsyncMock)
+    def test_rupee_claim_compared_in_dollars(self, mock_value):
+        mock_value.return_value = 2480.8
+        check = asyncio.run(tier1_numeric.tier1_numeric_check(
+            metric="per capita income", claimed_value=172000, year=2023, currency="INR",
+        ))
+        assert check.claimed_value == 172000
+        assert check.compared_value == pytest.approx(172000 / 82.60)
+        assert check.percentage_error == 16.06
+        assert "INR/USD" in check.conversion
+
+    @patch("verifier.tier1_numeric.fetch_world_bank_value", new_callable=AsyncMock)
+    def test_native_currency_is_not_converted(self, mock_value):
+        mock_value.return_value = 650e9
+        check = asyncio.run(tier1_numeric.tier1_numeric_check(
+            metric="foreign exchange reserves", claimed_value=650e9, year=2024, currency="USD",
+        ))
+        assert check.conversion is None
+        assert check.percentage_error == 0.0
+
+    @patch("verifier.tier1_numeric.fetch_world_bank_value", new_callable=AsyncMock)
+    def test_rate_metrics_ignore_currency(self, mock_value):
+        mock_value.return_value = 7.5
+        check = asyncio.run(tier1_numeric.tier1_numeric_check(
+            metric="GDP growth rate", claimed_value=7.5, year=2024, currency="INR",
+        ))
+        assert check.conversion is None
+        assert check.percentage_error == 0.0
+
+    @patch("verifier.tier1_numeric.fetch_world_bank_series", new_callable=AsyncMock)
+    def test_range_endpoints_use_their_own_year_rate(self, mock_series):
+        mock_series.return_value = {2022: 150000 / 78.60, 2023: 172000 / 82.60}
+        check = asyncio.run(tier1_trend_check(
+            metric="per capita income", start_year=2022, end_year=2023,
+            start_value=150000, end_value=172000, currency="INR",
+        ))
+        assert check.percentage_error == 0.0
+        assert check.conversion.count("INR/USD") == 2
+
+    @patch("verifier.tier1_numeric.fetch_world_bank_series", new_callable=AsyncMock)
+    def test_note_lists_only_the_endpoints_converted(self, mock_series):
+        mock_series.return_value = {2022: 1800.0, 2023: 172000 / 82.60}
+
+        def end_only(value, *, currency, native_currency, year):
+            if year == 2023:
+                return value / 82.60, "172000 INR → 2082.32 USD @ 82.6 INR/USD (2023, fx 2024.1)"
+            return value, None
+
+        with patch("verifier.tier1_numeric.to_native_units", side_effect=end_only):
+            check = asyncio.run(tier1_trend_check(
+                metric="per capita income", start_year=2022, end_year=2023,
+                start_value=1800, end_value=172000, currency="INR",
+            ))
+        assert check.conversion == "172000 INR → 2082.32 USD @ 82.6 INR/USD (2023, fx 2024.1)"
+        assert check.percentage_error == 0.0
@@ -0,0 +1,129 @@
+"""
+test_units.py — Tests for currency / scale normalisation
+==========================================================
+Run with:  pytest tests/test_units.py -v
+
+WHAT WE'RE TESTING:
+  - units.py: currency detection next to a number, rupee inference for
+    Indian scales and digit grouping, conversion with the local FX table
+  - extractor.py reports the currency and scale of the value it extracted
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+import units
+from units import currency_near, infer_currency, fx_rate, convert, to_native_units
+from extractor import extract_all, extract_claims
+
+
+def _near(text: str, number: str) -> str | None:
+    start = text.index(number)
+    return currency_near(text, start, start + len(number))
+
+
+class TestCurrencyNear:
+
+    @pytest.mark.parametrize("text, number, expected", [
+        ("Per capita income is ₹1,72,000", "1,72,000", "INR"),
+        ("Income of Rs. 2 lakh", "2", "INR"),
+        ("Reserves hit $650 billion", "650", "USD"),
+        ("Reserves hit US$ 650 billion", "650", "USD"),
+        ("Reserves of 650 billion dollars", "650", "USD"),
+        ("Debt of 2 lakh crore rupees", "2", "INR"),
+        ("GDP of €3.9 trillion", "3.9", "EUR"),
+        ("GDP of 560 trillion yen", "560", "JPY"),
+    ])
+    def test_detects_stated_currency(self, text, number, expected):
+        assert _near(text, number) == expected
+
+    def test_prefix_inside_span(self):
+        """extract_claims spans already include the ₹ / Rs prefix."""
+        text = "Debt stood at ₹2 lakh crore"
+        start = text.index("₹")
+        assert currency_near(text, start, len(text)) == "INR"
+
+    def test_no_currency(self):
+        assert _near("Population was 140 crore in 2023", "140") is None
+
+    def test_word_inside_another_word_is_not_a_currency(self):
+        assert _near("Hours 40 per week", "40") is None
+
+
+class TestInferCurrency:
+
+    def test_stated_currency_wins(self):
+        assert infer_currency("USD", "crore", "5") == "USD"
+
+    @pytest.mark.parametrize("scale", ["lakh", "crore", "lakh crore"])
+    def test_indian_scales_mean_rupees(self, scale):
+        assert infer_currency(None, scale, "2") == "INR"
+
+    def test_indian_digit_grouping_means_rupees(self):
+        assert infer_currency(None, None, "1,72,000") == "INR"
+        assert infer_currency(None, None, "12,34,56,789") == "INR"
+
+    def test_western_grouping_is_not_inferred(self):
+        assert infer_currency(None, None, "172,000") is None
+        assert infer_currency(None, "billion", "650") is None
+
+
+class TestConvert:
+
+    def test_rate_for_year(self):
+        assert fx_rate("INR", 2023) == (82.60, 2023)
+
+    def test_out_of_range_year_uses_nearest(self):
+        rate, year = fx_rate("INR", 2031)
+        assert year == max(units._FX_RATES["INR"])
+
+    def test_unknown_currency(self):
+        assert fx_rate("XYZ", 2023) is None
+        assert convert(1.0, "XYZ", "USD", 2023) is None
+
+    def test_inr_to_usd(self):
+        conversion = convert(172000, "INR", "USD", 2023)
+        assert conversion.value == pytest.approx(172000 / 82.60)
+        assert conversion.rate_year == 2023
+        assert units.FX_VERSION in conversion.note
+
+    def test_cross_rate_goes_through_usd(self):
+        conversion = convert(100, "EUR", "INR", 2023)
+        eur, _ = fx_rate("EUR", 2023)
+        assert conversion.value == pytest.approx(100 / eur * 82.60)
+
+    def test_to_native_units_leaves_native_values_alone(self):
+        assert to_native_units(650e9, currency="USD", native_currency="USD", year=2024) == (650e9, None)
+        assert to_native_units(650e9, currency=None, native_currency="USD", year=2024) == (650e9, None)
+        assert to_native_units(7.5, currency="INR", native_currency=None, year=2024) == (7.5, None)
+
+
+class TestExtractionUnits:
+
+    def test_rupee_symbol(self):
+        result = extract_all("Per capita income is ₹1,72,000 in 2023")
+        assert (result["value"], result["currency"], result["scale"]) == (172000.0, "INR", None)
+
+    def test_dollar_billion(self):
+        result = extract_all("India's forex reserves hit $650 billion in 2024")
+        assert (result["currency"], result["scale"]) == ("USD", "billion")
+
+    def test_lakh_crore_inferred_as_rupees_for_monetary_metric(self):
+        result = extract_all("Forex reserves stood at 55 lakh crore in 2024")
+        assert (result["currency"], result["scale"]) == ("INR", "lakh crore")
+
+    def test_non_monetary_metric_is_not_inferred(self):
+        result = extract_all("India's population was 140 crore in 2023")
+        assert (result["currency"], result["scale"]) == (None, "crore")
+
+    def test_percentage_has_no_currency(self):
+        result = extract_all("GDP growth rate was 7.5% in 2024")
+        assert result["currency"] is None and result["scale"] is None
+
+    def test_claims_carry_units(self):
+        claims = extract_claims("Per capita income rose from ₹1,50,000 in 2022 to $2,100 in 2023")
+        assert [(c["currency"], c["value"]) for c in claims] == [("INR", 150000.0), ("USD", 2100.0)]
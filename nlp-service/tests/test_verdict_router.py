@@ -7,6 +7,8 @@ WHAT WE'RE TESTING:
   - Verdict rule functions: _verdict_from_error, _nli_to_verdict
   - Routing logic: when does Tier 1 short-circuit? When does it escalate?
   - force_tier3: does it bypass all early returns?
+  - verify_claims / POST /verify: one verification per claim, in the
+    context of the whole sentence; a trend stays one claim
 
 MOCKING STRATEGY:
   We mock ALL three tier functions + the extractor + evidence fetcher.
@@ -29,6 +31,7 @@ MOCK HIERARCHY (what calls what):
 import sys
 import os
 import asyncio
+from datetime import date
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
@@ -37,15 +40,17 @@ from verifier.verdict_router import (
     _verdict_from_error,
     _nli_to_verdict,
     route_verification,
+    verify_claims,
     VerificationResult,
     TIER1_ERROR_CLEAR_LOW,
     TIER1_ERROR_CLEAR_HIGH,
     TIER2_CONFIDENCE_MIN,
 )
-from verifier.tier1_numeric import WorldBankNumericCheck
+from verifier.tier1_numeric import WorldBankNumericCheck, WorldBankTrendCheck
 from verifier.tier2_nli import Tier2Result, NliResult
 from verifier.tier3_llm import Tier3Result
 from verifier.evidence_fetcher import EvidenceSnippet
+from fingerprint import claim_fingerprint
 
 
 # =============================================================================
@@ -139,6 +144,16 @@ def _fake_t1(official_value=6.49, percentage_error=15.56):
         year=2024,
     )
 
+# Helper: create a Tier 1 trend result ("inflation fell from 7% in 2022 to 5.4% in 2023")
+def _fake_trend():
+    return WorldBankTrendCheck(
+        kind="range", start_year=2022, end_year=2023,
+        official_start=6.95, official_end=5.49, official_change=-1.46,
+        claimed_change=-1.6, change_unit="absolute", percentage_error=1.64,
+        source="World Bank", indicator_code="FP.CPI.TOTL.ZG",
+        source_url="https://data.worldbank.org/indicator/FP.CPI.TOTL.ZG?locations=IN",
+    )
+
 
 class TestRoutingLogic:
     """
@@ -324,4 +339,95 @@ class TestRoutingLogic:
             result = asyncio.run(route_verification("GDP grew 7.5% in 2024"))
         
         assert result.tier_used != "tier1"  # Did NOT take the fast path
-        assert "tier2" in result.tiers_run
\ No newline at end of file
+        assert "tier2" in result.tiers_run
+
+    @patch("verifier.verdict_router.run_nli", new_callable=AsyncMock)
+    @patch("verifier.verdict_router.fetch_evidence", new_callable=AsyncMock)
+    @patch("verifier.verdict_router.tier1_numeric_check", new_callable=AsyncMock)
+    def test_verify_claims_fans_out_per_claim(self, mock_t1, mock_ev, mock_nli):
+        """
+        SCENARIO: one sentence, two metrics.
+        Each claim gets its own Tier 1 check with its own value, and NLI and
+        the negation check read the whole sentence, not the bare span.
+        """
+        mock_t1.return_value = _fake_t1(official_value=7.48, percentage_error=0.27)
+        mock_ev.return_value = []
+        mock_nli.return_value = Tier2Result(
+            verdict="entailment", confidence=0.75, nli_results=[], evidence_count=0,
+        )
+        text = "India's GDP growth rate was 7.5% in 2024 while inflation fell to 5.4%"
+
+        with patch("verifier.verdict_router.claim_fingerprint", wraps=claim_fingerprint) as fp:
+            results = asyncio.run(verify_claims(text))
+
+        checked = [(c.kwargs["metric"], c.kwargs["claimed_value"]) for c in mock_t1.call_args_list]
+        assert sorted(checked) == [("GDP growth rate", 7.5), ("inflation rate", 5.4)]
+        assert [r.original_text for r in results] == ["GDP growth rate was 7.5% in 2024", "inflation fell to 5.4%"]
+        # Only the 0.6-confidence inflation claim misses the Tier 1 fast path
+        assert [c.kwargs["claim"] for c in mock_nli.call_args_list] == [text]
+        assert [c.args[1] for c in fp.call_args_list] == [text, text]
+
+    @patch("verifier.verdict_router.tier1_numeric_check", new_callable=AsyncMock)
+    @patch("verifier.verdict_router.tier1_trend_check", new_callable=AsyncMock)
+    def test_verify_claims_keeps_a_trend_whole(self, mock_trend, mock_t1):
+        """SCENARIO: a from/to trend is two claims but ONE verification."""
+        mock_trend.return_value = _fake_trend()
+
+        results = asyncio.run(verify_claims("Inflation rate fell from 7% in 2022 to 5.4% in 2023"))
+
+        mock_t1.assert_not_called()
+        assert len(results) == 1 and results[0].trend["official_start"] == 6.95
+
+    @patch("verifier.verdict_router.tier1_numeric_check", new_callable=AsyncMock)
+    def test_verify_endpoint_lists_every_claim(self, mock_t1):
+        from fastapi.testclient import TestClient
+        import main
+
+        mock_t1.return_value = _fake_t1(official_value=7.48, percentage_error=0.27)
+        text = "India's GDP growth rate was 7.5% in 2024 and inflation rate was 5.4% in 2024"
+
+        body = TestClient(main.app).post("/verify", json={"text": text}).json()
+
+        assert [c["extracted_metric"] for c in body["claims"]] == ["GDP growth rate", "inflation rate"]
+        assert body["extracted_metric"] == "GDP growth rate" and body["verdict"] == body["claims"][0]["verdict"]
+        single = TestClient(main.app).post("/verify", json={"text": "GDP grew 7.5% in 2024"}).json()
+        assert single["claims"] == []
+
+    @patch("verifier.verdict_router.tier1_numeric_check", new_callable=AsyncMock)
+    @patch("verifier.verdict_router.tier1_trend_check", new_callable=AsyncMock)
+    def test_trend_claim_decided_by_tier1(self, mock_trend, mock_t1):
+        """
+        SCENARIO: "inflation rate fell from 7% in 2022 to 5.4% in 2023".
+        Both endpoints are checked by ONE tier1_trend_check call, and a clear
+        result returns straight from Tier 1 instead of escalating.
+        """
+        mock_trend.return_value = _fake_trend()
+
+        result = asyncio.run(route_verification("Inflation rate fell from 7% in 2022 to 5.4% in 2023"))
+
+        mock_t1.assert_not_called()
+        kwargs = mock_trend.call_args.kwargs
+        assert (kwargs["start_value"], kwargs["end_value"]) == (7.0, 5.4)
+        assert (kwargs["start_year"], kwargs["end_year"]) == (2022, 2023)
+        assert result.tier_used == "tier1"
+        assert result.verdict == "accurate"
+        assert result.extracted_value == 5.4
+        assert result.trend["official_start"] == 6.95
+        assert "6.9500 → 5.4900" in result.explanation
+
+    @patch("verifier.verdict_router.tier1_numeric_check", new_callable=AsyncMock)
+    def test_reference_date_resolves_relative_year(self, mock_t1):
+        """
+        SCENARIO: "last year" in an article published 2024-03-10 means 2023.
+        The same text published a year later is a different claim (2024),
+        so it must not be served from the L1 cache.
+        """
+        mock_t1.return_value = _fake_t1(official_value=5.4, percentage_error=0.0)
+        text = "Inflation rate eased to 5.4% last year"
+
+        asyncio.run(route_verification(text, reference_date=date(2024, 3, 10)))
+        asyncio.run(route_verification(text, reference_date=date(2025, 3, 10)))
+
+        years = [c.kwargs["year"] for c in mock_t1.call_args_list]
+        assert years == [2023, 2024]
+
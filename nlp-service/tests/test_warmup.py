@@ -0,0 +1,212 @@
+"""
+test_warmup.py — Tests for the bulk Tier 1 warm-up
+=====================================================
+Run with:  pytest tests/test_warmup.py -v
+
+WHAT WE'RE TESTING:
+  - One run fetches each indicator for many countries per request, every
+    page, and Tier 1 then answers single-year and trend checks without the API
+  - Country codes the World Bank doesn't publish are cached as "no data"
+    without a batch request; if its country list can't be read, a rejected
+    batch is split until the unknown code stands alone
+  - Failures land in the report instead of raising; the schedule survives them
+  - Stopping the service waits for a run in flight before closing the pool
+  - The report compares bulk requests with the per-claim path
+
+WHY WE MOCK:
+  warm() would call api.worldbank.org. We give it an httpx.AsyncClient over
+  a MockTransport that serves a fake indicator and counts requests.
+"""
+
+import sys
+import os
+import asyncio
+from unittest.mock import patch, AsyncMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+import pytest
+
+from countries import ISO3_TO_ISO2
+from verifier import indicator_store, tier1_numeric, warmup
+from verifier.tier1_numeric import fetch_world_bank_series, fetch_world_bank_value, tier1_trend_check
+
+CODE = "FP.CPI.TOTL.ZG"                                   # "inflation rate"
+UNKNOWN = {"TWN", "ATA"}                                  # not World Bank economies
+
+
+def value(country: str, year: int) -> float | None:
+    return None if (country, year) == ("IND", 2021) else round(len(country) * year / 1000 + ord(country[0]), 2)
+
+
+class FakeWorldBank:
+
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+        self.fail = False
+        self.country_list_fails = False
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.fail:
+            return httpx.Response(502)
+        if request.url.path.endswith("/country"):
+            if self.country_list_fails:
+                return httpx.Response(500)
+            return httpx.Response(200, json=[{"page": 1, "pages": 1},
+                                             [{"id": c} for c in ISO3_TO_ISO2 if c not in UNKNOWN]])
+        countries = request.url.path.split("/country/")[1].split("/")[0].split(";")
+        if UNKNOWN & set(countries):
+            return httpx.Response(200, json=[{"message": [{"key": "Invalid value"}]}])
+        first, last = map(int, request.url.params["date"].split(":"))
+        rows = [{"countryiso3code": c, "date": str(y), "value": value(c, y)}
+                for c in countries for y in range(last, first - 1, -1)]
+        per_page, page = int(request.url.params["per_page"]), int(request.url.params["page"])
+        pages = -(-len(rows) // per_page)
+        return httpx.Response(200, json=[{"page": page, "pages": pages}, rows[(page - 1) * per_page:page * per_page]])
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self))
+
+
+@pytest.fixture
+def api():
+    return FakeWorldBank()
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(indicator_store, "_store", None)
+    monkeypatch.setattr(warmup, "last_report", None)
+    monkeypatch.setattr(tier1_numeric, "_series_cache", tier1_numeric._TtlCache(tier1_numeric.timedelta(hours=1)))
+    monkeypatch.setattr(tier1_numeric, "_value_cache", tier1_numeric._TtlCache(tier1_numeric.timedelta(hours=1)))
+
+
+def _warm(api, countries, **kwargs):
+    async def run():
+        async with api.client() as client:
+            return await warmup.warm([CODE], countries, years=10, last_year=2023, client=client, **kwargs)
+    return asyncio.run(run())
+
+
+def _offline():
+    return patch("verifier.tier1_numeric.httpx.AsyncClient", side_effect=AssertionError("network"))
+
+
+class TestWarm:
+
+    def test_bulk_requests_fill_tier1(self, api, monkeypatch):
+        monkeypatch.setattr(warmup, "COUNTRIES_PER_REQUEST", 2)
+        report = _warm(api, ["IND", "USA", "CHN"])
+        assert len(api.requests) == report.requests == 3      # country list, IND;USA, CHN
+        assert report.series_cached == 3
+        assert report.per_claim_requests == 30                # 3 countries x 10 years
+        assert report.requests_saved == 27
+
+        with _offline():
+            assert asyncio.run(fetch_world_bank_value(
+                indicator_code=CODE, country="USA", year=2020)) == value("USA", 2020)
+            assert asyncio.run(fetch_world_bank_series(
+                indicator_code=CODE, country="IND", start_year=2020, end_year=2022,
+            )) == {2020: value("IND", 2020), 2022: value("IND", 2022)}
+            check = asyncio.run(tier1_trend_check(
+                metric="inflation rate", start_year=2015, end_year=2023, change=1.0, country="CHN"))
+        assert check.official_end == value("CHN", 2023)
+        assert tier1_numeric._range_cache.stats()["hits"] == 3
+
+    def test_outside_the_warm_range_goes_to_the_api(self, api):
+        _warm(api, ["IND"])
+        assert tier1_numeric._range_cache.get_range(CODE, "IND", 2010, 2023) is None
+        assert tier1_numeric._range_cache.get_range(CODE, "USA", 2020, 2020) is None
+
+    def test_every_page_is_read(self, api, monkeypatch):
+        monkeypatch.setattr(warmup, "PAGE_SIZE", 7)
+        report = _warm(api, ["IND", "USA"])
+        assert report.requests == 1 + 3                       # 20 rows / 7 per page
+        assert report.observations == 19                      # IND 2021 is null
+
+    def test_unknown_country_is_left_out_of_the_batch(self, api):
+        report = _warm(api, ["IND", "TWN", "USA", "GBR"])
+        assert report.requests == 2 and report.unknown_countries == 1
+        assert report.series_cached == 4 and not report.failed
+        assert tier1_numeric._range_cache.get_range(CODE, "TWN", 2020, 2020) == {}
+        assert "TWN" not in str(api.requests[1].url)
+
+    def test_without_the_country_list_a_rejected_batch_is_split(self, api):
+        api.country_list_fails = True
+        report = _warm(api, ["IND", "TWN", "USA", "GBR"])
+        # IND;TWN;USA;GBR → IND;TWN + USA;GBR → IND + TWN
+        assert report.requests == 1 + 5
+        assert report.series_cached == 4 and not report.failed
+        assert tier1_numeric._range_cache.get_range(CODE, "TWN", 2020, 2020) == {}
+        assert tier1_numeric._range_cache.get_range(CODE, "GBR", 2020, 2020) == {2020: value("GBR", 2020)}
+
+    def test_failures_are_reported_not_raised(self, api):
+        api.fail = True
+        report = _warm(api, ["IND", "USA"])
+        assert len(report.failed) == 1 and report.series_cached == 0    # the batch; the list just logs
+        assert tier1_numeric._range_cache.get_range(CODE, "IND", 2020, 2020) is None
+
+    def test_indicators_in_the_local_store_are_skipped(self, api, monkeypatch):
+        monkeypatch.setattr(indicator_store, "covers", lambda code, first, last: code == CODE)
+        report = _warm(api, ["IND"])
+        assert (report.indicators, report.skipped_in_store, report.requests) == (0, 1, 0)
+
+    def test_last_report_in_cache_stats(self, api):
+        from fastapi.testclient import TestClient
+        import main
+        _warm(api, ["IND"])
+        stats = TestClient(main.app).get("/cache/stats").json()
+        assert stats["tier1_warmup"]["series_cached"] == 1
+        assert stats["tier1_warmup"]["requests_saved"] == 10 - 2
+
+
+class TestSchedule:
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.setattr(warmup, "WARMUP_ENABLED", False)
+        assert warmup.start() is None
+
+    def test_a_failed_run_does_not_stop_the_schedule(self, monkeypatch):
+        runs = AsyncMock(side_effect=[RuntimeError("boom"), warmup.WarmupReport(), warmup.WarmupReport()])
+        monkeypatch.setattr(warmup, "warm", runs)
+        monkeypatch.setattr(warmup, "WARMUP_ENABLED", True)
+
+        async def scenario():
+            task = warmup.start()
+            while runs.await_count < 2:
+                await asyncio.sleep(0)
+            task.cancel()
+
+        monkeypatch.setattr(warmup.asyncio, "sleep", _no_wait(asyncio.sleep))
+        asyncio.run(scenario())
+        assert runs.await_count >= 2
+
+    def test_shutdown_waits_for_the_cancelled_run(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        from verifier import http_client
+        import main
+
+        started, seen = asyncio.Event(), {}
+
+        async def slow_run():
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            finally:
+                await asyncio.sleep(0)              # unwinding takes a loop turn
+                seen["pool_open_while_unwinding"] = http_client.stats()["running"]
+
+        monkeypatch.setattr(warmup, "warm", slow_run)
+        monkeypatch.setattr(warmup, "WARMUP_ENABLED", True)
+        with TestClient(main.app) as client:
+            client.portal.call(started.wait)
+        assert seen == {"pool_open_while_unwinding": True}
+        assert not http_client.stats()["running"]
+
+
+def _no_wait(sleep):
+    async def fast(seconds):
+        await sleep(0)
+    return fast
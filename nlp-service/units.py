@@ -0,0 +1,153 @@
+"""
+units.py — Currency and scale normalisation for Tier 1 comparisons
+
+Answers: "Is '₹1,72,000' comparable to a World Bank figure in US dollars?"
+Example:
+    Claim:     "Per capita income is ₹1,72,000 in 2023"
+    Indicator: NY.GDP.PCAP.CD (current US$)
+    Compared:  172,000 INR ÷ 82.60 INR/USD (2023) = 2,082.3 USD
+
+WHY?
+  extract_value() already turns "1.4 lakh crore" into 1.4e12, but the
+  currency was thrown away, so a rupee figure was compared to a dollar
+  figure and came out ~8,000% wrong. This module:
+    1. finds the currency stated next to a value ("₹", "Rs", "$", "rupees")
+    2. infers rupees for Indian scales (lakh / crore) and Indian digit
+       grouping (1,72,000) when no currency is stated
+    3. converts between currencies with a LOCAL, versioned table of annual
+       average exchange rates (data/fx_rates.json) — no network calls
+
+The table is keyed by year: a 2015 claim in rupees is converted at the 2015
+rate. Years outside the table use the nearest year we have.
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass
+
+FX_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "fx_rates.json")
+
+# Scale words extract_value() understands, and their multipliers
+SCALES = {
+    "thousand": 1e3,
+    "lakh": 1e5,
+    "million": 1e6,
+    "crore": 1e7,
+    "billion": 1e9,
+    "trillion": 1e12,
+    "lakh crore": 1e12,
+}
+INDIAN_SCALES = {"lakh", "crore", "lakh crore"}
+
+# Currency stated right before a number: "₹1,72,000", "Rs 2 lakh", "$650 billion", "US$ 3.2 trillion"
+_RE_CURRENCY_BEFORE = re.compile(
+    r"(?:(?P<INR>₹|\brs\.?|\binr)|(?P<USD>\bus\s?\$|\$|\busd)|(?P<EUR>€|\beur)"
+    r"|(?P<GBP>£|\bgbp)|(?P<JPY>¥|\bjpy)|(?P<CNY>\bcny|\brmb))\s*$",
+    re.IGNORECASE,
+)
+# Currency stated right after a number (and its scale word): "2 lakh crore rupees", "650 billion dollars"
+_RE_CURRENCY_AFTER = re.compile(
+    r"\s*(?:lakh\s*crore|lakh|crore|trillion|billion|million|thousand)?\s*"
+    r"(?:(?P<INR>rupees?|inr)|(?P<USD>(?:us\s+)?dollars?|usd)|(?P<EUR>euros?|eur)"
+    r"|(?P<GBP>pounds?|gbp)|(?P<JPY>yen|jpy)|(?P<CNY>yuan|renminbi|cny))\b",
+    re.IGNORECASE,
+)
+_RE_DIGIT = re.compile(r"\d")
+# 1,72,000 / 12,34,56,789 — two-digit groups are only used in Indian numbering
+_RE_INDIAN_GROUPING = re.compile(r"^\d{1,2}(?:,\d{2})+,\d{3}(?:\.\d+)?$")
+
+
+@dataclass(frozen=True)
+class Conversion:
+    value: float          # amount in the target currency
+    rate_year: int        # year of the rates actually used
+    note: str             # human-readable, e.g. "172000 INR → 2082.3 USD @ 82.6 INR/USD (2023, fx 2024.1)"
+
+
+def _load_fx_table(path: str = FX_TABLE_PATH):
+    with open(path, encoding="utf-8") as f:
+        doc = json.load(f)
+    rates = {
+        currency: {int(year): float(rate) for year, rate in by_year.items()}
+        for currency, by_year in doc["rates"].items()
+    }
+    return doc["version"], rates
+
+
+FX_VERSION, _FX_RATES = _load_fx_table()
+
+
+def currency_near(text: str, start: int, end: int) -> str | None:
+    """
+    ISO 4217 code stated right before the number in text[start:end] or right
+    after it, else None. The span may already include a currency prefix
+    ("₹2 lakh crore"), so "before" means before its first digit.
+    """
+    digit = _RE_DIGIT.search(text, start, end)
+    number_start = digit.start() if digit else start
+    m = _RE_CURRENCY_BEFORE.search(text, max(0, number_start - 8), number_start)
+    if m is None:
+        m = _RE_CURRENCY_AFTER.match(text, end, min(len(text), end + 40))
+    if m is None:
+        return None
+    return m.lastgroup
+
+
+def infer_currency(stated: str | None, scale: str | None, raw_number: str | None) -> str | None:
+    """Stated currency, else INR when the number is written the Indian way, else None."""
+    if stated is not None:
+        return stated
+    if scale in INDIAN_SCALES:
+        return "INR"
+    if raw_number and _RE_INDIAN_GROUPING.match(raw_number.lstrip("-")):
+        return "INR"
+    return None
+
+
+def fx_rate(currency: str, year: int | None) -> tuple[float, int] | None:
+    """(units of *currency* per USD, year used) from the local table, or None if unknown."""
+    by_year = _FX_RATES.get(currency.upper())
+    if not by_year:
+        return None
+    if year is None or year not in by_year:
+        years = sorted(by_year)
+        year = years[-1] if year is None else min(years, key=lambda y: abs(y - year))
+    return by_year[year], year
+
+
+def convert(amount: float, from_currency: str, to_currency: str, year: int | None) -> Conversion | None:
+    """Convert *amount* between currencies at *year*'s average rate. None if either is unknown."""
+    source = fx_rate(from_currency, year)
+    target = fx_rate(to_currency, year)
+    if source is None or target is None:
+        return None
+    (from_rate, from_year), (to_rate, _) = source, target
+    value = amount / from_rate * to_rate
+    pair_rate = from_rate / to_rate
+    note = (
+        f"{amount:g} {from_currency} → {value:.6g} {to_currency} "
+        f"@ {pair_rate:.4g} {from_currency}/{to_currency} ({from_year}, fx {FX_VERSION})"
+    )
+    return Conversion(value=value, rate_year=from_year, note=note)
+
+
+def to_native_units(
+    value: float,
+    *,
+    currency: str | None,
+    native_currency: str | None,
+    year: int | None,
+) -> tuple[float, str | None]:
+    """
+    Express a claimed value in the indicator's native currency.
+    Returns (value, note) — note is None when nothing was converted
+    (non-monetary indicator, no currency stated, already native, or an
+    unknown currency).
+    """
+    if native_currency is None or currency is None or currency == native_currency:
+        return value, None
+    conversion = convert(value, currency, native_currency, year)
+    if conversion is None:
+        return value, None
+    return conversion.value, conversion.note
@@ -9,8 +9,10 @@ Other tiers (NLI / LLM) will be added in separate modules.
 from .tier1_numeric import (
     METRIC_TO_WORLD_BANK_INDICATOR,
     WorldBankNumericCheck,
+    WorldBankTrendCheck,
     fetch_world_bank_series,
     tier1_numeric_check,
+    tier1_trend_check,
 )
 
 from .tier2_nli import (
@@ -35,6 +37,7 @@ from .evidence_fetcher import (
 
 from .verdict_router import (
     route_verification,
+    verify_claims,
     VerificationResult,
     EvidenceItem,
 )
@@ -42,8 +45,10 @@ from .verdict_router import (
 __all__ = [
     "METRIC_TO_WORLD_BANK_INDICATOR",
     "WorldBankNumericCheck",
+    "WorldBankTrendCheck",
     "fetch_world_bank_series",
     "tier1_numeric_check",
+    "tier1_trend_check",
     # Tier 2
     "EvidenceSnippet",
     "fetch_evidence",
@@ -60,6 +65,7 @@ __all__ = [
     "VerificationResult",
     "EvidenceItem",
     "route_verification",
+    "verify_claims",
 
 ]
 
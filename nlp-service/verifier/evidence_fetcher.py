@@ -17,6 +17,9 @@ from datetime import datetime, timedelta
 import httpx
 from dotenv import load_dotenv
 
+import memo
+from verifier import http_client
+
 load_dotenv()
 
 NEWS_API_KEY = os.getenv("NEWS_API_KEY")
@@ -37,27 +40,65 @@ class EvidenceSnippet:
 
 
 class _TtlCache:
-    def __init__(self, ttl: timedelta):
+    """
+    TTL cache with hit / miss / expiry counters. Registered with memo.py so
+    it shows up in GET /cache/stats (expired entries count as evictions).
+    """
+    def __init__(self, ttl: timedelta, name: str = "evidence"):
+        self.name = name
         self._ttl = ttl
         self._items: dict[str, tuple[datetime, list]] = {}
+        self.hits = self.misses = self.evictions = 0
+        memo.register(self)
 
     def get(self, key: str) -> list | None:
         item = self._items.get(key)
         if item is None:
+            self.misses += 1
             return None
         created_at, value = item
         if datetime.utcnow() - created_at > self._ttl:
             self._items.pop(key, None)
+            self.misses += 1
+            self.evictions += 1
             return None
+        self.hits += 1
         return value
 
     def set(self, key: str, value: list) -> None:
         self._items[key] = (datetime.utcnow(), value)
 
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._items),
+            "maxsize": None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.hits = self.misses = self.evictions = 0
+
 
 _evidence_cache = _TtlCache(ttl=timedelta(hours=2))
 
 
+def _query_key(query: str, max_results_per_source: int, fingerprint=None) -> str:
+    """
+    Cache key for one evidence search. With a claim fingerprint
+    (fingerprint.py) paraphrases and "7.50" vs "7.5" share the entry;
+    without one, fall back to the exact query string.
+    """
+    if fingerprint is not None:
+        return f"evidence:{fingerprint.search_key}:{max_results_per_source}"
+    return f"evidence:{query}:{max_results_per_source}"
+
+
 async def fetch_google_fact_checks(
     query: str,
     max_results: int = 3,
@@ -80,8 +121,8 @@ async def fetch_google_fact_checks(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.get(url, params=params)
+        async with http_client.client() as client:
+            resp = await client.get(url, params=params, timeout=timeout)
             resp.raise_for_status()
             data = resp.json()
     except (httpx.HTTPError, ValueError):
@@ -130,8 +171,8 @@ async def fetch_news_snippets(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.get(url, params=params)
+        async with http_client.client() as client:
+            resp = await client.get(url, params=params, timeout=timeout)
             resp.raise_for_status()
             data = resp.json()
     except (httpx.HTTPError, ValueError):
@@ -160,6 +201,7 @@ async def fetch_evidence(
     year: int | None,
     claimed_value: float | None,
     max_results_per_source: int = 3,
+    fingerprint=None,
 ) -> list[EvidenceSnippet]:
     """
     Main entry point for Tier 2 evidence retrieval.
@@ -167,7 +209,8 @@ async def fetch_evidence(
     from both Google Fact Check + NewsAPI.
 
     Returns combined list, fact-checks first (higher authority).
-    Results are cached per query for 2 hours.
+    Results are cached for 2 hours, per claim fingerprint when the router
+    passes one (fingerprint.py), else per query string.
     """
     # Build a targeted search query
     parts = []
@@ -180,7 +223,7 @@ async def fetch_evidence(
     parts.append("India")  # context anchor for this MVP (India-focused claims)
 
     query = " ".join(parts)
-    cache_key = f"evidence:{query}:{max_results_per_source}"
+    cache_key = _query_key(query, max_results_per_source, fingerprint)
 
     cached = _evidence_cache.get(cache_key)
     if cached is not None:
@@ -0,0 +1,187 @@
+"""
+http_client.py — One pooled httpx.AsyncClient for every upstream call
+
+Answers: "Does the second claim to reach api.worldbank.org pay a TCP + TLS handshake again?" — no.
+Example:
+    async with http_client.client() as client:
+        resp = await client.get(url, params=params, timeout=8.0)
+
+WHY?
+  tier1_numeric, evidence_fetcher and tier3_llm each opened a fresh
+  httpx.AsyncClient per call, so every verification paid new TCP + TLS
+  handshakes to up to four hosts (World Bank, Fact Check Tools, NewsAPI,
+  Gemini) — tens to hundreds of ms each, a large share of p50 latency — and
+  threw the connection away after one request.
+
+HOW?
+  LIFETIME — main.py's lifespan calls startup() before the first request
+  and shutdown() after the last. In between, client() hands out the one
+  shared client; its pool keeps connections per host (origin) alive for
+  HTTP_KEEPALIVE_EXPIRY seconds, so later calls reuse them.
+
+  FALLBACK — outside the service (tests, CLIs, scripts: no lifespan, maybe
+  another event loop) client() opens a short-lived client per call, exactly
+  what callers did before.
+
+  LIMITS / TIMEOUTS — HTTP_POOL_MAX_CONNECTIONS (all hosts), HTTP_POOL_MAX_KEEPALIVE
+  (idle ones kept), HTTP_KEEPALIVE_EXPIRY, HTTP_CONNECT_TIMEOUT, HTTP_POOL_TIMEOUT
+  (wait for a free connection). Callers keep their own read timeout by
+  passing timeout= per request.
+
+  HTTP/2 — HTTP2=1 multiplexes requests to a host over one connection. It
+  needs the optional h2 package (pip install "httpx[http2]"); without it
+  the client logs a warning and stays on HTTP/1.1 with keep-alive.
+
+  STATS — a trace hook counts requests, TCP connects and TLS handshakes per
+  host; stats() adds a snapshot of the pool (open / idle / busy connections
+  per host). GET /cache/stats shows them under "http_pool": a reuse_rate
+  near 1 means almost no request paid a handshake.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import Counter
+from contextlib import asynccontextmanager
+
+import httpx
+
+logger = logging.getLogger("bware.nlp")
+
+MAX_CONNECTIONS = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", "20"))
+KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))
+CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "5"))
+READ_TIMEOUT = 10.0        # default; callers pass their own per request
+HTTP2_REQUESTED = os.getenv("HTTP2", "0") == "1"
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _PoolStats:
+    """Requests / new connections / TLS handshakes per host, fed by the trace hook."""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        self.requests: Counter[str] = Counter()
+        self.connects: Counter[str] = Counter()
+        self.handshakes: Counter[str] = Counter()
+        self.fallback_clients = 0
+
+    async def on_request(self, request: httpx.Request) -> None:
+        host = request.url.host
+        self.requests[host] += 1
+
+        async def trace(event: str, info: dict) -> None:
+            if event == "connection.connect_tcp.complete":
+                self.connects[host] += 1
+            elif event == "connection.start_tls.complete":
+                self.handshakes[host] += 1
+
+        request.extensions["trace"] = trace
+
+
+_stats = _PoolStats()
+_client: httpx.AsyncClient | None = None
+_http2 = False
+
+
+def _new_client(*, http2: bool = False) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT, pool=POOL_TIMEOUT),
+        event_hooks={"request": [_stats.on_request]},
+    )
+
+
+async def startup() -> httpx.AsyncClient:
+    """Open the shared client (idempotent). Called from the FastAPI lifespan."""
+    global _client, _http2
+    if _client is not None and not _client.is_closed:
+        return _client
+    _http2 = HTTP2_REQUESTED and _http2_available()
+    if HTTP2_REQUESTED and not _http2:
+        logger.warning("HTTP2=1 but the h2 package is missing (pip install \"httpx[http2]\") — using HTTP/1.1 keep-alive")
+    _client = _new_client(http2=_http2)
+    return _client
+
+
+async def shutdown() -> None:
+    """Close the shared client and its pooled connections."""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def client():
+    """The shared client while the service runs; otherwise a client for this call only."""
+    shared = _client
+    if shared is not None and not shared.is_closed:
+        yield shared
+        return
+    _stats.fallback_clients += 1
+    async with _new_client() as own:
+        yield own
+
+
+def _pool_snapshot() -> dict[str, dict[str, int]]:
+    """Open / idle / busy connections per host in the shared pool (httpcore internals, best effort)."""
+    hosts: dict[str, dict[str, int]] = {}
+    pool = getattr(getattr(_client, "_transport", None), "_pool", None)
+    for conn in getattr(pool, "connections", ()):
+        origin = getattr(conn, "_origin", None)
+        host = origin.host.decode("ascii") if origin is not None else "?"
+        counts = hosts.setdefault(host, {"open": 0, "idle": 0, "busy": 0})
+        counts["open"] += 1
+        counts["idle" if conn.is_idle() else "busy"] += 1
+    return hosts
+
+
+def stats() -> dict:
+    """Pool configuration, live connections and handshake counters for GET /cache/stats."""
+    requests = sum(_stats.requests.values())
+    connects = sum(_stats.connects.values())
+    pool = _pool_snapshot()
+    return {
+        "running": _client is not None and not _client.is_closed,
+        "http2": _http2,
+        "max_connections": MAX_CONNECTIONS,
+        "max_keepalive": MAX_KEEPALIVE,
+        "open_connections": sum(h["open"] for h in pool.values()),
+        "idle_connections": sum(h["idle"] for h in pool.values()),
+        "requests": requests,
+        "connects": connects,
+        "tls_handshakes": sum(_stats.handshakes.values()),
+        "reuse_rate": round(1 - connects / requests, 4) if requests else 0.0,
+        "fallback_clients": _stats.fallback_clients,
+        "hosts": {
+            host: {
+                "requests": _stats.requests[host],
+                "connects": _stats.connects[host],
+                "tls_handshakes": _stats.handshakes[host],
+                **pool.get(host, {"open": 0, "idle": 0, "busy": 0}),
+            }
+            for host in sorted(set(_stats.requests) | set(pool))
+        },
+    }
+
+
+def clear_stats() -> None:
+    _stats.clear()
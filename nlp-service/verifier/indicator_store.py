@@ -0,0 +1,365 @@
+"""
+indicator_store.py — Local World Bank indicator store for Tier 1
+
+Answers: "What did the World Bank publish for NY.GDP.MKTP.KD.ZG, India, 2023?" — without a network call.
+Example:
+    python -m verifier.indicator_store sync       # first run: every registry indicator, every country
+    python -m verifier.indicator_store sync       # later runs: only indicators the World Bank has updated
+    python -m verifier.indicator_store status
+
+WHY?
+  tier1_numeric kept fetched series only in per-process TTL dicts. Every
+  restart and every new uvicorn worker started cold and paid a round-trip
+  to api.worldbank.org (hundreds of ms, seconds when it is slow) for its
+  first claims, and Tier 1 stopped answering whenever the API was down.
+  The registry only covers ~60 indicators, so all of them — every country,
+  every year — fit in a few MB.
+
+HOW?
+  FILE — one SQLite database (stdlib, no new dependency), by default
+  data/indicators.sqlite3, or INDICATOR_STORE_PATH ("" turns the store off):
+      observations(indicator, country, year, value)    value NULL = the
+                                                       World Bank lists the
+                                                       year with no data
+      indicators(indicator, last_updated, first_year, last_year, synced_at, observations)
+
+  SYNC — incremental, per indicator: one per_page=1 request reads the World
+  Bank's "lastupdated" date for the indicator; if it matches what we stored
+  (and the stored years cover the requested range) the indicator is
+  skipped. Otherwise all its pages (country/all) are fetched and its rows
+  replaced in one transaction, so a failed sync leaves the old data intact.
+
+  SERVE — preload() (called at service startup) copies the file into an
+  in-memory SQLite database with the backup API; lookups are primary-key
+  range reads that take microseconds and never touch the disk or the
+  network. A synced indicator is authoritative for its year range: a
+  country-year it doesn't hold has no published value. Anything else —
+  an indicator never synced, a year past the last sync — returns None and
+  tier1_numeric falls back to the API exactly as before. A missing or
+  unreadable file just leaves the store off.
+
+  Hits (answered locally) and misses (fell back) show up in GET /cache/stats.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sqlite3
+import threading
+from datetime import date, datetime
+
+import httpx
+
+import memo
+from metrics import METRIC_INDICATORS
+
+logger = logging.getLogger("bware.nlp")
+
+WORLD_BANK_API_BASE = "https://api.worldbank.org/v2"
+DEFAULT_STORE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "indicators.sqlite3")
+STORE_PATH = os.getenv("INDICATOR_STORE_PATH", DEFAULT_STORE_PATH)
+FIRST_YEAR = 1960          # the World Bank's series start here
+PAGE_SIZE = 20_000         # one page per indicator: ~270 economies x ~65 years
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    indicator TEXT    NOT NULL,
+    country   TEXT    NOT NULL,
+    year      INTEGER NOT NULL,
+    value     REAL,
+    PRIMARY KEY (indicator, country, year)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS indicators (
+    indicator    TEXT PRIMARY KEY,
+    last_updated TEXT,
+    first_year   INTEGER NOT NULL,
+    last_year    INTEGER NOT NULL,
+    synced_at    TEXT NOT NULL,
+    observations INTEGER NOT NULL
+);
+"""
+
+
+class IndicatorStore:
+    """Read side: an in-memory copy of the store file, safe to share between threads."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+        self._lock = threading.Lock()
+        # indicator → (first_year, last_year) the last sync covered
+        self.coverage: dict[str, tuple[int, int]] = {
+            indicator: (first, last)
+            for indicator, first, last in conn.execute("SELECT indicator, first_year, last_year FROM indicators")
+        }
+
+    @classmethod
+    def load(cls, path: str) -> "IndicatorStore":
+        """Copy the store file at *path* into memory. Raises sqlite3.Error / OSError."""
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        disk = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            disk.backup(conn)
+        finally:
+            disk.close()
+        return cls(conn)
+
+    def series(self, indicator: str, country: str, start_year: int, end_year: int) -> dict[int, float] | None:
+        """
+        {year: value} for start_year..end_year, leaving out years with no data
+        (what fetch_world_bank_series returns), or None when the store can't
+        answer: *indicator* was never synced, or the range runs past the sync.
+        """
+        covered = self.coverage.get(indicator)
+        if covered is None or start_year < covered[0] or end_year > covered[1]:
+            return None
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT year, value FROM observations"
+                " WHERE indicator = ? AND country = ? AND year BETWEEN ? AND ? AND value IS NOT NULL",
+                (indicator, country.upper(), start_year, end_year),
+            ).fetchall()
+        return dict(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM observations").fetchone()[0]
+
+
+# =============================================================================
+# PROCESS-WIDE STORE — loaded once by preload(), read by tier1_numeric
+# =============================================================================
+
+class _StoreStats:
+    """Hit / miss counters in the memo.py stats shape, for GET /cache/stats."""
+
+    name = "indicator_store"
+
+    def __init__(self):
+        self.hits = self.misses = 0
+        memo.register(self)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        store = _store
+        return {
+            "name": self.name,
+            "size": len(store) if store is not None else 0,
+            "maxsize": None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": 0,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Reset the counters (the store itself stays loaded)."""
+        self.hits = self.misses = 0
+
+
+_store: IndicatorStore | None = None
+_stats = _StoreStats()
+
+
+def preload(path: str | None = None) -> IndicatorStore | None:
+    """
+    Load the store file into memory for lookup(). Returns the store, or None
+    (logged, Tier 1 goes to the API) when it is turned off, missing or unreadable.
+    """
+    global _store
+    path = STORE_PATH if path is None else path
+    if not path:
+        _store = None
+        return None
+    try:
+        _store = IndicatorStore.load(path)
+    except FileNotFoundError:
+        logger.info("No indicator store at %s — Tier 1 uses the World Bank API (run: python -m verifier.indicator_store sync)", path)
+        _store = None
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Indicator store %s unreadable (%s) — Tier 1 uses the World Bank API", path, e)
+        _store = None
+    else:
+        logger.info("Indicator store loaded: %d indicators, %d observations", len(_store.coverage), len(_store))
+    return _store
+
+
+def covers(indicator: str, start_year: int, end_year: int) -> bool:
+    """True when the loaded store answers *indicator* for every year in the range."""
+    store = _store
+    covered = store.coverage.get(indicator) if store is not None else None
+    return covered is not None and covered[0] <= start_year and end_year <= covered[1]
+
+
+def lookup(indicator: str, country: str, start_year: int, end_year: int) -> dict[int, float] | None:
+    """The loaded store's series() (see IndicatorStore.series), counted; None when no store is loaded."""
+    store = _store
+    found = None
+    if store is not None:
+        try:
+            found = store.series(indicator, country, start_year, end_year)
+        except sqlite3.Error as e:
+            logger.warning("Indicator store lookup failed: %s", e)
+    if found is None:
+        _stats.misses += 1
+    else:
+        _stats.hits += 1
+    return found
+
+
+# =============================================================================
+# SYNC — python -m verifier.indicator_store sync
+# =============================================================================
+
+def _get_json(client: httpx.Client, url: str):
+    resp = client.get(url)
+    resp.raise_for_status()
+    payload = resp.json()
+    # Errors come back as 200 with [{"message": [...]}]
+    if not isinstance(payload, list) or len(payload) < 2 or not isinstance(payload[0], dict):
+        raise ValueError(f"unexpected World Bank response for {url}: {str(payload)[:200]}")
+    return payload
+
+
+def _observations(points) -> list[tuple[str, int, float | None]]:
+    """(country, year, value) rows from one page of country/all data."""
+    rows = []
+    for point in points or ():
+        if not isinstance(point, dict):
+            continue
+        country = point.get("countryiso3code")
+        if not country:
+            continue          # a few aggregates have no ISO3 code
+        try:
+            year = int(point.get("date"))
+            value = point.get("value")
+            rows.append((country.upper(), year, None if value is None else float(value)))
+        except (TypeError, ValueError):
+            continue
+    return rows
+
+
+def sync(
+    path: str | None = None,
+    indicators: list[str] | None = None,
+    *,
+    first_year: int = FIRST_YEAR,
+    last_year: int | None = None,
+    force: bool = False,
+    client: httpx.Client | None = None,
+) -> dict[str, str]:
+    """
+    Bring the store file at *path* up to date with the World Bank.
+    Returns {indicator: "updated" | "unchanged" | "failed: ..."}.
+    *indicators* defaults to every indicator in the metric registry.
+    """
+    path = STORE_PATH if path is None else path
+    if not path:
+        raise ValueError("INDICATOR_STORE_PATH is empty — the indicator store is turned off")
+    last_year = date.today().year if last_year is None else last_year
+    codes = sorted(set(indicators or METRIC_INDICATORS.values()))
+    own_client = client is None
+    client = client or httpx.Client(timeout=60.0)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path)
+    results: dict[str, str] = {}
+    try:
+        conn.executescript(_SCHEMA)
+        for code in codes:
+            try:
+                results[code] = _sync_indicator(conn, client, code, first_year, last_year, force)
+            except (httpx.HTTPError, ValueError) as e:
+                logger.warning("Sync of %s failed: %s", code, e)
+                results[code] = f"failed: {e}"
+    finally:
+        conn.close()
+        if own_client:
+            client.close()
+    return results
+
+
+def _sync_indicator(conn, client, code, first_year, last_year, force) -> str:
+    base = f"{WORLD_BANK_API_BASE}/country/all/indicator/{code}?format=json&date={first_year}:{last_year}"
+    last_updated = _get_json(client, f"{base}&per_page=1")[0].get("lastupdated")
+
+    stored = conn.execute(
+        "SELECT last_updated, first_year, last_year FROM indicators WHERE indicator = ?", (code,)).fetchone()
+    if (not force and stored is not None and last_updated is not None
+            and stored[0] == last_updated and stored[1] <= first_year and stored[2] >= last_year):
+        return "unchanged"
+
+    rows, page, pages = [], 1, 1
+    while page <= pages:
+        meta, points = _get_json(client, f"{base}&per_page={PAGE_SIZE}&page={page}")[:2]
+        pages = int(meta.get("pages") or 1)
+        rows.extend(_observations(points))
+        page += 1
+
+    with conn:      # one transaction: readers of the file never see half an indicator
+        conn.execute("DELETE FROM observations WHERE indicator = ?", (code,))
+        conn.executemany(
+            "INSERT OR REPLACE INTO observations (indicator, country, year, value) VALUES (?, ?, ?, ?)",
+            [(code, country, year, value) for country, year, value in rows],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO indicators"
+            " (indicator, last_updated, first_year, last_year, synced_at, observations) VALUES (?, ?, ?, ?, ?, ?)",
+            (code, last_updated, first_year, last_year, datetime.utcnow().isoformat(timespec="seconds"), len(rows)),
+        )
+    return "updated"
+
+
+def status(path: str | None = None) -> list[tuple]:
+    """(indicator, last_updated, first_year, last_year, synced_at, observations) per synced indicator."""
+    path = STORE_PATH if path is None else path
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        return conn.execute(
+            "SELECT indicator, last_updated, first_year, last_year, synced_at, observations"
+            " FROM indicators ORDER BY indicator").fetchall()
+    finally:
+        conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sync or inspect the local World Bank indicator store")
+    parser.add_argument("--path", default=STORE_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sync_cmd = commands.add_parser("sync", help="fetch indicators the World Bank updated since the last sync")
+    sync_cmd.add_argument("indicators", nargs="*", help="indicator codes (default: every registry indicator)")
+    sync_cmd.add_argument("--first-year", type=int, default=FIRST_YEAR)
+    sync_cmd.add_argument("--last-year", type=int, default=None)
+    sync_cmd.add_argument("--force", action="store_true", help="refetch even if unchanged")
+    commands.add_parser("status", help="list synced indicators")
+    args = parser.parse_args(argv)
+
+    if args.command == "sync":
+        results = sync(args.path, args.indicators or None,
+                       first_year=args.first_year, last_year=args.last_year, force=args.force)
+        for code, result in results.items():
+            print(f"  {code:<28}{result}")
+        counts = {kind: sum(r.startswith(kind) for r in results.values()) for kind in ("updated", "unchanged", "failed")}
+        print(f"{len(results)} indicators: {counts['updated']} updated, {counts['unchanged']} unchanged, "
+              f"{counts['failed']} failed → {args.path}")
+        return 1 if counts["failed"] else 0
+
+    try:
+        rows = status(args.path)
+    except FileNotFoundError:
+        print(f"no indicator store at {args.path} — run: python -m verifier.indicator_store sync")
+        return 1
+    print(f"  {'indicator':<28}{'last updated':<14}{'years':<12}{'synced at':<22}{'observations':>12}")
+    for indicator, last_updated, first, last, synced_at, n in rows:
+        print(f"  {indicator:<28}{last_updated or '-':<14}{f'{first}-{last}':<12}{synced_at:<22}{n:>12,}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,41 +5,39 @@ Goal:
 
 Notes:
 - This module is designed to be usable without the Node backend.
-- Caching is in-memory (per-process) to avoid repeated API hits.
+- Series come from the local indicator store (indicator_store.py) when it
+  holds them; otherwise from the API, cached in-memory (per-process) to
+  avoid repeated API hits. warmup.py fills the cache ahead of claims with
+  bulk multi-country requests.
+- Monetary claims are converted to the indicator's native currency
+  (units.py, local exchange-rate table) before the error is computed.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
 
+import memo
+from countries import ISO3_TO_ISO2
+from metrics import METRIC_CURRENCIES, METRIC_INDICATORS
+from units import to_native_units
+from verifier import http_client, indicator_store
+
 
 WORLD_BANK_API_BASE = "https://api.worldbank.org/v2"
 DEFAULT_COUNTRY = "IND"
 
-# N-19: ISO 3166 alpha-3 → alpha-2 mapping for World Bank URL generation
-_ISO3_TO_ISO2: dict[str, str] = {
-    "IND": "IN", "USA": "US", "GBR": "GB", "CHN": "CN",
-    "JPN": "JP", "DEU": "DE", "FRA": "FR", "BRA": "BR",
-    "CAN": "CA", "AUS": "AU", "KOR": "KR",
-}
-
-# Matches the 10 supported metric names in nlp-service/metrics.py
-METRIC_TO_WORLD_BANK_INDICATOR: dict[str, str] = {
-    "GDP growth rate": "NY.GDP.MKTP.KD.ZG",
-    "inflation rate": "FP.CPI.TOTL.ZG",
-    "unemployment rate": "SL.UEM.TOTL.ZS",
-    "fiscal deficit": "GC.BAL.CASH.GD.ZS",
-    "literacy rate": "SE.ADT.LITR.ZS",
-    "population": "SP.POP.TOTL",
-    "per capita income": "NY.GDP.PCAP.CD",
-    "poverty rate": "SI.POV.NAHC",
-    "foreign exchange reserves": "FI.RES.TOTL.CD",
-    "current account deficit": "BN.CAB.XOKA.GD.ZS",
-}
+# N-19: ISO 3166 alpha-3 → alpha-2 mapping for World Bank URL generation,
+# generated from the same gazetteer the extractor resolves countries with
+_ISO3_TO_ISO2: dict[str, str] = dict(ISO3_TO_ISO2)
+
+# Metric name → World Bank indicator code, from the metric registry
+# (data/metrics.json) that metrics.py matches claims against
+METRIC_TO_WORLD_BANK_INDICATOR: dict[str, str] = dict(METRIC_INDICATORS)
 
 
 @dataclass(frozen=True)
@@ -51,6 +49,26 @@ class WorldBankNumericCheck:
     indicator_code: str | None
     source_url: str | None
     year: int | None
+    compared_value: float | None = None   # claimed_value in the indicator's currency
+    conversion: str | None = None         # e.g. "172000 INR → 2082.32 USD @ 82.6 INR/USD (2023, fx 2024.1)"
+
+
+@dataclass(frozen=True)
+class WorldBankTrendCheck:
+    """Tier 1 result for a trend claim (extractor.extract_trend)."""
+    kind: str                       # "range" | "change"
+    start_year: int | None
+    end_year: int | None
+    official_start: float | None
+    official_end: float | None
+    official_change: float | None   # same change_unit as the claim
+    claimed_change: float | None
+    change_unit: str                # "absolute" | "relative"
+    percentage_error: float | None  # range: worst endpoint; change: error on the change
+    source: str | None
+    indicator_code: str | None
+    source_url: str | None
+    conversion: str | None = None   # currency conversion applied to the endpoints, if any
 
 
 class _TtlCache:
@@ -72,8 +90,53 @@ class _TtlCache:
         self._items[key] = (datetime.utcnow(), value)
 
 
+class _RangeCache(_TtlCache):
+    """
+    Whole (country, indicator) series over a year range, as warmup.py fetches
+    them in bulk. Any sub-range of a cached range is answered from it, so one
+    entry serves every single-year and trend lookup inside it. Hits / misses
+    in the memo.py stats shape for GET /cache/stats.
+    """
+
+    name = "tier1_range_cache"
+
+    def __init__(self, ttl: timedelta):
+        super().__init__(ttl)
+        self.hits = self.misses = 0
+
+    def put_range(self, indicator_code: str, country: str, first_year: int, last_year: int,
+                  series: dict[int, float]) -> None:
+        self.set(f"{country.upper()}:{indicator_code}", (first_year, last_year, series))
+
+    def get_range(self, indicator_code: str, country: str, start_year: int, end_year: int) -> dict[int, float] | None:
+        item = self.get(f"{country.upper()}:{indicator_code}")
+        if item is None or start_year < item[0] or end_year > item[1]:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return {year: value for year, value in item[2].items() if start_year <= year <= end_year}
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._items),
+            "maxsize": None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": 0,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.hits = self.misses = 0
+
+
 _series_cache = _TtlCache(ttl=timedelta(hours=6))
 _value_cache = _TtlCache(ttl=timedelta(hours=6))
+_range_cache = _RangeCache(ttl=timedelta(hours=6))
+memo.register(_range_cache)
 
 
 def _world_bank_source_url(indicator_code: str, country: str = DEFAULT_COUNTRY) -> str:
@@ -105,6 +168,14 @@ async def fetch_world_bank_series(
     Returns only non-null numeric values.
     """
 
+    stored = indicator_store.lookup(indicator_code, country, start_year, end_year)
+    if stored is not None:
+        return stored
+
+    warmed = _range_cache.get_range(indicator_code, country, start_year, end_year)
+    if warmed is not None:
+        return warmed
+
     cache_key = f"series:{country}:{indicator_code}:{start_year}:{end_year}"
     cached = _series_cache.get(cache_key)
     if cached is not None:
@@ -115,8 +186,8 @@ async def fetch_world_bank_series(
         f"?format=json&per_page=200&date={start_year}:{end_year}"
     )
 
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-        resp = await client.get(url)
+    async with http_client.client() as client:
+        resp = await client.get(url, timeout=timeout_seconds)
         resp.raise_for_status()
         payload = resp.json()
 
@@ -171,8 +242,13 @@ async def tier1_numeric_check(
     claimed_value: float | None,
     year: int | None,
     country: str = DEFAULT_COUNTRY,
+    currency: str | None = None,
 ) -> WorldBankNumericCheck:
-    """Tier-1 numeric check against World Bank official data."""
+    """Tier-1 numeric check against World Bank official data.
+
+    *currency* is the ISO 4217 code the claim was stated in (extractor's
+    "currency"); None means "already in the indicator's units".
+    """
 
     if metric is None or claimed_value is None or year is None:
         return WorldBankNumericCheck(
@@ -217,12 +293,122 @@ async def tier1_numeric_check(
             year=year,
         )
 
+    compared_value, conversion = to_native_units(
+        float(claimed_value),
+        currency=currency,
+        native_currency=METRIC_CURRENCIES.get(metric),
+        year=year,
+    )
     return WorldBankNumericCheck(
         official_value=float(official_value),
         claimed_value=float(claimed_value),
-        percentage_error=round(_percentage_error(float(claimed_value), float(official_value)), 2),
+        percentage_error=round(_percentage_error(compared_value, float(official_value)), 2),
         source="World Bank",
         indicator_code=indicator_code,
         source_url=_world_bank_source_url(indicator_code, country=country),
         year=year,
+        compared_value=compared_value,
+        conversion=conversion,
+    )
+
+
+async def tier1_trend_check(
+    *,
+    metric: str | None,
+    start_year: int | None,
+    end_year: int | None,
+    start_value: float | None = None,
+    end_value: float | None = None,
+    change: float | None = None,
+    change_unit: str = "absolute",
+    country: str = DEFAULT_COUNTRY,
+    currency: str | None = None,
+) -> WorldBankTrendCheck:
+    """Tier-1 check of a trend claim against ONE World Bank series fetch.
+
+    Range claims (start_value and end_value given) are checked endpoint by
+    endpoint and scored by the worse of the two errors. Change claims are
+    scored on the change itself — absolute (points) or relative (percent).
+
+    The fetched series also fills the per-year value cache, so later
+    single-year checks for any year in the range skip the API.
+
+    Range endpoints stated in another *currency* are converted to the
+    indicator's currency, each at its own year's rate.
+    """
+    kind = "range" if start_value is not None and end_value is not None else "change"
+    conversion = None
+    if kind == "range":
+        native_currency = METRIC_CURRENCIES.get(metric) if metric else None
+        start_value, start_conversion = to_native_units(
+            float(start_value), currency=currency, native_currency=native_currency, year=start_year)
+        end_value, end_conversion = to_native_units(
+            float(end_value), currency=currency, native_currency=native_currency, year=end_year)
+        conversion = "; ".join(note for note in (start_conversion, end_conversion) if note) or None
+        change = end_value - start_value
+        change_unit = "absolute"
+
+    indicator_code = METRIC_TO_WORLD_BANK_INDICATOR.get(metric) if metric else None
+    empty = WorldBankTrendCheck(
+        kind=kind,
+        start_year=start_year,
+        end_year=end_year,
+        official_start=None,
+        official_end=None,
+        official_change=None,
+        claimed_change=change,
+        change_unit=change_unit,
+        percentage_error=None,
+        source=None,
+        indicator_code=indicator_code,
+        source_url=None,
+        conversion=conversion,
+    )
+    if indicator_code is None or start_year is None or end_year is None or change is None:
+        return empty
+    empty = replace(
+        empty,
+        source="World Bank",
+        source_url=_world_bank_source_url(indicator_code, country=country),
+    )
+
+    try:
+        series = await fetch_world_bank_series(
+            indicator_code=indicator_code,
+            country=country,
+            start_year=min(start_year, end_year),
+            end_year=max(start_year, end_year),
+        )
+    except (httpx.HTTPError, ValueError, TypeError):
+        return empty
+
+    for year, value in series.items():
+        _value_cache.set(f"value:{country}:{indicator_code}:{year}", value)
+
+    official_start = series.get(start_year)
+    official_end = series.get(end_year)
+    if official_start is None or official_end is None:
+        return replace(empty, official_start=official_start, official_end=official_end)
+
+    if change_unit == "relative":
+        if official_start == 0:
+            return replace(empty, official_start=official_start, official_end=official_end)
+        official_change = (official_end - official_start) / abs(official_start) * 100.0
+    else:
+        official_change = official_end - official_start
+
+    if kind == "range":
+        error = max(
+            _percentage_error(float(start_value), official_start),
+            _percentage_error(float(end_value), official_end),
+        )
+    else:
+        error = _percentage_error(float(change), official_change)
+
+    return replace(
+        empty,
+        official_start=float(official_start),
+        official_end=float(official_end),
+        official_change=round(official_change, 4),
+        percentage_error=round(error, 2),
     )
@@ -21,6 +21,7 @@ import logging
 from dataclasses import dataclass
 from functools import lru_cache
 
+from memo import LruMemo
 from verifier.evidence_fetcher import EvidenceSnippet
 
 logger = logging.getLogger("bware.nlp.tier2")
@@ -34,6 +35,12 @@ NLI_LABELS = ["contradiction", "neutral", "entailment"]
 # BART-MNLI returns scores in this order: contradiction, neutral, entailment
 
 
+# (claim fingerprint key — or the claim text — , snippet text) → raw pipeline output.
+# The same evidence snippet comes back for every paraphrase of a claim and
+# for repeated /verify calls; a hit skips the thread pool and the model.
+_nli_memo = LruMemo("nli")
+
+
 @dataclass
 class NliResult:
     label: str          # "entailment" | "contradiction" | "neutral"
@@ -96,6 +103,7 @@ def _map_label(raw_label: str) -> str:
 async def run_nli(
     claim: str,
     snippets: list[EvidenceSnippet],
+    fingerprint=None,
 ) -> Tier2Result:
     """
     Run NLI model on each snippet vs the claim.
@@ -103,6 +111,9 @@ async def run_nli(
 
     Runs in a thread pool to avoid blocking the async event loop
     (transformers pipeline is CPU-bound sync code).
+
+    Scores are memoized per (claim, snippet); pass the claim's fingerprint
+    (fingerprint.py) so paraphrases of the same claim share them.
     """
     if not snippets:
         return Tier2Result(
@@ -123,10 +134,14 @@ async def run_nli(
         if not text_to_score or len((snippet.snippet or "").strip()) < 10:
             continue
 
-        # Run blocking model call in thread pool
-        raw = await loop.run_in_executor(
-            None, _run_nli_sync, claim, text_to_score
-        )
+        memo_key = (fingerprint.key if fingerprint is not None else claim, text_to_score)
+        raw = _nli_memo.get(memo_key)
+        if raw is None:
+            # Run blocking model call in thread pool
+            raw = await loop.run_in_executor(
+                None, _run_nli_sync, claim, text_to_score
+            )
+            _nli_memo.put(memo_key, raw)
 
         top_label_raw = raw["labels"][0]
         top_score = raw["scores"][0]
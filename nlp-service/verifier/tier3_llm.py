@@ -22,6 +22,8 @@ from dataclasses import dataclass, field
 import httpx
 from dotenv import load_dotenv
 
+from verifier import http_client
+
 load_dotenv()
 
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -167,8 +169,8 @@ async def _call_gemini(prompt: str, timeout: float = 20.0) -> str | None:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.post(url, json=payload)
+        async with http_client.client() as client:
+            resp = await client.post(url, json=payload, timeout=timeout)
             resp.raise_for_status()
             data = resp.json()
 
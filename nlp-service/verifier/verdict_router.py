@@ -7,6 +7,9 @@ Decides which tier(s) to run based on extraction confidence and tier results.
 Routing logic:
   1. Always run Layer 1 extraction (extractor.py)
   2. If metric + value + year extracted → run Tier 1 (World Bank numeric check)
+     - Trend claims ("fell from 7% in 2022 to 5.4% in 2023") are checked
+       as one unit: both endpoints, or the claimed change, against a single
+       World Bank series fetch
      - If Tier 1 percentage_error is clear (< 5% or >= 20%) AND
        extraction confidence > 0.8 → return immediately, skip Tier 2/3
   3. Otherwise → run Tier 2 (evidence fetch + NLI)
@@ -15,6 +18,9 @@ Routing logic:
 
 force_tier3=True bypasses the router and always runs all tiers up to Tier 3.
 This is used by POST /verify/deep.
+
+verify_claims() runs the pipeline once per claim when a text holds several
+(POST /verify).
 """
 
 from __future__ import annotations
@@ -23,10 +29,19 @@ import asyncio
 import hashlib
 import logging
 import time
-from dataclasses import dataclass, field
-
-from extractor import extract_all
-from verifier.tier1_numeric import tier1_numeric_check, WorldBankNumericCheck
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+
+import memo
+from extractor import extract_all, extract_claims, extract_trend
+from fingerprint import ClaimFingerprint, claim_fingerprint
+from periods import as_reference_date
+from verifier.tier1_numeric import (
+    tier1_numeric_check,
+    tier1_trend_check,
+    WorldBankNumericCheck,
+    WorldBankTrendCheck,
+)
 from verifier.evidence_fetcher import fetch_evidence, EvidenceSnippet
 from verifier.tier2_nli import run_nli, Tier2Result
 from verifier.tier3_llm import tier3_llm_check, EvidenceSummary, Tier3Result
@@ -47,35 +62,72 @@ TIER2_CONFIDENCE_MIN   = 0.6   # Tier 2 confidence below this → escalate to Ti
 class _ResultCache:
     """
     In-process TTL cache for VerificationResult objects.
-    Keyed on MD5(text) + force_tier3 — same claim + same depth = same result.
+    Keyed on the claim fingerprint (fingerprint.py) + extraction confidence
+    + force_tier3 — same claim, however it is worded, + same routing inputs
+    + same depth = same result. The fingerprint already carries the
+    resolved year, so the reference date is not part of the key.
+    Text with no fingerprint (no metric or value) falls back to
+    MD5(text) + force_tier3 + reference date.
     TTL: 1 hour. Saves World Bank + NewsAPI + Gemini quota on repeated claims.
 
     The Node backend also caches in Redis (L2 cache). This is the L1 cache
     inside the NLP service itself — prevents any external API calls on hits.
     """
-    def __init__(self, ttl_seconds: int = 3600):
+    def __init__(self, ttl_seconds: int = 3600, name: str = "verify_result"):
+        self.name = name
         self._ttl = ttl_seconds
         self._store: dict[str, tuple[float, object]] = {}
-
-    def _key(self, text: str, force_tier3: bool) -> str:
-        return hashlib.md5(text.encode()).hexdigest() + f":{force_tier3}"
-
-    def get(self, text: str, force_tier3: bool):
-        entry = self._store.get(self._key(text, force_tier3))
+        self.hits = self.misses = self.evictions = 0
+        memo.register(self)
+
+    def _key(
+        self,
+        text: str,
+        force_tier3: bool,
+        reference_date: date | None = None,
+        fingerprint: ClaimFingerprint | None = None,
+        confidence: float | None = None,
+    ) -> str:
+        if fingerprint is not None:
+            # Extraction confidence decides the Tier 1 fast path and scales
+            # the reported confidence, so it is part of the routing inputs
+            return f"fp:{fingerprint.key}:{confidence}:{force_tier3}"
+        return hashlib.md5(text.encode()).hexdigest() + f":{force_tier3}:{reference_date}"
+
+    def get(self, text: str, force_tier3: bool, reference_date: date | None = None, **fp):
+        key = self._key(text, force_tier3, reference_date, **fp)
+        entry = self._store.get(key)
         if entry is None:
+            self.misses += 1
             return None
         stored_at, result = entry
         if time.monotonic() - stored_at > self._ttl:
-            del self._store[self._key(text, force_tier3)]
+            del self._store[key]
+            self.misses += 1
+            self.evictions += 1
             return None
+        self.hits += 1
         return result
 
-    def set(self, text: str, force_tier3: bool, result) -> None:
-        self._store[self._key(text, force_tier3)] = (time.monotonic(), result)
+    def set(self, text: str, force_tier3: bool, result, reference_date: date | None = None, **fp) -> None:
+        self._store[self._key(text, force_tier3, reference_date, **fp)] = (time.monotonic(), result)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._store),
+            "maxsize": None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
 
     def clear(self) -> None:
-        """Evict all cached entries. Used in tests to prevent cross-test pollution."""
+        """Evict all cached entries and reset counters. Used in tests to prevent cross-test pollution."""
         self._store.clear()
+        self.hits = self.misses = self.evictions = 0
 
 
 _result_cache = _ResultCache()
@@ -124,6 +176,9 @@ class VerificationResult:
     evidence: list[EvidenceItem] = field(default_factory=list)
     explanation: str = ""
 
+    # Trend claims only — see _trend_summary()
+    trend: dict | None = None
+
     # Debug
     tiers_run: list[str] = field(default_factory=list)
 
@@ -160,6 +215,9 @@ def _nli_to_verdict(nli_verdict: str) -> str:
 async def route_verification(
     text: str,
     force_tier3: bool = False,
+    extraction: dict | None = None,
+    reference_date: date | datetime | None = None,
+    sentence: str | None = None,
 ) -> VerificationResult:
     """
     Full RAV pipeline.
@@ -167,29 +225,57 @@ async def route_verification(
     Args:
         text:        Raw claim text from the user.
         force_tier3: If True, always runs through to Tier 3 (used by /verify/deep).
+        extraction:  Pre-computed extraction dict (same shape as extract_all()).
+                     Passed by verify_claims() so each sub-claim skips Layer 1.
+        reference_date: When the claim was made (e.g. article published_at).
+                     Anchors "last year" / "this fiscal"; defaults to today.
+        sentence:    The whole sentence *text* was cut from (verify_claims()
+                     passes it). NLI, Tier 3 and the fingerprint's negation
+                     check read it: a span like "7.5% in 2024" has lost the
+                     words that say what it claims.
 
     Returns:
         VerificationResult with the best available verdict and all evidence.
     """
     tiers_run: list[str] = []
-
-    # ──────────────────────────────────────────────────────────────────────
-    # L1 CACHE CHECK — return immediately for duplicate claims
-    # ──────────────────────────────────────────────────────────────────────
-    cached = _result_cache.get(text, force_tier3)
-    if cached is not None:
-        return cached
+    ref = as_reference_date(reference_date)
+    claim_text = sentence or text
 
     # ──────────────────────────────────────────────────────────────────────
     # LAYER 1: Extract metric / value / year
     # ──────────────────────────────────────────────────────────────────────
-    extraction = extract_all(text)
+    trend = None
+    if extraction is None:
+        extraction = extract_all(text, ref)
+        trend = extract_trend(text, ref)
     metric    = extraction["metric"]
     value     = extraction["value"]
     year      = extraction["year"]
     country   = extraction.get("country", "IND") or "IND"   # N-19
+    currency  = extraction.get("currency")                  # stated/inferred, see units.py
     ext_conf  = extraction["confidence"]
 
+    # A trend claim is verified as one unit; report its end point (or the
+    # claimed change) as the extracted value
+    if trend is not None:
+        metric   = trend["metric"]
+        value    = trend["end_value"] if trend["kind"] == "range" else trend["change"]
+        year     = trend["end_year"]
+        country  = trend["country"]
+        currency = trend.get("currency")
+        ext_conf = trend["confidence"]
+
+    # ──────────────────────────────────────────────────────────────────────
+    # L1 CACHE CHECK — return immediately for duplicate claims.
+    # Keyed on the claim fingerprint, so paraphrases share one entry
+    # (extraction is memoized, so running Layer 1 first costs ~nothing)
+    # ──────────────────────────────────────────────────────────────────────
+    fingerprint = claim_fingerprint(extraction, claim_text, trend)
+    cache_key = dict(fingerprint=fingerprint, confidence=ext_conf)
+    cached = _result_cache.get(text, force_tier3, ref, **cache_key)
+    if cached is not None:
+        return replace(cached, original_text=text, extracted_value=value)
+
     base = dict(
         original_text=text,
         extracted_metric=metric,
@@ -201,12 +287,37 @@ async def route_verification(
     # ──────────────────────────────────────────────────────────────────────
     # TIER 1: Numeric check via World Bank
     # ──────────────────────────────────────────────────────────────────────
-    t1: WorldBankNumericCheck = await tier1_numeric_check(
-        metric=metric,
-        claimed_value=value,
-        year=year,
-        country=country,   # N-19: use detected country instead of always IND
-    )
+    if trend is not None:
+        tt: WorldBankTrendCheck = await tier1_trend_check(
+            metric=metric,
+            start_year=trend["start_year"],
+            end_year=trend["end_year"],
+            start_value=trend["start_value"],
+            end_value=trend["end_value"],
+            change=trend["change"],
+            change_unit=trend["change_unit"],
+            country=country,
+            currency=currency,
+        )
+        base["trend"] = _trend_summary(trend, tt)
+        t1 = WorldBankNumericCheck(
+            official_value=tt.official_end if tt.kind == "range" else tt.official_change,
+            claimed_value=value,
+            percentage_error=tt.percentage_error,
+            source=tt.source,
+            indicator_code=tt.indicator_code,
+            source_url=tt.source_url,
+            year=year,
+            conversion=tt.conversion,
+        )
+    else:
+        t1 = await tier1_numeric_check(
+            metric=metric,
+            claimed_value=value,
+            year=year,
+            country=country,   # N-19: use detected country instead of always IND
+            currency=currency,
+        )
     tiers_run.append("tier1")
 
     tier1_verdict = _verdict_from_error(t1.percentage_error)
@@ -230,12 +341,16 @@ async def route_verification(
     )
 
     if tier1_decisive and not force_tier3:
-        explanation = (
-            f"Claimed {metric}: {value} ({year}). "
-            f"Official World Bank value: {t1.official_value:.4f}. "
-            f"Percentage error: {t1.percentage_error:.2f}%. "
-            f"Verdict: {tier1_verdict}."
-        )
+        if trend is not None:
+            explanation = _trend_explanation(metric, base["trend"], t1.percentage_error, tier1_verdict)
+        else:
+            explanation = (
+                f"Claimed {metric}: {value} ({year}). "
+                + (f"Compared as {t1.conversion}. " if t1.conversion else "")
+                + f"Official World Bank value: {t1.official_value:.4f}. "
+                f"Percentage error: {t1.percentage_error:.2f}%. "
+                f"Verdict: {tier1_verdict}."
+            )
         _t1_result = VerificationResult(
             **base,
             tier_used="tier1",
@@ -249,7 +364,7 @@ async def route_verification(
             explanation=explanation,
             tiers_run=tiers_run,
         )
-        _result_cache.set(text, force_tier3, _t1_result)
+        _result_cache.set(text, force_tier3, _t1_result, ref, **cache_key)
         return _t1_result
 
     # ──────────────────────────────────────────────────────────────────────
@@ -259,9 +374,10 @@ async def route_verification(
         metric=metric,
         year=year,
         claimed_value=value,
+        fingerprint=fingerprint,
     )
 
-    t2: Tier2Result = await run_nli(claim=text, snippets=raw_snippets)
+    t2: Tier2Result = await run_nli(claim=claim_text, snippets=raw_snippets, fingerprint=fingerprint)
     tiers_run.append("tier2")
 
     # Build EvidenceItem list with NLI scores attached
@@ -325,7 +441,7 @@ async def route_verification(
             explanation=explanation,
             tiers_run=tiers_run,
         )
-        _result_cache.set(text, force_tier3, _t2_result)
+        _result_cache.set(text, force_tier3, _t2_result, ref, **cache_key)
         return _t2_result
 
     # ──────────────────────────────────────────────────────────────────────
@@ -342,7 +458,7 @@ async def route_verification(
     ]
 
     t3: Tier3Result = await tier3_llm_check(
-        claim=text,
+        claim=claim_text,
         metric=metric,
         claimed_value=value,
         year=year,
@@ -367,10 +483,35 @@ async def route_verification(
         explanation=t3.explanation,
         tiers_run=tiers_run,
     )
-    _result_cache.set(text, force_tier3, _t3_result)
+    _result_cache.set(text, force_tier3, _t3_result, ref, **cache_key)
     return _t3_result
 
 
+async def verify_claims(
+    text: str,
+    force_tier3: bool = False,
+    reference_date: date | datetime | None = None,
+) -> list[VerificationResult]:
+    """
+    Fan out over every claim in *text* (extractor.extract_claims) and verify
+    each one concurrently. "India's GDP growth rate was 7.5% in 2024 while
+    inflation fell to 5.4%" yields two results, one per claim, each keyed on
+    its own span text and judged in the context of the whole sentence.
+    A trend ("fell from 7% in 2022 to 5.4% in 2023") and text with at most
+    one claim are verified as one unit by route_verification().
+    """
+    ref = as_reference_date(reference_date)
+    claims = extract_claims(text, ref)
+    if len(claims) < 2 or extract_trend(text, ref) is not None:
+        return [await route_verification(text, force_tier3=force_tier3, reference_date=ref)]
+    return list(await asyncio.gather(*(
+        route_verification(
+            c["original_text"], force_tier3=force_tier3, extraction=c, reference_date=ref, sentence=text,
+        )
+        for c in claims
+    )))
+
+
 # =============================================================================
 # HELPERS
 # =============================================================================
@@ -382,7 +523,8 @@ def _build_merged_explanation(
     if t1.official_value is not None:
         parts.append(
             f"Numeric check: claimed {metric} = {value} ({year}), "
-            f"official World Bank = {t1.official_value:.4f} "
+            + (f"compared as {t1.conversion}, " if t1.conversion else "")
+            + f"official World Bank = {t1.official_value:.4f} "
             f"(error: {t1.percentage_error:.2f}%) → {tier1_verdict}."
         )
     if t2.evidence_count > 0:
@@ -393,3 +535,37 @@ def _build_merged_explanation(
     if not parts:
         return "Insufficient data to produce a detailed explanation."
     return " ".join(parts)
+
+
+def _trend_summary(trend: dict, check: WorldBankTrendCheck) -> dict:
+    """Claimed vs official numbers for a trend claim, as returned in the API response."""
+    return {
+        "kind":            trend["kind"],
+        "start_year":      trend["start_year"],
+        "end_year":        trend["end_year"],
+        "claimed_start":   trend["start_value"],
+        "claimed_end":     trend["end_value"],
+        "official_start":  check.official_start,
+        "official_end":    check.official_end,
+        "claimed_change":  trend["change"],
+        "official_change": check.official_change,
+        "change_unit":     trend["change_unit"],
+        "direction":       trend["direction"],
+        "conversion":      check.conversion,
+    }
+
+
+def _trend_explanation(metric, summary: dict, pct_error: float, verdict: str) -> str:
+    span = f"{summary['start_year']}→{summary['end_year']}"
+    if summary["kind"] == "range":
+        return (
+            f"Claimed {metric} went from {summary['claimed_start']} to {summary['claimed_end']} ({span}). "
+            f"Official World Bank values: {summary['official_start']:.4f} → {summary['official_end']:.4f}. "
+            f"Worst endpoint error: {pct_error:.2f}%. Verdict: {verdict}."
+        )
+    unit = "%" if summary["change_unit"] == "relative" else " points"
+    return (
+        f"Claimed {metric} changed by {summary['claimed_change']:+g}{unit} ({span}). "
+        f"Official World Bank change: {summary['official_change']:+.4f}{unit}. "
+        f"Percentage error: {pct_error:.2f}%. Verdict: {verdict}."
+    )
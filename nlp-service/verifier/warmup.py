@@ -0,0 +1,268 @@
+"""
+warmup.py — Bulk multi-country prefetch of World Bank indicators into the Tier 1 cache
+
+Answers: "Can Tier 1 already know every country's inflation for the last 25 years before the first claim arrives?"
+Example:
+    python -m verifier.warmup                      # one run, every registry indicator, prints the report
+    python -m verifier.warmup FP.CPI.TOTL.ZG --years 10
+    TIER1_WARMUP=1 uvicorn main:app                # at startup, then every TIER1_WARMUP_INTERVAL_HOURS
+
+WHY?
+  The per-claim path asks the World Bank for one country and — through
+  fetch_world_bank_value — one year per request (date=YYYY:YYYY). The API
+  takes several countries per request (country/IND;USA;CHN/...), whole date
+  ranges, and thousands of rows per page, so the same data costs orders of
+  magnitude fewer round-trips fetched in bulk.
+
+HOW?
+  FETCH — for each indicator, supported countries (the country gazetteer)
+  go COUNTRIES_PER_REQUEST at a time into one request over the whole year
+  range, paginated with per_page=PAGE_SIZE; at most CONCURRENCY requests are
+  in flight. The gazetteer names territories the World Bank doesn't publish
+  (ATA, TWN, ...), and one unknown code makes it reject a whole request, so
+  each run first reads the World Bank's country list (one request) and
+  caches the unknown ones as "no data" — what the per-claim request would
+  have concluded too. Should a batch still be rejected (the list request
+  failed), it is split in half and retried until the unknown codes stand
+  alone.
+
+  CACHE — every (country, indicator) series goes into tier1_numeric's range
+  cache, which answers any sub-range of it: single-year checks and trend
+  checks alike. Indicators the local store (indicator_store.py) already
+  covers for the range are skipped — Tier 1 reads those from the store.
+
+  SCHEDULE — with TIER1_WARMUP=1 the service starts start() in its lifespan:
+  one run right away (in the background — startup doesn't wait) and one
+  every TIER1_WARMUP_INTERVAL_HOURS, below the cache's 6 h TTL so warm
+  entries are replaced before they expire. A failed run is logged and the
+  schedule goes on.
+
+  REPORT — each run returns a WarmupReport: bulk requests made vs the
+  single-year requests the per-claim path would need for the same cells.
+  The last one is in GET /cache/stats under "tier1_warmup"; the range
+  cache's hits (lookups that never reached the API) are under "memos".
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+
+import httpx
+
+from countries import ISO3_TO_ISO2
+from metrics import METRIC_INDICATORS
+from verifier import http_client, indicator_store, tier1_numeric
+
+logger = logging.getLogger("bware.nlp")
+
+WARMUP_ENABLED = os.getenv("TIER1_WARMUP", "0") == "1"
+WARMUP_INTERVAL_HOURS = float(os.getenv("TIER1_WARMUP_INTERVAL_HOURS", "5"))
+WARMUP_YEARS = int(os.getenv("TIER1_WARMUP_YEARS", "25"))
+COUNTRIES_PER_REQUEST = int(os.getenv("TIER1_WARMUP_COUNTRIES_PER_REQUEST", "50"))
+CONCURRENCY = int(os.getenv("TIER1_WARMUP_CONCURRENCY", "4"))
+PAGE_SIZE = 5_000          # 50 countries x 25 years = 1,250 rows: one page per request
+TIMEOUT_SECONDS = 30.0
+
+
+@dataclass
+class WarmupReport:
+    indicators: int = 0
+    countries: int = 0
+    first_year: int = 0
+    last_year: int = 0
+    skipped_in_store: int = 0       # indicators the local store already covers
+    unknown_countries: int = 0      # gazetteer codes the World Bank doesn't publish
+    requests: int = 0               # bulk requests actually sent (pages and split retries included)
+    series_cached: int = 0          # (country, indicator) series now in the range cache
+    observations: int = 0           # non-null values among them
+    per_claim_requests: int = 0     # single-year requests the per-claim path needs for the same cells
+    failed: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+    finished_at: str | None = None
+
+    @property
+    def requests_saved(self) -> int:
+        return self.per_claim_requests - self.requests
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "requests_saved": self.requests_saved}
+
+
+last_report: WarmupReport | None = None
+
+
+async def _world_bank_countries(client, report) -> set[str] | None:
+    """ISO3 codes of every economy / aggregate the World Bank publishes; None if the list can't be read."""
+    try:
+        report.requests += 1
+        resp = await client.get(f"{tier1_numeric.WORLD_BANK_API_BASE}/country?format=json&per_page=1000",
+                                timeout=TIMEOUT_SECONDS)
+        resp.raise_for_status()
+        payload = resp.json()
+        return {entry["id"].upper() for entry in payload[1] if isinstance(entry, dict) and entry.get("id")}
+    except (httpx.HTTPError, ValueError, LookupError, TypeError, AttributeError) as e:
+        logger.warning("World Bank country list unavailable (%s) — warm-up batches may need splitting", e)
+        return None
+
+
+def _chunks(items: list[str], size: int) -> list[list[str]]:
+    return [items[i:i + size] for i in range(0, len(items), max(1, size))]
+
+
+async def _fetch_batch(client, semaphore, report, code, batch, first_year, last_year) -> dict[str, dict[int, float]] | None:
+    """
+    {country: {year: value}} for one batch of countries, every page of it;
+    None when the World Bank rejects the batch (an unknown country code).
+    """
+    url = (f"{tier1_numeric.WORLD_BANK_API_BASE}/country/{';'.join(batch)}/indicator/{code}"
+           f"?format=json&date={first_year}:{last_year}&per_page={PAGE_SIZE}")
+    series: dict[str, dict[int, float]] = {country: {} for country in batch}
+    page = pages = 1
+    while page <= pages:
+        async with semaphore:
+            report.requests += 1
+            resp = await client.get(f"{url}&page={page}", timeout=TIMEOUT_SECONDS)
+        resp.raise_for_status()
+        payload = resp.json()
+        # Errors come back as 200 with [{"message": [...]}]
+        if not isinstance(payload, list) or len(payload) < 2 or not isinstance(payload[0], dict):
+            return None
+        pages = int(payload[0].get("pages") or 1)
+        for point in payload[1] or ():
+            if not isinstance(point, dict) or point.get("value") is None:
+                continue
+            country = (point.get("countryiso3code") or "").upper()
+            try:
+                if country in series:
+                    series[country][int(point.get("date"))] = float(point["value"])
+            except (TypeError, ValueError):
+                continue
+        page += 1
+    return series
+
+
+async def _warm_batch(client, semaphore, report, code, batch, first_year, last_year) -> None:
+    try:
+        series = await _fetch_batch(client, semaphore, report, code, batch, first_year, last_year)
+    except (httpx.HTTPError, ValueError) as e:
+        logger.warning("Warm-up of %s for %s..%s failed: %s", code, batch[0], batch[-1], e)
+        report.failed.append(f"{code} {batch[0]}..{batch[-1]}: {e}")
+        return
+    if series is None:
+        if len(batch) > 1:
+            half = len(batch) // 2
+            await asyncio.gather(
+                _warm_batch(client, semaphore, report, code, batch[:half], first_year, last_year),
+                _warm_batch(client, semaphore, report, code, batch[half:], first_year, last_year),
+            )
+            return
+        series = {batch[0]: {}}        # the World Bank has no such country: no data, as per claim
+    for country, values in series.items():
+        tier1_numeric._range_cache.put_range(code, country, first_year, last_year, values)
+        report.series_cached += 1
+        report.observations += len(values)
+
+
+async def warm(
+    indicators: list[str] | None = None,
+    countries: list[str] | None = None,
+    *,
+    years: int = WARMUP_YEARS,
+    last_year: int | None = None,
+    client: httpx.AsyncClient | None = None,
+) -> WarmupReport:
+    """
+    Prefetch *indicators* (default: the metric registry) for *countries*
+    (default: the gazetteer) over the *years* up to *last_year* (default:
+    this year) into the Tier 1 range cache, over the shared pool
+    (http_client.py) unless a *client* is given. Never raises for API
+    failures — they are listed in the report.
+    """
+    global last_report
+    started = time.perf_counter()
+    last_year = date.today().year if last_year is None else last_year
+    first_year = last_year - years + 1
+    countries = sorted({c.upper() for c in (countries or ISO3_TO_ISO2)})
+    codes = sorted(set(indicators or METRIC_INDICATORS.values()))
+    fetched = [code for code in codes if not indicator_store.covers(code, first_year, last_year)]
+    report = WarmupReport(
+        indicators=len(fetched),
+        countries=len(countries),
+        first_year=first_year,
+        last_year=last_year,
+        skipped_in_store=len(codes) - len(fetched),
+        per_claim_requests=len(fetched) * len(countries) * years,
+    )
+
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    async with http_client.client() if client is None else nullcontext(client) as client:
+        known = await _world_bank_countries(client, report) if fetched else None
+        if known is not None:
+            unknown = [c for c in countries if c not in known]
+            countries = [c for c in countries if c in known]
+            report.unknown_countries = len(unknown)
+            for code in fetched:
+                for country in unknown:
+                    tier1_numeric._range_cache.put_range(code, country, first_year, last_year, {})
+                    report.series_cached += 1
+        await asyncio.gather(*(
+            _warm_batch(client, semaphore, report, code, batch, first_year, last_year)
+            for code in fetched
+            for batch in _chunks(countries, COUNTRIES_PER_REQUEST)
+        ))
+
+    report.seconds = round(time.perf_counter() - started, 3)
+    report.finished_at = datetime.utcnow().isoformat(timespec="seconds")
+    last_report = report
+    logger.info(
+        "Tier 1 warm-up: %d series (%d values) for %d indicators in %d requests "
+        "(per-claim path: %d, saved %d), %d failed, %.1fs",
+        report.series_cached, report.observations, report.indicators, report.requests,
+        report.per_claim_requests, report.requests_saved, len(report.failed), report.seconds,
+    )
+    return report
+
+
+async def run_forever(interval_hours: float = WARMUP_INTERVAL_HOURS) -> None:
+    """warm() now and then every *interval_hours*, until cancelled."""
+    while True:
+        try:
+            await warm()
+        except Exception:      # keep the schedule alive whatever one run hits
+            logger.exception("Tier 1 warm-up run failed")
+        await asyncio.sleep(interval_hours * 3600)
+
+
+def start() -> asyncio.Task | None:
+    """Schedule run_forever() on the running loop when TIER1_WARMUP=1 (called from the lifespan)."""
+    if not WARMUP_ENABLED:
+        return None
+    return asyncio.create_task(run_forever(), name="tier1-warmup")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prefetch World Bank indicators into the Tier 1 cache once and report")
+    parser.add_argument("indicators", nargs="*", help="indicator codes (default: every registry indicator)")
+    parser.add_argument("--countries", default="", help="comma-separated ISO3 codes (default: every gazetteer country)")
+    parser.add_argument("--years", type=int, default=WARMUP_YEARS)
+    args = parser.parse_args(argv)
+
+    countries = [c.strip() for c in args.countries.split(",") if c.strip()] or None
+    report = asyncio.run(warm(args.indicators or None, countries, years=args.years))
+    for key, value in report.as_dict().items():
+        if key != "failed":
+            print(f"  {key:<20}{value:,}" if isinstance(value, int) else f"  {key:<20}{value}")
+    for failure in report.failed:
+        print(f"  failed: {failure}")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())